@@ -1,88 +1,312 @@
-from fastapi import APIRouter, HTTPException, Query
-from app.services.worldbank import fetch_world_bank_data, fetch_all_countries_risk
+from datetime import datetime
+from typing import Any, Callable, Collection, Dict, Hashable, Iterable, Literal, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from app.services.worldbank import (
+    CACHE_VALIDITY_HOURS, COUNTRY_CODE, CountryNotFoundError, data_version, fetch_all_countries_risk,
+    get_country_risk, is_cache_valid, is_country_cached
+)
 from app.models.risk import CountryRisk, AllCountriesRisk
-from app.services.geopolitical_analyzer import analyze_south_africa_weekly
-from app.models.news import WeeklyReport
-from app.services.simple_risk_data import get_simple_risk_data
+from app.services.geopolitical_analyzer import analyze_south_africa_weekly, get_report_history
+from app.models.news import NewsArticle, WeeklyReport, WeeklyReportHistory
+from app.services.simple_risk_data import get_simple_risk_data, get_simple_risk_snapshot
 from app.models.simple_risk import SimpleRiskTable
-from app.services.weekly_risk_data import get_weekly_risk_data
-from app.models.weekly_risk import WeeklyRiskTable
+from app.services.weekly_risk_data import (
+    get_weekly_country_history, get_weekly_risk_batch, get_weekly_risk_data, stream_weekly_risk_data, weekly_data_version
+)
+from app.models.weekly_risk import (
+    WeeklyArchiveWeek, WeeklyCountryHistory, WeeklyCountryRisk, WeeklyRiskBatch, WeeklyRiskTable
+)
+from app.models.country import JoinedRiskTable
+from app.models.diff import TableDiff
+from app.services.country_index import get_country_index
+from app.services.executor import iterate_blocking, run_blocking, run_upstream
+from app.services.week_calendar import DEFAULT_WEEK_LABEL, InvalidWeekError, IsoWeek, parse_week
+from app.services.weekly_archive import get_archive
+from app.services.table_diff import SnapshotNotFoundError, get_table_diff, record_simple_snapshot, resolve_diff_weeks
+from app.services.response_cache import EncodedBody, response_cache
+from app.services.wire_formats import (
+    DEFAULT_FORMAT, MEDIA_TYPES, NDJSON_FORMAT, ROWS_FIELD, SERIALIZERS, UnsupportedFormatError, gzip_chunks,
+    ndjson_lines, ndjson_section, negotiate_format
+)
+from app.services.projection import InvalidFieldsError, include_for, parse_fields, rows_include
+from app.services.table_index import (
+    ALL_COUNTRIES_SPEC, SIMPLE_SPEC, WEEKLY_SPEC, InvalidQueryError, TableQuery, TableSpec, get_table_index
+)
 
 router = APIRouter()
 
 
-@router.get("/risk/france", response_model=CountryRisk)
-async def get_france_risk():
-    """Récupère le risque économique actuel de la France."""
+def _simple_data_version() -> str:
+    """Version du tableau simplifié : empreinte de son fichier de données."""
+    return get_simple_risk_snapshot().version
+
+
+FORMAT_DESCRIPTION = f"Format de la réponse ({', '.join(SERIALIZERS)}), sinon selon l'en-tête Accept"
+STREAM_FORMAT_DESCRIPTION = f"Format de la réponse ({', '.join([*SERIALIZERS, NDJSON_FORMAT])} : un pays par ligne, envoyé au fil de l'eau), sinon selon l'en-tête Accept"
+WEEKLY_FORMATS = (DEFAULT_FORMAT, NDJSON_FORMAT)
+MAX_PAGE_SIZE = 1000
+# Âge des données (secondes), recalculé à chaque réponse : hors du corps mis en cache et de son ETag
+DATA_AGE_HEADER = "X-Data-Age"
+MAX_BATCH_COUNTRIES = 100
+MAX_HISTORY_WEEKS = 520
+WEEK_DESCRIPTION = "Semaine : clé ISO ('2025-W02'), date ('2025-01-06') ou label ('Semaine du 6 Janvier 2025', sans année : dernière occurrence)"
+
+
+async def _cached_body(key: Hashable, version: Hashable, build: Callable[[], Any], fmt: str = DEFAULT_FORMAT) -> EncodedBody:
+    """Octets encodés en cache pour (endpoint, paramètres, format) ; `build` n'est appelé que si la version a changé."""
+    key = (key, fmt)
+    body = response_cache.get(key, version)
+    if body is None:
+        body = await run_blocking(response_cache.get_or_build, key, version, build, SERIALIZERS[fmt], MEDIA_TYPES[fmt])
+    return body
+
+
+def _response_format(request: Request, format: Optional[str], single_table: bool = True,
+                     formats: Optional[Collection[str]] = None) -> str:
+    """Format négocié (?format= ou Accept) parmi `formats` ; 406 si inconnu, indisponible, ou arrow pour plusieurs tableaux."""
     try:
-        return fetch_world_bank_data()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        fmt = negotiate_format(format, request.headers.get("accept"), formats)
+    except UnsupportedFormatError as e:
+        raise HTTPException(status_code=406, detail=str(e))
+    if fmt == "arrow" and not single_table:
+        raise HTTPException(status_code=406, detail="Le format arrow n'est disponible que pour un tableau de pays unique")
+    return fmt
 
 
-@router.get("/risk/france/history")
-async def get_france_history():
-    """Retourne l'historique des indicateurs économiques de la France."""
+def _fields_include(fields: Optional[str], build_include: Callable[[tuple], dict]) -> tuple[Optional[tuple], Optional[dict]]:
+    """Chemins normalisés de ?fields= (pour la clé de cache) et spécification `include` ; 400 si un champ est inconnu."""
+    paths = parse_fields(fields)
+    if paths is None:
+        return None, None
     try:
-        risk_data = fetch_world_bank_data()
-        history = {}
-        for indicator in risk_data.indicators:
-            history[indicator.code] = {
-                'name': indicator.name,
-                'unit': indicator.unit,
-                'data': [
-                    {'year': item.year, 'value': item.value}
-                    for item in indicator.history
-                ]
-            }
-        return {
-            'country': risk_data.country_name,
-            'indicators': history
+        return paths, build_include(paths)
+    except InvalidFieldsError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def _table_query(
+    sort: Optional[str] = Query(None, description="Champ de tri, préfixé par '-' pour l'ordre décroissant (ex: '-overall_score')"),
+    risk_level: Optional[str] = Query(None, description="Niveaux de risque à garder, séparés par des virgules (ex: 'high,critical')"),
+    score_field: Optional[str] = Query(None, description="Score filtré par min_score/max_score (par défaut le score global)"),
+    min_score: Optional[float] = Query(None, description="Score minimal (inclus)"),
+    max_score: Optional[float] = Query(None, description="Score maximal (inclus)"),
+    offset: int = Query(0, ge=0, description="Nombre de pays à sauter (voir next_offset dans la réponse)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Nombre maximal de pays renvoyés")
+) -> TableQuery:
+    """Paramètres communs de pagination, tri et filtres des tableaux de pays (async : pas de passage par le threadpool)."""
+    return TableQuery.parse(sort, risk_level, score_field, min_score, max_score, offset, limit)
+
+
+def _validated_query(query: TableQuery, spec: TableSpec) -> Optional[TableQuery]:
+    """Requête vérifiée pour ce tableau (None si aucun paramètre : tableau complet) ; 400 si un tri ou filtre est inconnu."""
+    if query.is_empty:
+        return None
+    try:
+        return query.validate(spec)
+    except InvalidQueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _parsed_week(value: str) -> IsoWeek:
+    """Semaine ISO désignée par `value` ; 400 si elle n'est pas reconnue."""
+    try:
+        return parse_week(value)
+    except InvalidWeekError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def _week(week_label: str = Query(DEFAULT_WEEK_LABEL, description=WEEK_DESCRIPTION)) -> IsoWeek:
+    """Semaine demandée par ?week_label= (async : pas de passage par le threadpool)."""
+    return _parsed_week(week_label)
+
+
+def _accepted_encodings(request: Request) -> set[str]:
+    accepted = set()
+    for item in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding and params.replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.add(coding.lower())
+    return accepted
+
+
+def _cache_control(last_updated: Optional[datetime]) -> str:
+    """Cache navigateur/CDN aligné sur la validité du cache World Bank (temps restant si la date des données est connue)."""
+    max_age = CACHE_VALIDITY_HOURS * 3600
+    if last_updated is not None:
+        max_age = max(0, int(max_age - (datetime.now() - last_updated).total_seconds()))
+    return f"public, max-age={max_age}"
+
+
+def _freshness_headers(last_updated: Optional[datetime], cache_control: Optional[str] = None) -> Dict[str, str]:
+    """En-têtes Cache-Control et X-Data-Age (si la date des données est connue) d'une réponse."""
+    headers = {"Cache-Control": cache_control or _cache_control(last_updated)}
+    if last_updated is not None:
+        headers[DATA_AGE_HEADER] = str(max(0, int((datetime.now() - last_updated).total_seconds())))
+    return headers
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparaison faible (RFC 9110) : les proxies qui recompressent peuvent renvoyer l'ETag préfixé par W/."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _encoded_response(request: Request, body: EncodedBody, last_updated: Optional[datetime] = None,
+                      cache_control: Optional[str] = None) -> Response:
+    """
+    Sert la variante brotli, gzip ou non compressée selon Accept-Encoding (sans passer par GZipMiddleware),
+    avec un ETag par variante ; répond 304 si le client a déjà cette version (If-None-Match).
+    """
+    accepted = _accepted_encodings(request)
+    headers = {"Vary": "Accept, Accept-Encoding", **_freshness_headers(last_updated, cache_control)}
+    if body.br is not None and "br" in accepted:
+        content, headers["Content-Encoding"] = body.br, "br"
+    elif "gzip" in accepted:
+        content, headers["Content-Encoding"] = body.gzip, "gzip"
+    else:
+        content = body.identity
+    encoding = headers.get("Content-Encoding")
+    headers["ETag"] = f'"{body.etag}-{encoding}"' if encoding else f'"{body.etag}"'
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type=body.media_type, headers=headers)
+
+
+def _ndjson_response(request: Request, sections: Iterable[Tuple[Dict[str, Any], Iterable[Any]]],
+                     include: Optional[dict] = None, last_updated: Optional[datetime] = None,
+                     cache_control: Optional[str] = None) -> StreamingResponse:
+    """
+    Flux NDJSON (voir wire_formats.ndjson_lines), produit et compressé en gzip dans l'exécuteur au fil
+    de l'envoi (sans passer par GZipMiddleware) : ni cache de réponses ni ETag, le corps n'existe jamais en entier.
+    """
+    chunks = ndjson_lines(sections, include)
+    headers = {"Vary": "Accept, Accept-Encoding", **_freshness_headers(last_updated, cache_control)}
+    if "gzip" in _accepted_encodings(request):
+        chunks, headers["Content-Encoding"] = gzip_chunks(chunks), "gzip"
+    return StreamingResponse(iterate_blocking(chunks), media_type=MEDIA_TYPES[NDJSON_FORMAT], headers=headers)
+
+
+def _country_history(risk_data: CountryRisk) -> dict:
+    """Historique des indicateurs d'un pays, à partir de son CountryRisk."""
+    history = {}
+    for indicator in risk_data.indicators:
+        history[indicator.code] = {
+            'name': indicator.name,
+            'unit': indicator.unit,
+            'data': [
+                {'year': item.year, 'value': item.value}
+                for item in indicator.history
+            ]
         }
+    return {
+        'country': risk_data.country_name,
+        'country_code': risk_data.country_code,
+        'indicators': history
+    }
+
+
+async def _fetch_all_countries(target_year: int, force_refresh: bool = False) -> AllCountriesRisk:
+    """Tableau de tous les pays ; hors cache valide, le calcul peut appeler World Bank et passe par le pool réseau."""
+    run = run_blocking if not force_refresh and is_cache_valid(target_year) else run_upstream
+    return await run(fetch_all_countries_risk, target_year=target_year, force_refresh=force_refresh)
+
+
+async def _get_country_risk(country_code: str) -> CountryRisk:
+    """Risque d'un pays depuis le cache par pays ; l'appel World Bank ne se fait qu'en cas d'absence."""
+    run = run_blocking if is_country_cached(country_code) else run_upstream
+    try:
+        return await run(get_country_risk, country_code)
+    except CountryNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _country_response(request: Request, country_code: str, history: bool = False) -> Response:
+    """Réponse encodée (risque ou historique) d'un pays, versionnée par la date de calcul de son CountryRisk."""
+    risk_data = await _get_country_risk(country_code)
+    key = ("country-history" if history else "country", risk_data.country_code)
+    build = (lambda: _country_history(risk_data)) if history else (lambda: risk_data)
+    body = await _cached_body(key, risk_data.last_updated, build)
+    return _encoded_response(request, body, risk_data.last_updated)
+
+
+@router.get("/risk/france", response_model=CountryRisk)
+async def get_france_risk(request: Request):
+    """Récupère le risque économique actuel de la France."""
+    return await _country_response(request, COUNTRY_CODE)
+
+
+@router.get("/risk/france/history")
+async def get_france_history(request: Request):
+    """Retourne l'historique des indicateurs économiques de la France."""
+    return await _country_response(request, COUNTRY_CODE, history=True)
+
+
 @router.get("/geopolitical/south-africa/weekly", response_model=WeeklyReport)
 async def get_south_africa_weekly(force_refresh: bool = Query(False)):
     """Analyse géopolitique hebdomadaire de l'Afrique du Sud."""
     try:
-        return analyze_south_africa_weekly(force_refresh=force_refresh)
+        return await run_upstream(analyze_south_africa_weekly, force_refresh=force_refresh)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/geopolitical/south-africa/history", response_model=WeeklyReportHistory)
+async def get_south_africa_history(
+    weeks: int = Query(12, ge=1, le=MAX_HISTORY_WEEKS, description="Nombre de semaines, jusqu'à `until` incluse"),
+    until: Optional[str] = Query(None, description="Dernière semaine (semaine en cours par défaut), même format que week_label")
+):
+    """Rapports hebdomadaires archivés de l'Afrique du Sud (aucune nouvelle analyse n'est lancée)."""
+    if until:
+        _parsed_week(until)
+    try:
+        return await run_blocking(get_report_history, "ZA", weeks=weeks, until=until)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Champs des articles renvoyés par défaut (tous les champs de NewsArticle peuvent être demandés via ?fields=)
+ARTICLE_FIELDS = ("description", "published_at", "source", "title", "url")
+
+
 @router.get("/geopolitical/south-africa/articles")
-async def get_south_africa_articles():
+async def get_south_africa_articles(
+    request: Request,
+    fields: Optional[str] = Query(None, description="Champs des articles à renvoyer, séparés par des virgules (ex: 'title,url')")
+):
     """Liste des articles sources de la semaine."""
+    paths, include = _fields_include(fields or ",".join(ARTICLE_FIELDS), lambda paths: include_for(NewsArticle, paths))
     try:
-        report = analyze_south_africa_weekly(force_refresh=False)
-        return {
+        report = await run_upstream(analyze_south_africa_weekly, force_refresh=False)
+        # L'analyse est régénérée à chaque appel : la version dépend des articles, pas de la date de génération
+        version = (report.week_number, tuple((a.title, a.url, a.published_at) for a in report.articles))
+        body = await _cached_body(("articles", report.week_number, paths), version, lambda: {
             "country_code": report.country_code,
             "country_name": report.country_name,
             "week_number": report.week_number,
             "week_start": report.week_start,
             "week_end": report.week_end,
             "article_count": report.article_count,
-            "articles": [
-                {
-                    "title": article.title,
-                    "source": article.source,
-                    "published_at": article.published_at,
-                    "url": article.url,
-                    "description": article.description
-                }
-                for article in report.articles
-            ]
-        }
+            "articles": [article.model_dump(include=include) for article in report.articles]
+        })
+        return _encoded_response(request, body, cache_control="no-cache")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/risk/all-countries", response_model=AllCountriesRisk)
 async def get_all_countries_risk(
+    request: Request,
     target_year: int = Query(2025, description="Année cible pour les données"),
-    force_refresh: bool = Query(False, description="Forcer le rafraîchissement du cache")
+    force_refresh: bool = Query(False, description="Forcer le rafraîchissement du cache"),
+    format: Optional[str] = Query(None, description=FORMAT_DESCRIPTION),
+    query: TableQuery = Depends(_table_query)
 ):
     """Récupère les scores de risque pour tous les pays du monde basés sur les données World Bank.
     Les données sont mises en cache pendant 24h pour améliorer les performances."""
@@ -109,6 +333,9 @@ async def get_all_countries_risk(
         except:
             pass
     
+    fmt = _response_format(request, format)
+    query = _validated_query(query, ALL_COUNTRIES_SPEC)
+    
     # #region agent log
     _log_debug('debug-session', 'run1', 'A', 'routes.py:82', 'API endpoint called', {'target_year': target_year, 'force_refresh': force_refresh})
     # #endregion
@@ -122,12 +349,20 @@ async def get_all_countries_risk(
             logger.info("📊 [ALL-COUNTRIES] Appel à fetch_all_countries_risk() avec rafraîchissement forcé - Cela peut prendre plusieurs minutes...")
         else:
             logger.info("📊 [ALL-COUNTRIES] Appel à fetch_all_countries_risk() - Vérification du cache d'abord...")
-        result = fetch_all_countries_risk(target_year=target_year, force_refresh=force_refresh)
+        result = await _fetch_all_countries(target_year, force_refresh)
         # #region agent log
         _log_debug('debug-session', 'run1', 'A', 'routes.py:88', 'After fetch_all_countries_risk call', {'result_count': len(result.countries) if result else 0})
         # #endregion
         logger.info(f"✅ [ALL-COUNTRIES] Traitement terminé - {len(result.countries) if result else 0} pays retournés")
-        return result
+        version = data_version(result, target_year)
+        
+        def build():
+            if query is None:
+                return result
+            return get_table_index(("all-countries", target_year), version, lambda: result, ALL_COUNTRIES_SPEC).page(query)
+        
+        body = await _cached_body(("all-countries", target_year, query), version, build, fmt)
+        return _encoded_response(request, body, result.last_updated, cache_control="no-cache" if force_refresh else None)
     except Exception as e:
         # #region agent log
         _log_debug('debug-session', 'run1', 'A', 'routes.py:91', 'API endpoint error', {'error': str(e)})
@@ -137,46 +372,291 @@ async def get_all_countries_risk(
 
 
 @router.get("/risk/simple/all-countries", response_model=SimpleRiskTable)
-async def get_simple_all_countries_risk():
+async def get_simple_all_countries_risk(
+    request: Request,
+    format: Optional[str] = Query(None, description=FORMAT_DESCRIPTION),
+    query: TableQuery = Depends(_table_query)
+):
     """Récupère les scores de risque simplifiés pour 200 pays basés sur la situation en 2025.
     Approche simplifiée sans APIs externes - données statiques basées sur l'analyse géopolitique actuelle."""
+    fmt = _response_format(request, format)
+    query = _validated_query(query, SIMPLE_SPEC)
+    
+    def build():
+        if query is None:
+            return get_simple_risk_data()
+        return get_table_index(("simple",), _simple_data_version(), get_simple_risk_data, SIMPLE_SPEC).page(query)
+    
     try:
-        return get_simple_risk_data()
+        body = await _cached_body(("simple", query), _simple_data_version(), build, fmt)
+        return _encoded_response(request, body)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/table")
 async def get_table_data(
+    request: Request,
     target_year: int = Query(2025, description="Année cible pour les données World Bank"),
-    force_refresh: bool = Query(False, description="Forcer le rafraîchissement du cache World Bank")
+    force_refresh: bool = Query(False, description="Forcer le rafraîchissement du cache World Bank"),
+    format: Optional[str] = Query(None, description=STREAM_FORMAT_DESCRIPTION)
 ):
-    """Retourne les données pour les deux tableaux : BASIC (simplifié) et WORLD BANK (APIs)."""
+    """
+    Retourne les données pour les deux tableaux : BASIC (simplifié) et WORLD BANK (APIs).
+    En ndjson : en-tête puis pays de BASIC, puis de WORLD BANK (absent si World Bank est indisponible).
+    """
+    fmt = _response_format(request, format, single_table=False, formats=(*SERIALIZERS, NDJSON_FORMAT))
     try:
-        # Récupérer les données BASIC (simplifiées)
-        basic_data = get_simple_risk_data()
-        
         # Récupérer les données WORLD BANK
         try:
-            worldbank_data = fetch_all_countries_risk(target_year=target_year, force_refresh=force_refresh)
+            worldbank_data = await _fetch_all_countries(target_year, force_refresh)
         except Exception as wb_error:
             # Si World Bank échoue, retourner quand même les données BASIC
             worldbank_data = None
         
-        return {
-            "basic": basic_data,
+        cache_control = "no-cache" if force_refresh or worldbank_data is None else None
+        if fmt == NDJSON_FORMAT:
+            sections = [ndjson_section("basic", get_simple_risk_data())]
+            if worldbank_data is not None:
+                sections.append(ndjson_section("worldbank", worldbank_data))
+            return _ndjson_response(request, sections, last_updated=worldbank_data.last_updated if worldbank_data else None,
+                                    cache_control=cache_control)
+        
+        # Réponse réencodée seulement si la version World Bank (ou celle de l'instantané simplifié) a changé
+        version = (_simple_data_version(), data_version(worldbank_data, target_year) if worldbank_data else None)
+        body = await _cached_body(("table", target_year), version, lambda: {
+            "basic": get_simple_risk_data(),
             "worldbank": worldbank_data
-        }
+        }, fmt)
+        return _encoded_response(
+            request, body, worldbank_data.last_updated if worldbank_data else None, cache_control=cache_control
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/table/joined", response_model=JoinedRiskTable)
+async def get_joined_table_data(
+    request: Request,
+    target_year: int = Query(2025, description="Année cible pour les données World Bank"),
+    week: IsoWeek = Depends(_week),
+    format: Optional[str] = Query(None, description=FORMAT_DESCRIPTION)
+):
+    """Une ligne par pays (code ISO3, nom français) joignant les tableaux BASIC, World Bank et hebdomadaire."""
+    fmt = _response_format(request, format, single_table=False)
+    try:
+        try:
+            worldbank_data = await _fetch_all_countries(target_year)
+        except Exception:
+            # Sans World Bank, la jointure reste utile pour BASIC et hebdomadaire
+            worldbank_data = None
+        
+        index = get_country_index()
+        version = (index.version, _simple_data_version(), weekly_data_version(),
+                   data_version(worldbank_data, target_year) if worldbank_data else None)
+        
+        def build():
+            basic = get_simple_risk_data()
+            rows, unmatched = index.join(
+                basic.countries,
+                worldbank_data.countries if worldbank_data else [],
+                get_weekly_risk_data(week_label=week.key).countries
+            )
+            return JoinedRiskTable(
+                countries=rows,
+                total_countries=len(rows),
+                week_label=week.label,
+                last_updated=basic.last_updated,
+                worldbank_last_updated=worldbank_data.last_updated if worldbank_data else None,
+                unmatched=unmatched
+            )
+        
+        body = await _cached_body(("table/joined", target_year, week.key), version, build, fmt)
+        return _encoded_response(
+            request, body, worldbank_data.last_updated if worldbank_data else None,
+            cache_control="no-cache" if worldbank_data is None else None
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/table/weekly", response_model=WeeklyRiskTable)
 async def get_weekly_table_data(
-    week_label: str = Query("Semaine du 5 Janvier", description="Label de la semaine (ex: 'Semaine du 5 Janvier')")
+    request: Request,
+    week: IsoWeek = Depends(_week),
+    fields: Optional[str] = Query(None, description="Champs de chaque pays à renvoyer, séparés par des virgules (ex: 'country_name,overall_risk_level,risks.risk_type,risks.title,risks.risk_level')"),
+    query: TableQuery = Depends(_table_query),
+    format: Optional[str] = Query(None, description=f"Format de la réponse ({', '.join(WEEKLY_FORMATS)} : un pays par ligne, envoyé au fil de l'eau), sinon selon l'en-tête Accept")
 ):
-    """Retourne les données hebdomadaires avec dépêches flash news pour chaque type de risque."""
+    """
+    Retourne les données hebdomadaires avec dépêches flash news pour chaque type de risque.
+    En ndjson : une ligne d'en-tête, puis un pays par ligne, lu dans l'archive ou construit au fil de l'envoi.
+    """
+    fmt = _response_format(request, format, formats=WEEKLY_FORMATS)
+    paths, include = _fields_include(fields, lambda paths: rows_include(WeeklyRiskTable, ROWS_FIELD, paths))
+    query = _validated_query(query, WEEKLY_SPEC)
+    if fmt == NDJSON_FORMAT:
+        return await _weekly_ndjson(request, week, include[ROWS_FIELD]["__all__"] if include else None, query)
+    
+    def build():
+        if query is None:
+            table = get_weekly_risk_data(week_label=week.key)
+        else:
+            table = get_table_index(("table/weekly", week.key), weekly_data_version(),
+                                    lambda: get_weekly_risk_data(week_label=week.key), WEEKLY_SPEC).page(query)
+        return table.model_dump(include=include) if include else table
+    
     try:
-        return get_weekly_risk_data(week_label=week_label)
+        body = await _cached_body(("table/weekly", week.key, paths, query), weekly_data_version(), build)
+        return _encoded_response(request, body)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _weekly_ndjson(request: Request, week: IsoWeek, include: Optional[dict], query: Optional[TableQuery]) -> StreamingResponse:
+    """Tableau hebdomadaire en NDJSON : en flux sans requête, sinon la page demandée (triée et filtrée en mémoire)."""
+    try:
+        if query is None:
+            header, rows = await run_blocking(stream_weekly_risk_data, week.key)
+            section = ({"table": "weekly", **header}, rows)
+        else:
+            page = await run_blocking(lambda: get_table_index(
+                ("table/weekly", week.key), weekly_data_version(), lambda: get_weekly_risk_data(week_label=week.key), WEEKLY_SPEC
+            ).page(query))
+            section = ndjson_section("weekly", page)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return _ndjson_response(request, [section], include)
+
+
+def _weekly_countries_version() -> tuple:
+    """Version des pays hebdomadaires générés à la demande : données hebdomadaires et index d'identité des pays."""
+    return (weekly_data_version(), get_country_index().version)
+
+
+@router.get("/table/weekly/archive", response_model=list[WeeklyArchiveWeek])
+async def get_weekly_archive(
+    first_week: Optional[str] = Query(None, description="Première semaine (incluse), même format que week_label"),
+    last_week: Optional[str] = Query(None, description="Dernière semaine (incluse), même format que week_label")
+):
+    """Semaines archivées du tableau hebdomadaire (instantané courant de chaque semaine)."""
+    first = _parsed_week(first_week) if first_week else None
+    last = _parsed_week(last_week) if last_week else None
+    try:
+        return await run_blocking(get_archive().weeks, first, last)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/table/weekly/batch", response_model=WeeklyRiskBatch)
+async def get_weekly_batch_data(
+    request: Request,
+    countries: str = Query(..., description="Pays séparés par des virgules : noms, alias ou codes ISO2/ISO3 (ex: 'France,USA,Yémen')"),
+    week: IsoWeek = Depends(_week),
+    fields: Optional[str] = Query(None, description="Champs de chaque pays à renvoyer, séparés par des virgules (ex: 'country_name,overall_risk_level')")
+):
+    """Données hebdomadaires d'une liste de pays (watch-list), sans générer le tableau complet."""
+    names = tuple(dict.fromkeys(name.strip() for name in countries.split(",") if name.strip()))
+    if not names or len(names) > MAX_BATCH_COUNTRIES:
+        raise HTTPException(status_code=400, detail=f"Entre 1 et {MAX_BATCH_COUNTRIES} pays attendus")
+    paths, include = _fields_include(fields, lambda paths: rows_include(WeeklyRiskBatch, "countries", paths))
+    
+    def build():
+        batch = get_weekly_risk_batch(names, week_label=week.key)
+        return batch.model_dump(include=include) if include else batch
+    
+    try:
+        body = await _cached_body(("table/weekly/batch", week.key, names, paths), _weekly_countries_version(), build)
+        return _encoded_response(request, body)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/table/weekly/{country}", response_model=WeeklyCountryRisk)
+async def get_weekly_country_data(
+    request: Request,
+    country: str = Path(..., description="Nom français, alias ou code ISO2/ISO3 du pays (ex: 'France', 'FRA')"),
+    week: IsoWeek = Depends(_week)
+):
+    """Données hebdomadaires (dépêches flash news) d'un seul pays, générées à la demande."""
+    def build():
+        batch = get_weekly_risk_batch([country], week_label=week.key)
+        if not batch.countries:
+            raise CountryNotFoundError(f"Pays introuvable: {country}")
+        return batch.countries[0]
+    
+    try:
+        body = await _cached_body(("table/weekly/country", week.key, country), _weekly_countries_version(), build)
+        return _encoded_response(request, body)
+    except CountryNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/table/weekly/{country}/history", response_model=WeeklyCountryHistory)
+async def get_weekly_country_history_data(
+    country: str = Path(..., description="Nom français, alias ou code ISO2/ISO3 du pays (ex: 'Brésil', 'BRA')"),
+    weeks: int = Query(12, ge=1, le=MAX_HISTORY_WEEKS, description="Nombre de semaines, jusqu'à `until` incluse"),
+    until: Optional[str] = Query(None, description="Dernière semaine (semaine en cours par défaut), même format que week_label")
+):
+    """Données hebdomadaires archivées d'un pays sur plusieurs semaines (lues dans l'archive, jamais régénérées)."""
+    if until:
+        _parsed_week(until)
+    try:
+        return await run_blocking(get_weekly_country_history, country, weeks=weeks, until=until)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/table/diff/{table}", response_model=TableDiff)
+async def get_table_diff_data(
+    request: Request,
+    table: Literal["simple", "weekly", "worldbank"] = Path(..., description="Tableau comparé"),
+    from_week: Optional[str] = Query(None, description="Semaine de départ (par défaut la semaine archivée précédant to_week), même format que week_label"),
+    to_week: Optional[str] = Query(None, description="Semaine d'arrivée (par défaut la semaine en cours, ou la dernière archivée), même format que week_label")
+):
+    """Changements d'un tableau entre deux semaines archivées : transitions de niveau, variations de score, dépêches modifiées."""
+    first = _parsed_week(from_week) if from_week else None
+    last = _parsed_week(to_week) if to_week else None
+    
+    def resolve():
+        # Instantanés de la semaine en cours (le World Bank est archivé à chaque recalcul des scores)
+        if table == "simple":
+            record_simple_snapshot()
+        elif table == "weekly":
+            get_weekly_risk_data(week_label=IsoWeek.current().key)
+        return resolve_diff_weeks(table, first, last)
+    
+    try:
+        first, from_version, last, to_version = await run_blocking(resolve)
+        body = await _cached_body(("table/diff", table, first.key, last.key), (from_version, to_version),
+                                  lambda: get_table_diff(table, first, last))
+        # Semaines par défaut ou semaine en cours : le client revalide (304 tant que rien n'a changé)
+        return _encoded_response(request, body, cache_control=None if to_week and last.is_complete() else "no-cache")
+    except SnapshotNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Routes génériques par pays : déclarées en dernier pour ne pas masquer /risk/all-countries
+COUNTRY_CODE_PATTERN = "^[A-Za-z]{3}$"
+
+
+@router.get("/risk/{country_code}", response_model=CountryRisk)
+async def get_country_risk_route(
+    request: Request,
+    country_code: str = Path(..., pattern=COUNTRY_CODE_PATTERN, description="Code ISO3 du pays (ex: 'FRA', 'USA')")
+):
+    """Récupère le risque économique actuel d'un pays (indicateurs World Bank)."""
+    return await _country_response(request, country_code)
+
+
+@router.get("/risk/{country_code}/history")
+async def get_country_history(
+    request: Request,
+    country_code: str = Path(..., pattern=COUNTRY_CODE_PATTERN, description="Code ISO3 du pays (ex: 'FRA', 'USA')")
+):
+    """Retourne l'historique des indicateurs économiques d'un pays."""
+    return await _country_response(request, country_code, history=True)
@@ -4,6 +4,8 @@ from fastapi.middleware.gzip import GZipMiddleware
 from dotenv import load_dotenv
 from pathlib import Path
 from app.api.routes import router
+from app.services.executor import shutdown_executor
+from app.services.static_data import dataset_stats
 import uvicorn
 import logging
 import sys
@@ -126,6 +128,11 @@ async def log_requests(request: Request, call_next):
 app.include_router(router, prefix="/api", tags=["risk"])
 
 
+@app.on_event("shutdown")
+def stop_blocking_executor():
+    shutdown_executor()
+
+
 @app.get("/")
 async def root():
     return {
@@ -134,6 +141,8 @@ async def root():
         "endpoints": {
             "france_risk": "/api/risk/france",
             "france_history": "/api/risk/france/history",
+            "country_risk": "/api/risk/{country_code}",
+            "country_history": "/api/risk/{country_code}/history",
             "south_africa_weekly": "/api/geopolitical/south-africa/weekly"
         }
     }
@@ -141,4 +150,4 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy"}
+    return {"status": "healthy", "datasets": dataset_stats()}
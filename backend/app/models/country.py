@@ -0,0 +1,36 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+from app.models.risk import CountryRiskSummary
+from app.models.simple_risk import SimpleCountryRisk
+
+
+class CountryIdentity(BaseModel):
+    """Identité d'un pays : codes ISO, noms français et anglais, variantes de nom"""
+    iso3: str  # Clé commune des tableaux (codes World Bank)
+    iso2: str
+    name_fr: str  # Nom utilisé par les tableaux BASIC et hebdomadaire
+    name_en: str
+    aliases: List[str] = []  # Autres noms (officiels, anglais de la carte, variantes françaises)
+
+
+class JoinedCountryRisk(BaseModel):
+    """Ligne jointe d'un pays : scores BASIC, score World Bank et niveau hebdomadaire"""
+    country_code: str  # ISO3
+    iso2: str
+    country_name: str  # Nom français
+    name_en: str
+    basic: Optional[SimpleCountryRisk] = None
+    worldbank: Optional[CountryRiskSummary] = None
+    weekly_risk_level: Optional[str] = None  # Niveau global de la semaine ("bas", "moyen", "élevé")
+
+
+class JoinedRiskTable(BaseModel):
+    """Tableau des pays joignant BASIC, World Bank et hebdomadaire par code ISO3"""
+    countries: List[JoinedCountryRisk]
+    total_countries: int
+    week_label: str
+    last_updated: datetime  # Date des données BASIC
+    worldbank_last_updated: Optional[datetime] = None
+    unmatched: List[str] = []  # Noms ou codes sans identité connue (exclus de la jointure)
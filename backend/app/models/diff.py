@@ -0,0 +1,46 @@
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, List, Literal, Optional
+from datetime import datetime
+
+
+class LevelTransition(BaseModel):
+    """Changement de niveau de risque entre deux semaines"""
+    model_config = ConfigDict(frozen=True)
+    before: Optional[str]  # None si le pays est absent de la première semaine
+    after: Optional[str]  # None si le pays est absent de la seconde semaine
+
+
+class FlashNewsChange(BaseModel):
+    """Dépêche modifiée pour un type de risque (tableau hebdomadaire)"""
+    model_config = ConfigDict(frozen=True)
+    risk_type: str
+    risk_level: Optional[LevelTransition] = None  # Renseigné si le niveau a changé
+    title: Optional[str] = None  # Nouveau titre, s'il a changé
+    flash_news: Optional[str] = None  # Nouvelle dépêche, si elle a changé
+
+
+class CountryDiff(BaseModel):
+    """Changements d'un pays entre deux instantanés"""
+    model_config = ConfigDict(frozen=True)
+    country_key: str  # Code ISO3 si le pays est connu, sinon nom normalisé
+    country_name: str
+    change: Literal["added", "removed", "changed"]
+    risk_level: Optional[LevelTransition] = None  # Renseigné si le niveau global a changé
+    score_deltas: Dict[str, int] = {}  # Champ de score -> (après - avant), seulement les scores modifiés
+    flash_news: List[FlashNewsChange] = []
+
+
+class TableDiff(BaseModel):
+    """Différence entre les instantanés de deux semaines d'un tableau (simplifié, hebdomadaire ou World Bank)"""
+    model_config = ConfigDict(frozen=True)
+    table: Literal["simple", "weekly", "worldbank"]
+    from_week: str  # Semaine ISO de l'instantané de départ (ex: "2025-W01")
+    to_week: str
+    from_version: str  # Versions des instantanés comparés
+    to_version: str
+    total_countries_before: int
+    total_countries_after: int
+    total_changes: int
+    level_transitions: Dict[str, int] = {}  # "avant -> après" -> nombre de pays
+    countries: List[CountryDiff]  # Pays modifiés, ajoutés ou retirés, triés par nom
+    computed_at: datetime
@@ -68,3 +68,12 @@ class WeeklyReport(BaseModel):
     analysis: GeopoliticalAnalysis
     generated_at: datetime
     article_count: int
+
+
+class WeeklyReportHistory(BaseModel):
+    """Rapports hebdomadaires archivés d'un pays sur un intervalle de semaines"""
+    country_code: str
+    first_week: str
+    last_week: str
+    reports: List[WeeklyReport]  # Dernier rapport de chaque semaine archivée, dans l'ordre chronologique
+    missing_weeks: List[str] = []  # Semaines de l'intervalle sans rapport archivé
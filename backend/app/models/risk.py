@@ -56,3 +56,5 @@ class AllCountriesRisk(BaseModel):
     countries: List[CountryRiskSummary]
     total_countries: int
     last_updated: datetime
+    refreshing: bool = False  # Rafraîchissement en arrière-plan en cours
+    next_offset: Optional[int] = None  # Offset de la page suivante si la réponse est paginée
@@ -1,10 +1,11 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
 from datetime import datetime
 
 
 class SimpleCountryRisk(BaseModel):
     """Score de risque simplifié pour un pays"""
+    model_config = ConfigDict(frozen=True)  # Partagé par tous les appelants (voir SimpleRiskSnapshot)
     country_name: str
     political_risk: int  # 0-100
     economic_risk: int  # 0-100
@@ -16,7 +17,9 @@ class SimpleCountryRisk(BaseModel):
 
 class SimpleRiskTable(BaseModel):
     """Tableau de risques simplifiés pour 200 pays"""
+    model_config = ConfigDict(frozen=True)
     countries: List[SimpleCountryRisk]
     total_countries: int
     last_updated: datetime
     year: int  # 2025
+    next_offset: Optional[int] = None  # Offset de la page suivante si la réponse est paginée
@@ -1,18 +1,28 @@
-from pydantic import BaseModel
-from typing import List, Literal
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional, Literal
 from datetime import datetime
 
 
 class RiskFlashNews(BaseModel):
     """Dépêche flash news pour un type de risque spécifique"""
+    model_config = ConfigDict(frozen=True)
     risk_type: Literal["political", "economic", "security", "social"]
     title: str  # Titre accrocheur de la dépêche (en bold)
     flash_news: str  # Dépêche flash news avec événements clés
     risk_level: Literal["bas", "moyen", "élevé"]  # Niveau de risque
 
 
+class WeeklyCountryNews(BaseModel):
+    """Dépêches d'un pays telles que stockées dans app/data/weekly_risk.json (sans les dates de la semaine)"""
+    model_config = ConfigDict(frozen=True)
+    country_name: str
+    risks: List[RiskFlashNews]
+    overall_risk_level: Literal["bas", "moyen", "élevé"]
+
+
 class WeeklyCountryRisk(BaseModel):
     """Données hebdomadaires de risque pour un pays avec dépêches flash news"""
+    model_config = ConfigDict(frozen=True)
     country_name: str
     week_label: str  # Ex: "Semaine du 5 Janvier"
     week_start: datetime
@@ -23,8 +33,37 @@ class WeeklyCountryRisk(BaseModel):
 
 class WeeklyRiskTable(BaseModel):
     """Tableau de risques hebdomadaires"""
+    model_config = ConfigDict(frozen=True)  # Partagé par tous les appelants (tableaux matérialisés par semaine)
     countries: List[WeeklyCountryRisk]
     total_countries: int
     week_label: str
     week_start: datetime
     week_end: datetime
+    week_number: Optional[str] = None  # Semaine ISO (ex: "2025-W02")
+    next_offset: Optional[int] = None  # Offset de la page suivante si la réponse est paginée
+
+
+class WeeklyRiskBatch(WeeklyRiskTable):
+    """Pays demandés du tableau hebdomadaire, générés sans construire le tableau complet"""
+    not_found: List[str] = []  # Pays demandés sans données (nom ou code inconnu)
+
+
+class WeeklyArchiveWeek(BaseModel):
+    """Semaine archivée : instantané courant du tableau hebdomadaire"""
+    week_number: str  # Semaine ISO (ex: "2025-W02")
+    week_label: str
+    week_start: datetime
+    week_end: datetime
+    total_countries: int
+    data_version: str  # Version des données de l'instantané
+    archived_at: datetime
+
+
+class WeeklyCountryHistory(BaseModel):
+    """Lignes archivées d'un pays sur un intervalle de semaines"""
+    country_name: str
+    country_code: Optional[str] = None  # Code ISO3 si le pays est connu de l'index d'identité
+    first_week: str
+    last_week: str
+    weeks: List[WeeklyCountryRisk]  # Une ligne par semaine archivée, dans l'ordre chronologique
+    missing_weeks: List[str] = []  # Semaines de l'intervalle absentes de l'archive
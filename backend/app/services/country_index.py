@@ -0,0 +1,109 @@
+"""
+Index d'identité des pays : un code ISO3 par pays, retrouvé depuis un nom français ou anglais,
+une variante (alias) ou un code ISO2/ISO3. Sert de clé commune pour joindre les tableaux
+BASIC et hebdomadaire (noms français, sans code) au tableau World Bank (codes ISO3).
+"""
+import os
+import re
+import unicodedata
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from app.models.country import CountryIdentity, JoinedCountryRisk
+from app.models.risk import CountryRiskSummary
+from app.models.simple_risk import SimpleCountryRisk
+from app.models.weekly_risk import WeeklyCountryRisk
+from app.services.static_data import DATA_DIR, StaticDataset, register_dataset
+
+COUNTRIES_DATA_PATH = Path(os.getenv("COUNTRIES_DATA_PATH", DATA_DIR / "countries.json"))
+
+
+def normalize_key(name: str) -> str:
+    """Clé de recherche : sans accents, casse, espaces ni ponctuation (« Côte d’Ivoire » == « cote d'ivoire »)."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    return re.sub(r"[^a-z0-9]", "", "".join(c for c in decomposed if not unicodedata.combining(c)).casefold())
+
+
+class CountryIndex:
+    """Table de hachage clé normalisée -> identité, construite une fois par version du fichier"""
+
+    def __init__(self, identities: Iterable[CountryIdentity], version: str):
+        self.version = version
+        self.identities: Tuple[CountryIdentity, ...] = tuple(identities)
+        self.by_iso3: Mapping[str, CountryIdentity] = MappingProxyType({c.iso3: c for c in self.identities})
+        keys: Dict[str, CountryIdentity] = {}
+        # Codes et noms principaux d'abord : un alias ne masque jamais le nom ou le code d'un autre pays
+        for identity in self.identities:
+            for key in (identity.iso3, identity.iso2, identity.name_fr, identity.name_en):
+                keys.setdefault(normalize_key(key), identity)
+        for identity in self.identities:
+            for alias in identity.aliases:
+                keys.setdefault(normalize_key(alias), identity)
+        self._by_key: Mapping[str, CountryIdentity] = MappingProxyType(keys)
+
+    def resolve(self, name_or_code: str) -> Optional[CountryIdentity]:
+        """Identité d'un pays à partir d'un nom, d'un alias ou d'un code ISO2/ISO3 (None si inconnu)."""
+        return self._by_key.get(normalize_key(name_or_code))
+
+    def key_for(self, *names_or_codes: str) -> str:
+        """Clé commune d'un pays : code ISO3 du premier nom ou code reconnu, sinon le premier nom normalisé."""
+        for name in names_or_codes:
+            identity = self.resolve(name)
+            if identity is not None:
+                return identity.iso3
+        return normalize_key(names_or_codes[0])
+
+    def join(self, basic: Iterable[SimpleCountryRisk], worldbank: Iterable[CountryRiskSummary],
+             weekly: Iterable[WeeklyCountryRisk]) -> Tuple[List[JoinedCountryRisk], List[str]]:
+        """
+        Une ligne par pays présent dans au moins un tableau, en un seul passage sur chaque tableau.
+        Retourne les lignes (triées par nom français) et les noms ou codes sans identité connue.
+        """
+        rows: Dict[str, dict] = {}
+        unmatched: List[str] = []
+
+        def row_for(key: str, fallback: Optional[str] = None) -> Optional[dict]:
+            identity = self.resolve(key) or (self.resolve(fallback) if fallback else None)
+            if identity is None:
+                unmatched.append(key)
+                return None
+            row = rows.get(identity.iso3)
+            if row is None:
+                row = rows[identity.iso3] = {
+                    "country_code": identity.iso3,
+                    "iso2": identity.iso2,
+                    "country_name": identity.name_fr,
+                    "name_en": identity.name_en,
+                }
+            return row
+
+        for country in basic:
+            row = row_for(country.country_name)
+            if row is not None:
+                row.setdefault("basic", country)  # Pays en double dans BASIC : la première entrée prime
+        for country in worldbank:
+            row = row_for(country.country_code, country.country_name)
+            if row is not None:
+                row["worldbank"] = country
+        for country in weekly:
+            row = row_for(country.country_name)
+            if row is not None:
+                row.setdefault("weekly_risk_level", country.overall_risk_level)
+
+        joined = [JoinedCountryRisk.model_construct(**row) for row in rows.values()]
+        joined.sort(key=lambda row: normalize_key(row.country_name))
+        return joined, sorted(set(unmatched))
+
+
+COUNTRIES_DATASET = register_dataset("countries", StaticDataset(
+    COUNTRIES_DATA_PATH, TypeAdapter(List[CountryIdentity]),
+    lambda identities, stats, mtime: CountryIndex(identities, stats.version)
+))
+
+
+def get_country_index() -> CountryIndex:
+    """Index d'identité des pays, chargé au premier appel."""
+    return COUNTRIES_DATASET.get()
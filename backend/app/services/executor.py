@@ -0,0 +1,47 @@
+"""
+Exécuteur dédié aux appels bloquants (réseau World Bank, RSS, NewsAPI, Gemini, construction des tableaux).
+Les handlers async y délèguent leur travail pour ne jamais bloquer la boucle d'événements :
+/health et les endpoints servis depuis le cache restent réactifs pendant un rafraîchissement.
+"""
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator
+
+BLOCKING_WORKERS = int(os.getenv("BLOCKING_WORKERS", "8"))
+UPSTREAM_WORKERS = int(os.getenv("UPSTREAM_WORKERS", "4"))
+
+# Travail local (cache, tableaux statiques) et appels lents vers les APIs externes dans
+# deux pools séparés : des rafraîchissements en attente ne peuvent pas occuper tous les
+# threads dont ont besoin les requêtes servies depuis le cache.
+_executor = ThreadPoolExecutor(max_workers=BLOCKING_WORKERS, thread_name_prefix="blocking")
+_upstream_executor = ThreadPoolExecutor(max_workers=UPSTREAM_WORKERS, thread_name_prefix="upstream")
+
+
+async def run_blocking(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Exécute une fonction bloquante rapide (travail local) hors de la boucle d'événements."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+
+async def run_upstream(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Exécute un appel potentiellement long vers une API externe hors de la boucle d'événements."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_upstream_executor, functools.partial(fn, *args, **kwargs))
+
+
+async def iterate_blocking(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """Parcourt un itérateur bloquant (lecture de l'archive, génération de lignes) élément par élément dans l'exécuteur."""
+    done = object()
+    while True:
+        item = await run_blocking(next, iterator, done)
+        if item is done:
+            return
+        yield item
+
+
+def shutdown_executor():
+    """Arrête les exécuteurs (appelé à l'arrêt de l'application)."""
+    _executor.shutdown(wait=False, cancel_futures=True)
+    _upstream_executor.shutdown(wait=False, cancel_futures=True)
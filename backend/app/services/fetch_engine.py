@@ -0,0 +1,198 @@
+"""
+Moteur de récupération concurrente à concurrence bornée.
+Pool de workers, limiteur de débit (token bucket), retry avec backoff aléatoire
+et concurrence adaptative selon la latence et les erreurs observées en amont.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchEngineConfig:
+    """Paramètres du moteur (surchargés par variables d'environnement)"""
+    max_workers: int = 8  # Taille du pool et plafond de concurrence
+    min_workers: int = 1  # Plancher de concurrence en cas d'erreurs
+    rate_per_second: float = 10.0  # Débit maximal de requêtes vers l'API
+    burst: int = 10  # Nombre de requêtes autorisées en rafale
+    max_retries: int = 3  # Tentatives supplémentaires par tâche
+    retry_base_delay: float = 0.5  # Délai de base du backoff exponentiel (secondes)
+    target_latency: float = 2.0  # Au-delà, la concurrence est réduite (secondes)
+
+    @classmethod
+    def from_env(cls) -> "FetchEngineConfig":
+        return cls(
+            max_workers=int(os.getenv("WB_MAX_WORKERS", "8")),
+            min_workers=int(os.getenv("WB_MIN_WORKERS", "1")),
+            rate_per_second=float(os.getenv("WB_RATE_LIMIT", "10")),
+            burst=int(os.getenv("WB_RATE_BURST", "10")),
+            max_retries=int(os.getenv("WB_MAX_RETRIES", "3")),
+            retry_base_delay=float(os.getenv("WB_RETRY_BASE_DELAY", "0.5")),
+            target_latency=float(os.getenv("WB_TARGET_LATENCY", "2.0")),
+        )
+
+
+@dataclass
+class TaskTiming:
+    """Mesures pour une tâche (un pays)"""
+    key: str
+    attempts: int = 0
+    latency: float = 0.0  # Durée du dernier appel en amont (secondes)
+    total_time: float = 0.0  # Durée totale, attentes et retries compris (secondes)
+    error: Optional[str] = None
+
+
+@dataclass
+class FetchReport:
+    """Résultat d'une exécution du moteur"""
+    results: Dict[str, Any] = field(default_factory=dict)
+    timings: List[TaskTiming] = field(default_factory=list)
+    elapsed: float = 0.0
+    final_concurrency: int = 0
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        return {t.key: t.error for t in self.timings if t.error}
+
+    def summary(self) -> Dict[str, Any]:
+        """Statistiques agrégées (utile pour régler les paramètres du moteur)"""
+        latencies = sorted(t.latency for t in self.timings if t.error is None)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+        return {
+            "tasks": len(self.timings),
+            "succeeded": len(self.timings) - len(self.errors),
+            "failed": len(self.errors),
+            "retries": sum(max(t.attempts - 1, 0) for t in self.timings),
+            "elapsed_seconds": round(self.elapsed, 3),
+            "latency_p50": round(percentile(0.50), 3),
+            "latency_p95": round(percentile(0.95), 3),
+            "final_concurrency": self.final_concurrency,
+        }
+
+
+class TokenBucket:
+    """Limiteur de débit : `rate` jetons par seconde, au plus `capacity` en réserve."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Bloque jusqu'à ce qu'un jeton soit disponible."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveLimiter:
+    """
+    Limite de concurrence adaptative (AIMD) : +1 slot après une série d'appels
+    rapides, division par deux sur erreur ou latence au-delà de la cible.
+    """
+
+    def __init__(self, min_limit: int, max_limit: int, target_latency: float):
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.target_latency = target_latency
+        self.limit = self.max_limit
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, ok: bool):
+        with self._condition:
+            self._in_flight -= 1
+            if not ok or latency > self.target_latency:
+                self.limit = max(self.min_limit, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+
+def run_concurrent(tasks: Dict[str, Callable[[], Any]], config: Optional[FetchEngineConfig] = None) -> FetchReport:
+    """
+    Exécute les tâches (clé -> fonction sans argument) avec concurrence bornée.
+
+    Une tâche qui lève une exception est relancée jusqu'à `max_retries` fois avec un
+    backoff exponentiel aléatoire ("full jitter"). Les échecs définitifs sont reportés
+    dans `FetchReport.errors` sans interrompre les autres tâches.
+
+    Returns:
+        FetchReport: résultats par clé et mesures par tâche
+    """
+    config = config or FetchEngineConfig.from_env()
+    bucket = TokenBucket(config.rate_per_second, config.burst)
+    limiter = AdaptiveLimiter(config.min_workers, config.max_workers, config.target_latency)
+    report = FetchReport()
+    lock = threading.Lock()
+
+    def worker(key: str, task: Callable[[], Any]):
+        timing = TaskTiming(key=key)
+        started = time.monotonic()
+        for attempt in range(config.max_retries + 1):
+            limiter.acquire()
+            bucket.acquire()
+            call_start = time.monotonic()
+            ok = False
+            try:
+                result = task()
+                ok = True
+            except Exception as e:
+                timing.error = f"{type(e).__name__}: {e}"
+            finally:
+                timing.latency = time.monotonic() - call_start
+                timing.attempts = attempt + 1
+                limiter.release(timing.latency, ok)
+            if ok:
+                timing.error = None
+                with lock:
+                    report.results[key] = result
+                break
+            if attempt < config.max_retries:
+                time.sleep(random.uniform(0, config.retry_base_delay * (2 ** attempt)))
+        timing.total_time = time.monotonic() - started
+        with lock:
+            report.timings.append(timing)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(config.max_workers, 1), thread_name_prefix="fetch-engine") as pool:
+        for key, task in tasks.items():
+            pool.submit(worker, key, task)
+    report.elapsed = time.monotonic() - started
+    report.final_concurrency = limiter.limit
+    logger.info(f"⚙️  [FETCH ENGINE] {report.summary()}")
+    return report
@@ -1,53 +1,38 @@
 import json
+import logging
+from datetime import datetime
 from typing import Optional
-from datetime import datetime, timedelta
 from pathlib import Path
-from app.models.news import NewsArticle, WeeklyReport, GeopoliticalAnalysis
+from app.models.news import NewsArticle, WeeklyReport, WeeklyReportHistory, GeopoliticalAnalysis
 from app.services.newsapi_service import fetch_newsapi_articles
 from app.services.rss_service import fetch_all_rss_articles, deduplicate_articles
 from app.services.ai_synthesis import synthesize_articles
+from app.services.single_flight import SingleFlight
+from app.services.week_calendar import IsoWeek, parse_week, week_range
+from app.services.weekly_archive import get_archive
+
+logger = logging.getLogger(__name__)
 
 CACHE_DIR = Path(__file__).parent.parent.parent / "cache"
 CACHE_FILE = CACHE_DIR / "geopolitical_cache.json"
 
-
-def get_week_number(date: Optional[datetime] = None) -> str:
-    """Retourne le numéro de semaine"""
-    if date is None:
-        date = datetime.now()
-    return date.strftime('%Y-W%V')
-
-
-def get_week_bounds(week_number: Optional[str] = None) -> tuple[datetime, datetime]:
-    """Retourne les dates de début et fin de la semaine"""
-    if week_number:
-        year, week = week_number.split('-W')
-        year, week = int(year), int(week)
-        jan1 = datetime(year, 1, 1)
-        days_offset = (week - 1) * 7
-        week_start = jan1 + timedelta(days=days_offset - jan1.weekday())
-    else:
-        today = datetime.now()
-        days_since_monday = today.weekday()
-        week_start = today - timedelta(days=days_since_monday)
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    week_end = week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
-    
-    # Normaliser les dates pour éviter les erreurs de comparaison naive/aware
-    # Si les dates sont naive, les garder naive. Si aware, les convertir en UTC naive
-    if week_start.tzinfo is not None:
-        week_start = week_start.replace(tzinfo=None)
-    if week_end.tzinfo is not None:
-        week_end = week_end.replace(tzinfo=None)
-    
-    return week_start, week_end
+# Analyses concurrentes de la même semaine coalescées en un seul appel (RSS, NewsAPI, Gemini).
+# force_refresh fait partie de la clé : un rafraîchissement forcé ne reçoit pas le résultat d'une analyse normale en cours
+_analysis_flight = SingleFlight()
 
 
 def analyze_south_africa_weekly(force_refresh: bool = False) -> WeeklyReport:
     """Analyse les actualités géopolitiques de l'Afrique du Sud"""
-    week_number = get_week_number()
-    week_start, week_end = get_week_bounds(week_number)
+    week_number = IsoWeek.current().key
+    return _analysis_flight.do(
+        ("geopolitical", "ZA", week_number, force_refresh),
+        lambda: _analyze_south_africa_weekly(week_number, force_refresh)
+    )
+
+
+def _analyze_south_africa_weekly(week_number: str, force_refresh: bool) -> WeeklyReport:
+    week = IsoWeek.from_key(week_number)
+    week_start, week_end = week.start, week.end
     
     # Vérifier le cache
     if not force_refresh and CACHE_FILE.exists():
@@ -128,6 +113,12 @@ def analyze_south_africa_weekly(force_refresh: bool = False) -> WeeklyReport:
         article_count=len(filtered_articles)
     )
     
+    # Archiver le rapport (un par semaine, remplacé tant que la semaine est en cours)
+    try:
+        get_archive().save_report(report)
+    except Exception as e:
+        logger.warning(f"⚠️ [ARCHIVE] Archivage du rapport {week_number} impossible: {e}")
+    
     # Mettre en cache
     try:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -148,3 +139,24 @@ def analyze_south_africa_weekly(force_refresh: bool = False) -> WeeklyReport:
         pass
     
     return report
+
+
+def get_report_history(country_code: str = "ZA", weeks: int = 12, until: Optional[str] = None) -> WeeklyReportHistory:
+    """
+    Derniers rapports archivés de chaque semaine sur les `weeks` semaines se terminant à `until`
+    (semaine en cours par défaut). Lit uniquement l'archive, sans relancer d'analyse.
+    
+    Raises:
+        InvalidWeekError: semaine `until` non reconnue
+    """
+    last = parse_week(until) if until else IsoWeek.current()
+    first = last.shift(-(weeks - 1))
+    reports = get_archive().reports(country_code, first, last)
+    archived_weeks = {report.week_number for report in reports}
+    return WeeklyReportHistory(
+        country_code=country_code,
+        first_week=first.key,
+        last_week=last.key,
+        reports=reports,
+        missing_weeks=[week.key for week in week_range(first, last) if week.key not in archived_weeks]
+    )
@@ -0,0 +1,217 @@
+"""
+Stockage local des observations brutes World Bank (pays, indicateur, année, valeur) dans SQLite.
+Les scores sont recalculés à partir de ce stockage : re-scorer ou ajouter un endpoint
+ne nécessite plus d'appel réseau.
+"""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+CACHE_DIR = Path(__file__).parent.parent.parent / "cache"
+STORE_FILE = Path(os.getenv("WB_STORE_PATH", CACHE_DIR / "observations.sqlite3"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    economy TEXT NOT NULL,
+    indicator TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (economy, indicator, year)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS economies (
+    code TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    synced_at TEXT
+);
+CREATE TABLE IF NOT EXISTS country_fetches (
+    code TEXT PRIMARY KEY,
+    fetched_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class ObservationStore:
+    """Accès au fichier SQLite des observations (une connexion par opération, thread-safe)"""
+
+    def __init__(self, path: Path = STORE_FILE):
+        self.path = Path(path)
+        self._write_lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # --- Observations ---
+
+    def upsert_frame(self, data: pd.DataFrame) -> int:
+        """
+        Enregistre un DataFrame (economy, series) × années. Les cellules vides suppriment
+        l'observation existante (valeur retirée en amont).
+
+        Returns:
+            int: nombre de lignes modifiées
+        """
+        if data.empty:
+            return 0
+        cells = data.stack(dropna=False).reset_index()
+        cells.columns = ['economy', 'indicator', 'year', 'value']
+        cells['year'] = [int(str(year).replace('YR', '')) for year in cells['year']]
+        present = cells['value'].notna()
+        rows = list(cells.loc[present].itertuples(index=False, name=None))
+        removed = list(cells.loc[~present, ['economy', 'indicator', 'year']].itertuples(index=False, name=None))
+
+        with self._write_lock, self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT INTO observations (economy, indicator, year, value) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (economy, indicator, year) DO UPDATE SET value = excluded.value "
+                "WHERE observations.value IS NOT excluded.value",
+                rows,
+            )
+            conn.executemany(
+                "DELETE FROM observations WHERE economy = ? AND indicator = ? AND year = ?",
+                removed,
+            )
+            changed = conn.total_changes - before
+            if changed:
+                conn.execute(
+                    "INSERT INTO sync_state (key, value) VALUES ('data_version', '1') "
+                    "ON CONFLICT (key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+                )
+        return changed
+
+    def load_frame(self, economies: Optional[Iterable[str]] = None, indicators: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Retourne les observations sous forme de DataFrame (economy, series) × années."""
+        query = "SELECT economy, indicator AS series, year, value FROM observations"
+        clauses, params = [], []
+        for column, items in (("economy", economies), ("indicator", indicators)):
+            if items is not None:
+                items = list(items)
+                clauses.append(f"{column} IN ({', '.join('?' * len(items))})")
+                params.extend(items)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        with self._connect() as conn:
+            rows = pd.read_sql_query(query, conn, params=params)
+        if rows.empty:
+            index = pd.MultiIndex.from_arrays([[], []], names=['economy', 'series'])
+            return pd.DataFrame(index=index, dtype=float)
+        return rows.pivot(index=['economy', 'series'], columns='year', values='value')
+
+    def max_year(self) -> Optional[int]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT MAX(year) FROM observations").fetchone()
+        return row[0]
+
+    def indicators(self) -> List[str]:
+        """Indicateurs présents dans le stockage"""
+        with self._connect() as conn:
+            return [row[0] for row in conn.execute("SELECT DISTINCT indicator FROM observations")]
+
+    # --- Pays ---
+
+    def set_economies(self, economies: Dict[str, str]):
+        """
+        Remplace la liste des pays classés (code -> nom) ; les dates de synchronisation des pays
+        conservés sont gardées, les observations des pays retirés aussi.
+        """
+        if not economies:
+            return  # Liste vide (API indisponible) : la liste connue est gardée
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO economies (code, name) VALUES (?, ?) "
+                "ON CONFLICT (code) DO UPDATE SET name = excluded.name",
+                list(economies.items()),
+            )
+            conn.execute(
+                f"DELETE FROM economies WHERE code NOT IN ({', '.join('?' * len(economies))})", list(economies)
+            )
+
+    def economies(self) -> Dict[str, str]:
+        with self._connect() as conn:
+            return dict(conn.execute("SELECT code, name FROM economies ORDER BY code"))
+
+    def mark_synced(self, codes: Iterable[str], synced_at: Optional[datetime] = None):
+        synced_at = (synced_at or datetime.now()).isoformat()
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(
+                "UPDATE economies SET synced_at = ? WHERE code = ?",
+                [(synced_at, code) for code in codes],
+            )
+
+    def mark_fetched(self, code: str, fetched_at: Optional[datetime] = None):
+        """Date la récupération d'un pays seul (route par pays), sans l'ajouter à la liste des pays classés."""
+        with self._write_lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO country_fetches (code, fetched_at) VALUES (?, ?) "
+                "ON CONFLICT (code) DO UPDATE SET fetched_at = excluded.fetched_at",
+                (code, (fetched_at or datetime.now()).isoformat()),
+            )
+
+    def synced_at(self, code: str) -> Optional[datetime]:
+        """Dernière récupération des observations du pays, groupée ou seule (None si jamais)."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(synced_at) FROM (SELECT synced_at FROM economies WHERE code = ? "
+                "UNION ALL SELECT fetched_at FROM country_fetches WHERE code = ?)",
+                (code, code),
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def unsynced_economies(self) -> List[str]:
+        """Pays connus qui n'ont encore jamais été synchronisés"""
+        with self._connect() as conn:
+            return [row[0] for row in conn.execute("SELECT code FROM economies WHERE synced_at IS NULL ORDER BY code")]
+
+    # --- État de synchronisation ---
+
+    def get_state(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, key: str, value: str):
+        with self._write_lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    @property
+    def data_version(self) -> int:
+        """Compteur incrémenté à chaque modification des observations"""
+        return int(self.get_state('data_version') or 0)
+
+
+_store: Optional[ObservationStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> ObservationStore:
+    """Retourne le stockage partagé (créé au premier appel)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ObservationStore(STORE_FILE)
+    return _store
@@ -0,0 +1,71 @@
+"""
+Projection des réponses (?fields=) : chemins pointés relatifs à un élément de liste
+(ex: "country_name,risks.title,risks.risk_level"), traduits en spécification `include`
+de Pydantic pour que les champs non demandés ne soient jamais sérialisés.
+"""
+import typing
+from typing import Any, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+
+class InvalidFieldsError(ValueError):
+    """Champ inconnu dans le paramètre fields"""
+
+
+def _unwrap(annotation: Any) -> Tuple[Any, bool]:
+    """Retourne (type de l'élément, est une liste) pour List[X], Optional[X] ou X."""
+    is_list = False
+    while True:
+        origin = typing.get_origin(annotation)
+        if origin in (list, typing.List):
+            annotation, is_list = typing.get_args(annotation)[0], True
+        elif origin is typing.Union:
+            annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+        else:
+            return annotation, is_list
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Normalise ?fields= (ordre et doublons sans effet, pour la clé du cache de réponses) ; None = tout."""
+    if not fields:
+        return None
+    paths = tuple(sorted({path.strip() for path in fields.split(",") if path.strip()}))
+    return paths or None
+
+
+def include_for(model: Type[BaseModel], paths: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Spécification `include` de model_dump pour les chemins donnés, validés contre `model`.
+
+    Raises:
+        InvalidFieldsError: si un segment de chemin n'est pas un champ du modèle
+    """
+    include: Dict[str, Any] = {}
+    for path in paths:
+        current_model, spec = model, include
+        segments = path.split(".")
+        for depth, segment in enumerate(segments):
+            if not (isinstance(current_model, type) and issubclass(current_model, BaseModel)) \
+                    or segment not in current_model.model_fields:
+                raise InvalidFieldsError(f"Champ inconnu: {path} (champs disponibles: {', '.join(model.model_fields)})")
+            item_type, is_list = _unwrap(current_model.model_fields[segment].annotation)
+            if depth == len(segments) - 1:
+                spec[segment] = True
+                break
+            child = spec.get(segment)
+            if child is True:
+                break  # Le champ entier est déjà demandé
+            if child is None:
+                child = spec[segment] = {"__all__": {}} if is_list else {}
+            spec = child["__all__"] if is_list else child
+            current_model = item_type
+    return include
+
+
+def rows_include(table_model: Type[BaseModel], rows_field: str, paths: Tuple[str, ...]) -> Dict[str, Any]:
+    """`include` d'un tableau : champs globaux conservés, projection appliquée à chaque élément de `rows_field`."""
+    row_model, _ = _unwrap(table_model.model_fields[rows_field].annotation)
+    include: Dict[str, Any] = {name: True for name in table_model.model_fields if name != rows_field}
+    include[rows_field] = {"__all__": include_for(row_model, paths)}
+    return include
@@ -0,0 +1,97 @@
+"""
+Cache des réponses déjà encodées (JSON ou format compact, gzip, brotli) par (endpoint, paramètres, version des données).
+Tant que la version ne change pas, une requête ne reconstruit ni ne valide les modèles Pydantic
+et ne recompresse rien : les octets sont servis directement.
+"""
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+from pydantic_core import to_json
+
+from app.services.single_flight import SingleFlight
+
+try:
+    import brotli
+except ImportError:  # Variante brotli désactivée si le paquet n'est pas installé
+    brotli = None
+
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "64"))
+GZIP_LEVEL = 9
+BROTLI_QUALITY = int(os.getenv("RESPONSE_CACHE_BROTLI_QUALITY", "9"))
+
+
+class EncodedBody(NamedTuple):
+    """Corps JSON d'une réponse et ses variantes compressées"""
+    version: Hashable
+    media_type: str
+    etag: str  # Empreinte du corps JSON (ETag fort, suffixé par l'encodage servi)
+    identity: bytes
+    gzip: bytes
+    br: Optional[bytes]
+
+
+def encode_body(content: Any, version: Hashable, serialize: Callable[[Any], bytes] = to_json,
+                media_type: str = "application/json") -> EncodedBody:
+    """Sérialise `content` (modèles Pydantic, dicts, listes), en JSON par défaut, et précalcule les variantes compressées."""
+    body = serialize(content)
+    return EncodedBody(
+        version=version,
+        media_type=media_type,
+        etag=hashlib.sha1(body).hexdigest()[:20],
+        identity=body,
+        gzip=gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+        br=brotli.compress(body, quality=BROTLI_QUALITY) if brotli else None,
+    )
+
+
+class ResponseCache:
+    """Une entrée par (endpoint, paramètres), remplacée quand la version des données change ; éviction LRU"""
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, EncodedBody]" = OrderedDict()
+        self._flight = SingleFlight()
+
+    def get(self, key: Hashable, version: Hashable) -> Optional[EncodedBody]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def get_or_build(self, key: Hashable, version: Hashable, build: Callable[[], Any],
+                     serialize: Callable[[Any], bytes] = to_json, media_type: str = "application/json") -> EncodedBody:
+        """
+        Retourne les octets en cache pour `key` s'ils correspondent à `version`, sinon appelle
+        `build()` (une seule fois pour les appels concurrents) et encode son résultat avec `serialize`.
+        """
+        entry = self.get(key, version)
+        if entry is not None:
+            return entry
+
+        def encode():
+            entry = encode_body(build(), version, serialize, media_type)
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            return entry
+
+        return self._flight.do((key, version), encode)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+response_cache = ResponseCache()
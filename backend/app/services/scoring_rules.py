@@ -0,0 +1,122 @@
+"""
+Table déclarative des règles de score de risque.
+Les seuils sont lus depuis un fichier JSON (indicateur -> intervalles -> score/niveau)
+puis compilés en recherche d'intervalle numpy (np.digitize), applicable à une valeur
+isolée comme à une colonne entière.
+
+Format d'une règle : `edges` (bornes croissantes), `closed` ("left" : intervalles [a, b),
+"right" : intervalles (a, b]) et `bins` (len(edges) + 1 entrées {score, level}).
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+RULES_FILE = Path(os.getenv("RISK_RULES_PATH", Path(__file__).parent.parent / "data" / "scoring_rules.json"))
+
+
+class CompiledRule:
+    """Règle compilée : bornes et tables de correspondance indice d'intervalle -> score/niveau"""
+
+    def __init__(self, edges: List[float], closed: str, scores: List[int], levels: List[str]):
+        if len(scores) != len(edges) + 1 or len(levels) != len(edges) + 1:
+            raise ValueError("Une règle doit définir len(edges) + 1 intervalles")
+        if list(edges) != sorted(edges):
+            raise ValueError(f"Les bornes doivent être croissantes: {edges}")
+        if closed not in ("left", "right"):
+            raise ValueError(f"closed doit valoir 'left' ou 'right': {closed}")
+        self.edges = np.asarray(edges, dtype=float)
+        self.right = closed == "right"
+        self.scores = np.asarray(scores, dtype=int)
+        self.levels = np.asarray(levels, dtype=object)
+
+    def bin_index(self, values) -> np.ndarray:
+        return np.digitize(np.asarray(values, dtype=float), self.edges, right=self.right)
+
+    def apply(self, values) -> tuple[np.ndarray, np.ndarray]:
+        """Retourne (scores, niveaux) ; les valeurs manquantes donnent (0, "unknown")."""
+        values = np.asarray(values, dtype=float)
+        index = self.bin_index(values)
+        missing = np.isnan(values)
+        return (
+            np.where(missing, 0, self.scores[index]),
+            np.where(missing, "unknown", self.levels[index]),
+        )
+
+
+class RuleTable:
+    """Ensemble des règles compilées, identifié par une version (empreinte du fichier)"""
+
+    def __init__(self, rules: Dict, version: str):
+        self.version = version
+        self.indicators: Dict[str, CompiledRule] = {
+            code: CompiledRule(
+                rule["edges"],
+                rule.get("closed", "left"),
+                [b["score"] for b in rule["bins"]],
+                [b["level"] for b in rule["bins"]],
+            )
+            for code, rule in rules.get("indicators", {}).items()
+        }
+        overall = rules["overall"]
+        self.overall = CompiledRule(
+            overall["edges"],
+            overall.get("closed", "left"),
+            list(range(len(overall["levels"]))),
+            overall["levels"],
+        )
+
+    @property
+    def risk_indicators(self) -> List[str]:
+        """Indicateurs qui contribuent au score (les autres sont informatifs)"""
+        return list(self.indicators.keys())
+
+    def score(self, indicator_codes: List[str], values) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calcule les scores et niveaux d'une matrice pays × indicateurs.
+        Les indicateurs sans règle valent (0, "info"), les valeurs manquantes (0, "unknown").
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        scores = np.zeros(values.shape, dtype=int)
+        levels = np.full(values.shape, "info", dtype=object)
+        for column, indicator_code in enumerate(indicator_codes):
+            rule = self.indicators.get(indicator_code)
+            if rule is not None:
+                scores[:, column], levels[:, column] = rule.apply(values[:, column])
+        missing = np.isnan(values)
+        levels[missing] = "unknown"
+        return scores, levels
+
+    def overall_level(self, total_scores) -> np.ndarray:
+        """Niveau global ("low" ... "critical") pour un ou plusieurs scores totaux"""
+        return self.overall.levels[self.overall.bin_index(total_scores)]
+
+
+_rule_table: Optional[RuleTable] = None
+_rule_table_mtime: Optional[float] = None
+_lock = threading.Lock()
+
+
+def load_rule_table(path: Path = RULES_FILE) -> RuleTable:
+    """Lit et compile un fichier de règles."""
+    raw = path.read_bytes()
+    return RuleTable(json.loads(raw), hashlib.sha1(raw).hexdigest()[:12])
+
+
+def get_rule_table() -> RuleTable:
+    """
+    Retourne la table de règles compilée. Le fichier n'est relu que s'il a été
+    modifié, ce qui permet d'ajuster les seuils sans redéployer le code.
+    """
+    global _rule_table, _rule_table_mtime
+    mtime = RULES_FILE.stat().st_mtime
+    if _rule_table is None or mtime != _rule_table_mtime:
+        with _lock:
+            if _rule_table is None or mtime != _rule_table_mtime:
+                _rule_table = load_rule_table(RULES_FILE)
+                _rule_table_mtime = mtime
+    return _rule_table
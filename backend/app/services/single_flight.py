@@ -0,0 +1,79 @@
+"""
+Coalescence des calculs concurrents ("single-flight").
+Tant qu'un calcul est en cours pour une clé, les autres appelants avec la même clé
+attendent ce calcul et reçoivent le même résultat (ou la même exception).
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Groupe de calculs coalescés, identifiés par une clé (ex: ("worldbank", 2025))"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def _begin(self, key: Hashable) -> tuple[_Call, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                return call, False
+            call = self._calls[key] = _Call()
+            return call, True
+
+    def _run(self, key: Hashable, call: _Call, fn: Callable[[], Any]):
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Exécute `fn` ou attend le calcul déjà en cours pour `key`, puis retourne son résultat."""
+        call, leader = self._begin(key)
+        if leader:
+            self._run(key, call, fn)
+        else:
+            call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def do_in_background(self, key: Hashable, fn: Callable[[], Any], name: Optional[str] = None) -> bool:
+        """
+        Lance `fn` dans un thread si aucun calcul n'est en cours pour `key`.
+        Les appels `do(key, ...)` suivants attendront ce calcul.
+
+        Returns:
+            bool: True si un calcul a été lancé par cet appel
+        """
+        call, leader = self._begin(key)
+        if not leader:
+            with self._lock:
+                call.waiters -= 1
+            return False
+        threading.Thread(target=self._run, args=(key, call, fn), name=name, daemon=True).start()
+        return True
+
+    def in_flight(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def waiters(self, key: Hashable) -> int:
+        """Nombre d'appelants en attente du calcul en cours pour `key`"""
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call else 0
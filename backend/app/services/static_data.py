@@ -0,0 +1,117 @@
+"""
+Chargement des jeux de données statiques (app/data/*.json) : le fichier est lu, parsé et validé
+une seule fois, au premier usage, puis relu uniquement s'il a été modifié (mise à jour des
+données sans toucher au code). Chaque chargement journalise son temps de parsing et sa taille ;
+la mémoire allouée n'est mesurée qu'avec STATIC_DATA_TRACE_MEMORY=1 (tracemalloc ralentit les
+allocations de tout le processus pendant la mesure).
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, NamedTuple, Optional, TypeVar
+
+from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+T = TypeVar("T")
+
+TRACE_MEMORY = os.getenv("STATIC_DATA_TRACE_MEMORY", "0").lower() in ("1", "true", "yes")
+
+# tracemalloc est global au processus : un seul chargement mesuré à la fois
+_tracing_lock = threading.Lock()
+
+
+class LoadStats(NamedTuple):
+    """Mesures du dernier chargement d'un jeu de données"""
+    path: str
+    version: str  # Empreinte du fichier
+    size_bytes: int
+    items: int
+    parse_ms: float  # Lecture + parsing JSON + validation Pydantic
+    memory_bytes: Optional[int]  # Mémoire allouée par le chargement (None sans STATIC_DATA_TRACE_MEMORY ou si tracemalloc était déjà actif)
+
+
+class StaticDataset(Generic[T]):
+    """Jeu de données JSON validé par `adapter` et transformé par `build`, chargé paresseusement"""
+
+    def __init__(self, path: Path, adapter: TypeAdapter, build: Callable[[Any, "LoadStats", float], T]):
+        self.path = Path(path)
+        self.adapter = adapter
+        self.build = build  # (données validées, mesures, mtime du fichier) -> valeur servie
+        self.stats: Optional[LoadStats] = None
+        self._value: Optional[T] = None
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def load(self, mtime: Optional[float] = None) -> T:
+        """Lit, valide et construit la valeur depuis le fichier, sans passer par le cache."""
+        if mtime is None:
+            mtime = self.path.stat().st_mtime
+        if not TRACE_MEMORY:
+            return self._measured_load(mtime, trace=False)
+        with _tracing_lock:
+            return self._measured_load(mtime, trace=True)
+
+    def _measured_load(self, mtime: float, trace: bool) -> T:
+        # tracemalloc mesure les allocations du chargement ; s'il est déjà actif (profilage), on ne le perturbe pas
+        tracing = trace and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        try:
+            started = time.perf_counter()
+            raw = self.path.read_bytes()
+            data = self.adapter.validate_json(raw)
+            stats = LoadStats(
+                path=str(self.path),
+                version=hashlib.sha1(raw).hexdigest()[:12],
+                size_bytes=len(raw),
+                items=len(data),
+                parse_ms=round((time.perf_counter() - started) * 1000, 2),
+                memory_bytes=None,
+            )
+            value = self.build(data, stats, mtime)
+            if tracing:
+                stats = stats._replace(memory_bytes=tracemalloc.get_traced_memory()[0])
+        finally:
+            if tracing:
+                tracemalloc.stop()
+        memory = f"{stats.memory_bytes / 1024:.0f} Ko" if stats.memory_bytes is not None else "n/a"
+        logger.info(f"📦 [DATA] {self.path.name} chargé: {stats.items} entrées, {stats.size_bytes / 1024:.0f} Ko "
+                    f"en {stats.parse_ms} ms, mémoire {memory} (version {stats.version})")
+        self.stats = stats
+        return value
+
+    def get(self) -> T:
+        """Valeur construite à partir du fichier ; rechargée seulement si le fichier a été modifié."""
+        mtime = self.path.stat().st_mtime
+        if self._value is None or mtime != self._mtime:
+            with self._lock:
+                if self._value is None or mtime != self._mtime:
+                    self._value = self.load(mtime)
+                    self._mtime = mtime
+        return self._value
+
+    def version(self) -> str:
+        """Empreinte du fichier actuellement chargé."""
+        self.get()
+        return self.stats.version
+
+
+_datasets: Dict[str, StaticDataset] = {}
+
+
+def register_dataset(name: str, dataset: StaticDataset) -> StaticDataset:
+    _datasets[name] = dataset
+    return dataset
+
+
+def dataset_stats() -> Dict[str, Optional[dict]]:
+    """Mesures du dernier chargement de chaque jeu de données (None si pas encore chargé)."""
+    return {name: dataset.stats._asdict() if dataset.stats else None for name, dataset in _datasets.items()}
@@ -0,0 +1,240 @@
+"""
+Différences d'une semaine à l'autre des tableaux simplifié, hebdomadaire et World Bank :
+transitions de niveau de risque, variations de score et dépêches modifiées.
+Chaque instantané est archivé par semaine (app/services/weekly_archive.py). La différence avec
+les semaines archivées voisines est calculée une fois, au moment où l'instantané est ajouté, puis
+relue depuis l'archive : un client qui suit les changements ne compare plus deux tableaux complets.
+"""
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from app.models.diff import CountryDiff, FlashNewsChange, LevelTransition, TableDiff
+from app.models.risk import AllCountriesRisk
+from app.services.country_index import get_country_index, normalize_key
+from app.services.simple_risk_data import RISK_DIMENSIONS, get_simple_risk_snapshot, score_to_risk_level
+from app.services.ttl_cache import TTLCache
+from app.services.week_calendar import IsoWeek
+from app.services.weekly_archive import WEEKLY_TABLE, get_archive
+
+logger = logging.getLogger(__name__)
+
+DIFF_CACHE_SIZE = int(os.getenv("DIFF_CACHE_SIZE", "32"))
+# Les clés incluent les versions des deux instantanés : le TTL borne seulement la durée de vie des différences peu consultées
+DIFF_CACHE_TTL_SECONDS = 24 * 3600
+
+SIMPLE_TABLE = "simple"
+WORLDBANK_TABLE = "worldbank"
+
+
+class SnapshotNotFoundError(LookupError):
+    """Semaine absente de l'archive pour ce tableau"""
+
+
+class DiffSpec(NamedTuple):
+    """Ce qui est comparé d'une semaine à l'autre pour les lignes (JSON décodé) d'un tableau"""
+    level: Callable[[dict], str]  # Niveau de risque global d'une ligne
+    score_fields: Tuple[str, ...]  # Scores dont la variation est rapportée
+    flash_news: bool  # Compare les dépêches par type de risque
+
+
+DIFF_SPECS: Dict[str, DiffSpec] = {
+    SIMPLE_TABLE: DiffSpec(lambda row: score_to_risk_level(row["overall_risk"]), RISK_DIMENSIONS, False),
+    WEEKLY_TABLE: DiffSpec(lambda row: row["overall_risk_level"], (), True),
+    WORLDBANK_TABLE: DiffSpec(lambda row: row["risk_level"], ("overall_score",), False),
+}
+
+_diffs = TTLCache(maxsize=DIFF_CACHE_SIZE, ttl=DIFF_CACHE_TTL_SECONDS)
+# Version de la source déjà archivée par (tableau, semaine) : évite de resérialiser un instantané inchangé
+_recorded: Dict[Tuple[str, str], str] = {}
+
+
+def _content_version(rows: List[Tuple[str, str]]) -> str:
+    """Empreinte du contenu d'un instantané : deux instantanés identiques ont la même version."""
+    digest = hashlib.sha1()
+    for key, payload in rows:
+        digest.update(key.encode())
+        digest.update(payload.encode())
+    return digest.hexdigest()[:12]
+
+
+def record_snapshot(table: str, week: IsoWeek, rows: Iterable[Tuple[str, str]]) -> bool:
+    """
+    Archive l'instantané d'un tableau (clé du pays, JSON de la ligne) pour la semaine, puis calcule
+    ses différences avec les semaines archivées voisines.
+
+    Returns:
+        bool: False si l'instantané était identique à la version courante de la semaine
+    """
+    rows = list(rows)
+    version = _content_version(rows)
+    if not get_archive().append_snapshot(table, week, version, rows):
+        return False
+    logger.info(f"🗄️ [ARCHIVE] Instantané {table} {week.key} archivé: {len(rows)} pays (version {version})")
+    refresh_diffs(table, week)
+    return True
+
+
+def record_simple_snapshot(week: Optional[IsoWeek] = None) -> bool:
+    """Archive le tableau simplifié pour la semaine (en cours par défaut), s'il a changé depuis le dernier appel."""
+    week = week or IsoWeek.current()
+    snapshot = get_simple_risk_snapshot()
+    if _recorded.get((SIMPLE_TABLE, week.key)) == snapshot.version:
+        return False
+    index = get_country_index()
+    recorded = record_snapshot(SIMPLE_TABLE, week, (
+        (index.key_for(country.country_name), country.model_dump_json()) for country in snapshot.table.countries
+    ))
+    _recorded[(SIMPLE_TABLE, week.key)] = snapshot.version
+    return recorded
+
+
+def record_worldbank_snapshot(data: AllCountriesRisk, week: Optional[IsoWeek] = None) -> bool:
+    """Archive les scores World Bank pour la semaine (en cours par défaut) ; les dates de calcul ne sont pas comparées."""
+    week = week or IsoWeek.current()
+    index = get_country_index()
+    return record_snapshot(WORLDBANK_TABLE, week, (
+        (index.key_for(country.country_code, country.country_name), country.model_dump_json(exclude={"last_updated"}))
+        for country in data.countries
+    ))
+
+
+def refresh_diffs(table: str, week: IsoWeek):
+    """Calcule et archive les différences de `week` avec les semaines archivées juste avant et juste après."""
+    before, after = get_archive().neighbour_weeks(table, week)
+    for from_week, to_week in ((before, week), (week, after)):
+        if from_week is not None and to_week is not None:
+            get_table_diff(table, from_week, to_week)
+
+
+def resolve_diff_weeks(table: str, from_week: Optional[IsoWeek] = None,
+                       to_week: Optional[IsoWeek] = None) -> Tuple[IsoWeek, str, IsoWeek, str]:
+    """
+    Semaines et versions comparées. Par défaut : la semaine en cours (ou la dernière semaine archivée
+    avant elle) et la semaine archivée qui la précède.
+
+    Raises:
+        SnapshotNotFoundError: une des semaines n'est pas archivée pour ce tableau
+    """
+    # Une seule lecture de l'archive : les semaines par défaut sont choisies en mémoire
+    versions = get_archive().snapshot_weeks(table)
+    if to_week is None:
+        current = IsoWeek.current().key
+        to_week = IsoWeek.from_key(current if current in versions else max((week for week in versions if week < current), default=current))
+    if from_week is None:
+        previous = max((week for week in versions if week < to_week.key), default=None)
+        if previous is None:
+            raise SnapshotNotFoundError(f"Aucune semaine archivée avant {to_week.key} pour le tableau {table}")
+        from_week = IsoWeek.from_key(previous)
+    from_version, to_version = versions.get(from_week.key), versions.get(to_week.key)
+    missing = [week.key for week, version in ((from_week, from_version), (to_week, to_version)) if version is None]
+    if missing:
+        raise SnapshotNotFoundError(f"Semaine absente de l'archive du tableau {table}: {', '.join(missing)}")
+    return from_week, from_version, to_week, to_version
+
+
+def get_table_diff(table: str, from_week: Optional[IsoWeek] = None, to_week: Optional[IsoWeek] = None) -> TableDiff:
+    """
+    Différence entre les instantanés courants de deux semaines : mémoire, puis archive, sinon calculée et archivée.
+
+    Raises:
+        SnapshotNotFoundError: une des semaines n'est pas archivée pour ce tableau
+    """
+    from_week, from_version, to_week, to_version = resolve_diff_weeks(table, from_week, to_week)
+    return _diffs.get_or_load(
+        (table, from_week.key, from_version, to_week.key, to_version),
+        lambda: _load_or_compute(table, from_week, from_version, to_week, to_version)
+    )
+
+
+def _load_or_compute(table: str, from_week: IsoWeek, from_version: str, to_week: IsoWeek, to_version: str) -> TableDiff:
+    archive = get_archive()
+    payload = archive.load_diff(table, from_week, from_version, to_week, to_version)
+    if payload is not None:
+        return TableDiff.model_validate_json(payload)
+    before = archive.snapshot_rows(table, from_week)
+    after = archive.snapshot_rows(table, to_week)
+    if before is None or after is None:
+        raise SnapshotNotFoundError(f"Semaine absente de l'archive du tableau {table}")
+    diff = compute_diff(table, from_week, before, to_week, after)
+    archive.store_diff(table, from_week, diff.from_version, to_week, diff.to_version, diff.model_dump_json())
+    return diff
+
+
+def compute_diff(table: str, from_week: IsoWeek, before: Tuple[str, Dict[str, str]],
+                 to_week: IsoWeek, after: Tuple[str, Dict[str, str]]) -> TableDiff:
+    """Compare deux instantanés (version, clé -> JSON) ; les lignes au JSON identique ne sont pas décodées."""
+    spec = DIFF_SPECS[table]
+    (from_version, old_rows), (to_version, new_rows) = before, after
+    changes: List[CountryDiff] = []
+    transitions: Dict[str, int] = {}
+    for key in old_rows.keys() | new_rows.keys():
+        old_json, new_json = old_rows.get(key), new_rows.get(key)
+        if old_json == new_json:
+            continue
+        change = _country_diff(spec, key, json.loads(old_json) if old_json else None, json.loads(new_json) if new_json else None)
+        if change is None:
+            continue
+        changes.append(change)
+        if change.change == "changed" and change.risk_level is not None:
+            transition = f"{change.risk_level.before} -> {change.risk_level.after}"
+            transitions[transition] = transitions.get(transition, 0) + 1
+    changes.sort(key=lambda change: (normalize_key(change.country_name), change.country_key))
+    return TableDiff(
+        table=table,
+        from_week=from_week.key,
+        to_week=to_week.key,
+        from_version=from_version,
+        to_version=to_version,
+        total_countries_before=len(old_rows),
+        total_countries_after=len(new_rows),
+        total_changes=len(changes),
+        level_transitions=dict(sorted(transitions.items())),
+        countries=changes,
+        computed_at=datetime.now()
+    )
+
+
+def _country_diff(spec: DiffSpec, key: str, old: Optional[dict], new: Optional[dict]) -> Optional[CountryDiff]:
+    """Changements d'une ligne ; None si seuls des champs non comparés (dates de la semaine) diffèrent."""
+    if old is None or new is None:
+        return CountryDiff(
+            country_key=key,
+            country_name=(new or old)["country_name"],
+            change="added" if old is None else "removed",
+            risk_level=LevelTransition(before=spec.level(old) if old else None, after=spec.level(new) if new else None)
+        )
+    old_level, new_level = spec.level(old), spec.level(new)
+    deltas = {field: new[field] - old[field] for field in spec.score_fields if new[field] != old[field]}
+    news = _flash_news_changes(old["risks"], new["risks"]) if spec.flash_news else []
+    if old_level == new_level and not deltas and not news:
+        return None
+    return CountryDiff(
+        country_key=key,
+        country_name=new["country_name"],
+        change="changed",
+        risk_level=LevelTransition(before=old_level, after=new_level) if old_level != new_level else None,
+        score_deltas=deltas,
+        flash_news=news
+    )
+
+
+def _flash_news_changes(old_risks: List[Dict[str, Any]], new_risks: List[Dict[str, Any]]) -> List[FlashNewsChange]:
+    """Dépêches dont le niveau, le titre ou le texte a changé, par type de risque."""
+    previous = {risk["risk_type"]: risk for risk in old_risks}
+    changes = []
+    for risk in new_risks:
+        old = previous.get(risk["risk_type"], {})
+        level = old.get("risk_level")
+        change = FlashNewsChange(
+            risk_type=risk["risk_type"],
+            risk_level=LevelTransition(before=level, after=risk["risk_level"]) if level != risk["risk_level"] else None,
+            title=risk["title"] if old.get("title") != risk["title"] else None,
+            flash_news=risk["flash_news"] if old.get("flash_news") != risk["flash_news"] else None
+        )
+        if change.risk_level or change.title is not None or change.flash_news is not None:
+            changes.append(change)
+    return changes
@@ -0,0 +1,232 @@
+"""
+Pagination, tri et filtres des tableaux de pays (all-countries, simplifié, hebdomadaire).
+Les index triés (un ordre croissant et un ordre décroissant par champ triable, les positions
+par niveau de risque) sont construits une seule fois par version des données : une requête
+top-N ou « tous les pays à risque élevé » ne trie rien, elle parcourt un index déjà prêt.
+"""
+import bisect
+import os
+import unicodedata
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel
+
+from app.services.ttl_cache import TTLCache
+from app.services.simple_risk_data import score_to_risk_level
+
+TABLE_INDEX_CACHE_SIZE = int(os.getenv("TABLE_INDEX_CACHE_SIZE", "16"))
+# Les clés incluent la version des données : une entrée périmée n'est jamais relue, le TTL borne seulement sa durée de vie
+TABLE_INDEX_TTL_SECONDS = 24 * 3600
+ROWS_FIELD = "countries"
+
+
+class InvalidQueryError(ValueError):
+    """Tri ou filtre inconnu pour ce tableau"""
+
+
+class TableSpec(NamedTuple):
+    """Champs triables, filtrables par intervalle et par niveau de risque d'un tableau de pays"""
+    sort_keys: Dict[str, Callable[[Any], Any]]  # Champ -> clé de tri d'une ligne
+    score_fields: Tuple[str, ...]  # Champs numériques acceptés par min_score/max_score
+    default_score: Optional[str]  # Champ utilisé par min_score/max_score si score_field n'est pas précisé
+    level: Optional[Callable[[Any], str]]  # Niveau de risque d'une ligne (filtre risk_level)
+    levels: Tuple[str, ...]  # Niveaux valides, du plus faible au plus élevé
+
+
+class TableQuery(NamedTuple):
+    """Paramètres de pagination, tri et filtres (hashable : fait partie de la clé du cache de réponses)"""
+    sort: Optional[str] = None
+    descending: bool = False
+    levels: Optional[Tuple[str, ...]] = None
+    score_field: Optional[str] = None
+    min_score: Optional[float] = None
+    max_score: Optional[float] = None
+    offset: int = 0
+    limit: Optional[int] = None
+
+    @classmethod
+    def parse(cls, sort: Optional[str] = None, risk_level: Optional[str] = None, score_field: Optional[str] = None,
+              min_score: Optional[float] = None, max_score: Optional[float] = None,
+              offset: int = 0, limit: Optional[int] = None) -> "TableQuery":
+        """`sort` préfixé par '-' pour l'ordre décroissant ; `risk_level` peut lister plusieurs niveaux séparés par des virgules."""
+        descending = bool(sort) and sort.startswith("-")
+        levels = tuple(sorted({level.strip() for level in (risk_level or "").split(",") if level.strip()}))
+        return cls(
+            sort=sort.lstrip("-+") if sort else None,
+            descending=descending,
+            levels=levels or None,
+            score_field=score_field,
+            min_score=min_score,
+            max_score=max_score,
+            offset=offset,
+            limit=limit,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return self == TableQuery()
+
+    def validate(self, spec: TableSpec) -> "TableQuery":
+        """
+        Vérifie la requête contre les champs du tableau et fixe le champ de score des filtres d'intervalle.
+
+        Raises:
+            InvalidQueryError: tri, niveau ou champ de score inconnu pour ce tableau
+        """
+        if self.sort is not None and self.sort not in spec.sort_keys:
+            raise InvalidQueryError(f"Tri inconnu: {self.sort} (champs triables: {', '.join(spec.sort_keys)})")
+        if self.levels is not None:
+            if spec.level is None:
+                raise InvalidQueryError("Ce tableau ne peut pas être filtré par niveau de risque")
+            unknown = [level for level in self.levels if level not in spec.levels]
+            if unknown:
+                raise InvalidQueryError(f"Niveau inconnu: {', '.join(unknown)} (niveaux: {', '.join(spec.levels)})")
+        score_field = self.score_field
+        if score_field is not None or self.min_score is not None or self.max_score is not None:
+            if not spec.score_fields:
+                raise InvalidQueryError("Ce tableau ne peut pas être filtré par score")
+            score_field = score_field or spec.default_score
+            if score_field not in spec.score_fields:
+                raise InvalidQueryError(f"Champ de score inconnu: {score_field} (champs de score: {', '.join(spec.score_fields)})")
+        return self._replace(score_field=score_field)
+
+
+class TableIndex:
+    """Index triés d'un instantané de tableau ; les pages sont des copies du tableau sans revalidation"""
+
+    def __init__(self, table: BaseModel, spec: TableSpec):
+        self.table = table
+        self.rows: List[Any] = getattr(table, ROWS_FIELD)
+        positions = range(len(self.rows))
+        self._orders: Dict[Tuple[str, bool], Tuple[int, ...]] = {}
+        self._sorted_values: Dict[str, List[Any]] = {}
+        for field, key in spec.sort_keys.items():
+            keys = [key(row) for row in self.rows]
+            # Deux tris stables : à valeur égale, l'ordre d'origine est conservé dans les deux sens
+            ascending = tuple(sorted(positions, key=keys.__getitem__))
+            self._orders[(field, False)] = ascending
+            self._orders[(field, True)] = tuple(sorted(positions, key=keys.__getitem__, reverse=True))
+            if field in spec.score_fields:
+                self._sorted_values[field] = [keys[position] for position in ascending]
+        self._by_level: Dict[str, FrozenSet[int]] = {}
+        if spec.level is not None:
+            groups: Dict[str, List[int]] = {level: [] for level in spec.levels}
+            for position, row in enumerate(self.rows):
+                groups.setdefault(spec.level(row), []).append(position)
+            self._by_level = {level: frozenset(group) for level, group in groups.items()}
+
+    def _score_range(self, query: TableQuery) -> Tuple[int, int]:
+        """Bornes [lo, hi) dans l'ordre croissant de `score_field` des lignes comprises entre min_score et max_score."""
+        values = self._sorted_values[query.score_field]
+        lo = 0 if query.min_score is None else bisect.bisect_left(values, query.min_score)
+        hi = len(values) if query.max_score is None else bisect.bisect_right(values, query.max_score)
+        return lo, max(lo, hi)
+
+    def select(self, query: TableQuery) -> Tuple[List[Any], int]:
+        """Lignes de la page demandée et nombre total de lignes correspondant aux filtres."""
+        n = len(self.rows)
+        order = self._orders[(query.sort, query.descending)] if query.sort else range(n)
+        end = None if query.limit is None else query.offset + query.limit
+        has_range = query.min_score is not None or query.max_score is not None
+
+        candidates: Optional[FrozenSet[int]] = None
+        if query.levels is not None:
+            candidates = frozenset().union(*(self._by_level.get(level, frozenset()) for level in query.levels))
+        if has_range:
+            lo, hi = self._score_range(query)
+            if candidates is None and query.sort == query.score_field:
+                # Tri sur le champ filtré : les lignes retenues forment une tranche contiguë de l'index
+                matching = order[n - hi:n - lo] if query.descending else order[lo:hi]
+                return [self.rows[p] for p in matching[query.offset:end]], hi - lo
+            ascending = self._orders[(query.score_field, False)]
+            in_range = frozenset(ascending[lo:hi])
+            candidates = in_range if candidates is None else candidates & in_range
+
+        if candidates is None:
+            return [self.rows[p] for p in order[query.offset:end]], n
+        selected: List[int] = []
+        skipped = 0
+        for position in order:
+            if position not in candidates:
+                continue
+            if skipped < query.offset:
+                skipped += 1
+                continue
+            if end is not None and len(selected) >= query.limit:
+                break
+            selected.append(position)
+        return [self.rows[p] for p in selected], len(candidates)
+
+    def page(self, query: TableQuery) -> BaseModel:
+        """Copie du tableau réduite à la page demandée ; total_countries compte toutes les lignes retenues par les filtres."""
+        rows, total = self.select(query)
+        next_offset = query.offset + len(rows)
+        return self.table.model_copy(update={
+            ROWS_FIELD: rows,
+            "total_countries": total,
+            "next_offset": next_offset if next_offset < total and rows else None,
+        })
+
+
+_indexes = TTLCache(maxsize=TABLE_INDEX_CACHE_SIZE, ttl=TABLE_INDEX_TTL_SECONDS)
+
+
+def get_table_index(key: Hashable, version: Hashable, load: Callable[[], BaseModel], spec: TableSpec) -> TableIndex:
+    """Index de l'instantané `version` du tableau `key`, construit au premier appel (une seule fois pour les appels concurrents)."""
+    return _indexes.get_or_load((key, version), lambda: TableIndex(load(), spec))
+
+
+def _ordinal(levels: Tuple[str, ...], field: str) -> Callable[[Any], int]:
+    rank = {level: position for position, level in enumerate(levels)}
+    return lambda row: rank.get(getattr(row, field), -1)
+
+
+def _name_key(row: Any) -> str:
+    """Tri alphabétique des noms français : accents et casse ignorés (« Biélorussie » avant « Birmanie »)."""
+    decomposed = unicodedata.normalize("NFKD", row.country_name)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def _attribute(field: str) -> Callable[[Any], Any]:
+    return lambda row: getattr(row, field)
+
+
+WORLD_BANK_LEVELS = ("low", "medium", "high", "critical")
+WEEKLY_LEVELS = ("bas", "moyen", "élevé")
+SIMPLE_SCORE_FIELDS = ("overall_risk", "political_risk", "economic_risk", "security_risk", "social_risk")
+
+ALL_COUNTRIES_SPEC = TableSpec(
+    sort_keys={
+        "overall_score": _attribute("overall_score"),
+        "risk_level": _ordinal(WORLD_BANK_LEVELS, "risk_level"),
+        "country_name": _name_key,
+        "country_code": _attribute("country_code"),
+    },
+    score_fields=("overall_score",),
+    default_score="overall_score",
+    level=_attribute("risk_level"),
+    levels=WORLD_BANK_LEVELS,
+)
+
+# Le tableau simplifié n'a pas de niveau : il est déduit du score global, comme dans le tableau hebdomadaire
+SIMPLE_SPEC = TableSpec(
+    sort_keys={
+        **{field: _attribute(field) for field in SIMPLE_SCORE_FIELDS},
+        "country_name": _name_key,
+    },
+    score_fields=SIMPLE_SCORE_FIELDS,
+    default_score="overall_risk",
+    level=lambda row: score_to_risk_level(row.overall_risk),
+    levels=WEEKLY_LEVELS,
+)
+
+WEEKLY_SPEC = TableSpec(
+    sort_keys={
+        "overall_risk_level": _ordinal(WEEKLY_LEVELS, "overall_risk_level"),
+        "country_name": _name_key,
+    },
+    score_fields=(),
+    default_score=None,
+    level=_attribute("overall_risk_level"),
+    levels=WEEKLY_LEVELS,
+)
@@ -0,0 +1,86 @@
+"""
+Cache mémoire LRU avec expiration (TTL), en lecture traversante.
+Les chargements concurrents d'une même clé absente sont coalescés (voir single_flight.py).
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from app.services.single_flight import SingleFlight
+
+
+class TTLCache:
+    """Au plus `maxsize` entrées, chacune valide `ttl` secondes ; la moins récemment lue est évincée en premier"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retourne la valeur en cache, ou None si absente ou expirée."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        """True si la clé est en cache et non expirée (sans compter de lecture)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Retourne la valeur en cache, ou la charge avec `loader` (une seule fois pour les appels concurrents)."""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        def load():
+            value = loader()
+            if value is not None:
+                self.set(key, value)
+            return value
+
+        return self._flight.do(key, load)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Supprime une entrée, ou tout le cache si `key` est None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,161 @@
+"""
+Calendrier des semaines ISO 8601 (du lundi au dimanche, la semaine 1 contient le premier jeudi
+de l'année), partagé par les rapports géopolitiques, le tableau hebdomadaire et son archive.
+Une semaine est identifiée par sa clé « 2025-W02 », qui se trie dans l'ordre chronologique.
+"""
+import re
+import unicodedata
+from datetime import date, datetime, timedelta
+from typing import Iterator, NamedTuple, Optional, Union
+
+MONTHS_FR = ("Janvier", "Février", "Mars", "Avril", "Mai", "Juin",
+             "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre")
+
+DEFAULT_WEEK_LABEL = "Semaine du 5 Janvier"
+
+# Semaines acceptées par parse_week autour de la semaine en cours (environ 10 ans en arrière, 1 an en avant)
+MAX_WEEKS_BACK = 520
+MAX_WEEKS_AHEAD = 52
+
+_ISO_KEY = re.compile(r"^(\d{4})-?W(\d{1,2})$", re.IGNORECASE)
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_FRENCH_LABEL = re.compile(r"^semaine du (\d{1,2})(?:er)? ([a-z]+)(?: (\d{4}))?$")
+
+
+class InvalidWeekError(ValueError):
+    """Label ou clé de semaine non reconnu"""
+
+
+def _strip_accents(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+_MONTH_NUMBERS = {_strip_accents(month).lower(): number for number, month in enumerate(MONTHS_FR, start=1)}
+
+
+class IsoWeek(NamedTuple):
+    """Semaine ISO (année ISO, numéro de semaine)"""
+    year: int
+    week: int
+
+    @classmethod
+    def of(cls, day: Union[date, datetime]) -> "IsoWeek":
+        """Semaine contenant ce jour."""
+        iso = day.isocalendar()
+        return cls(iso[0], iso[1])
+
+    @classmethod
+    def current(cls, now: Optional[datetime] = None) -> "IsoWeek":
+        return cls.of(now or datetime.now())
+
+    @classmethod
+    def from_key(cls, key: str) -> "IsoWeek":
+        """
+        Semaine d'une clé « 2025-W02 » (ou « 2025W2 »).
+
+        Raises:
+            InvalidWeekError: clé mal formée ou semaine inexistante (ex: 2025-W53)
+        """
+        match = _ISO_KEY.match(key.strip())
+        if not match:
+            raise InvalidWeekError(f"Semaine inconnue: {key} (format attendu: 2025-W02)")
+        week = cls(int(match.group(1)), int(match.group(2)))
+        try:
+            date.fromisocalendar(week.year, week.week, 1)
+        except ValueError:
+            raise InvalidWeekError(f"Semaine inexistante: {key}") from None
+        return week
+
+    @property
+    def key(self) -> str:
+        return f"{self.year:04d}-W{self.week:02d}"
+
+    @property
+    def start(self) -> datetime:
+        """Lundi 00:00:00"""
+        return datetime.combine(date.fromisocalendar(self.year, self.week, 1), datetime.min.time())
+
+    @property
+    def end(self) -> datetime:
+        """Dimanche 23:59:59"""
+        return self.start + timedelta(days=6, hours=23, minutes=59, seconds=59)
+
+    @property
+    def label(self) -> str:
+        """Label affiché, ex: « Semaine du 30 Décembre 2024 »"""
+        start = self.start
+        day = "1er" if start.day == 1 else str(start.day)
+        return f"Semaine du {day} {MONTHS_FR[start.month - 1]} {start.year}"
+
+    def shift(self, weeks: int) -> "IsoWeek":
+        """Semaine située `weeks` semaines plus tard (plus tôt si négatif)."""
+        return IsoWeek.of(self.start + timedelta(weeks=weeks))
+
+    def is_complete(self, now: Optional[datetime] = None) -> bool:
+        """La semaine est terminée (son contenu ne changera plus)."""
+        return self.end < (now or datetime.now())
+
+    def __str__(self) -> str:
+        return self.key
+
+
+def parse_week(value: str, today: Optional[date] = None) -> IsoWeek:
+    """
+    Semaine désignée par une clé ISO (« 2025-W02 »), une date ISO (« 2025-01-08 », semaine qui la
+    contient) ou un label français (« Semaine du 6 Janvier 2025 »). Sans année, un label désigne
+    la dernière occurrence de ce jour, aujourd'hui compris (« Semaine du 5 Janvier »).
+
+    Raises:
+        InvalidWeekError: valeur non reconnue, date invalide ou semaine hors de l'intervalle accepté
+            (MAX_WEEKS_BACK semaines avant la semaine en cours, MAX_WEEKS_AHEAD après)
+    """
+    today = today or date.today()
+    week = _parse_week(value, today)
+    current = IsoWeek.of(today)
+    if not current.shift(-MAX_WEEKS_BACK) <= week <= current.shift(MAX_WEEKS_AHEAD):
+        raise InvalidWeekError(
+            f"Semaine hors de l'intervalle accepté: {week.key} "
+            f"(de {current.shift(-MAX_WEEKS_BACK).key} à {current.shift(MAX_WEEKS_AHEAD).key})"
+        )
+    return week
+
+
+def _parse_week(value: str, today: date) -> IsoWeek:
+    text = value.strip()
+    if _ISO_KEY.match(text):
+        return IsoWeek.from_key(text)
+    if _ISO_DATE.match(text):
+        try:
+            return IsoWeek.of(date.fromisoformat(text))
+        except ValueError:
+            raise InvalidWeekError(f"Date invalide: {value}") from None
+    match = _FRENCH_LABEL.match(re.sub(r"\s+", " ", _strip_accents(text).lower()))
+    month = _MONTH_NUMBERS.get(match.group(2)) if match else None
+    if month is None:
+        raise InvalidWeekError(
+            f"Semaine inconnue: {value} (formats acceptés: '2025-W02', '2025-01-06', 'Semaine du 6 Janvier 2025')"
+        )
+    day = int(match.group(1))
+    try:
+        if match.group(3):
+            return IsoWeek.of(date(int(match.group(3)), month, day))
+        # Un 29 février sans année remonte à la dernière année bissextile
+        for year in range(today.year, today.year - 8, -1):
+            try:
+                candidate = date(year, month, day)
+            except ValueError:
+                continue
+            if candidate <= today:
+                return IsoWeek.of(candidate)
+    except ValueError:
+        pass
+    raise InvalidWeekError(f"Date invalide: {value}")
+
+
+def week_range(first: IsoWeek, last: IsoWeek) -> Iterator[IsoWeek]:
+    """Semaines de `first` à `last` incluses, dans l'ordre chronologique."""
+    week = first
+    while week <= last:
+        yield week
+        week = week.shift(1)
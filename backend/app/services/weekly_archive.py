@@ -0,0 +1,442 @@
+"""
+Archive des semaines (SQLite, en ajout seul) : tableaux hebdomadaires, rapports géopolitiques,
+instantanés des tableaux simplifié et World Bank et différences entre semaines, indexés par
+semaine ISO. Un instantané archivé n'est jamais réécrit : une nouvelle version des données
+ajoute un instantané, qui devient la version courante de la semaine. Seul le rapport
+géopolitique de la semaine en cours est remplacé à chaque nouvelle analyse (un rapport par
+semaine). Les requêtes par intervalle (« les 12 dernières semaines du Brésil ») lisent
+seulement les lignes demandées via l'index (pays, semaine), sans rien régénérer.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter
+
+from app.models.news import WeeklyReport
+from app.models.weekly_risk import WeeklyArchiveWeek, WeeklyCountryRisk, WeeklyRiskTable
+from app.services.week_calendar import IsoWeek
+
+CACHE_DIR = Path(__file__).parent.parent.parent / "cache"
+ARCHIVE_FILE = Path(os.getenv("WEEKLY_ARCHIVE_PATH", CACHE_DIR / "weekly_archive.sqlite3"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS weekly_tables (
+    week TEXT NOT NULL,
+    data_version TEXT NOT NULL,
+    week_label TEXT NOT NULL,
+    week_start TEXT NOT NULL,
+    week_end TEXT NOT NULL,
+    total_countries INTEGER NOT NULL,
+    archived_at TEXT NOT NULL,
+    PRIMARY KEY (week, data_version)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS weekly_current (
+    week TEXT PRIMARY KEY,
+    data_version TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS weekly_countries (
+    week TEXT NOT NULL,
+    data_version TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    country_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (week, data_version, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS weekly_countries_by_country ON weekly_countries (country_key, week);
+CREATE TABLE IF NOT EXISTS weekly_reports (
+    country_code TEXT NOT NULL,
+    week TEXT NOT NULL,
+    generated_at TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (country_code, week, generated_at)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS table_snapshots (
+    table_name TEXT NOT NULL,
+    week TEXT NOT NULL,
+    data_version TEXT NOT NULL,
+    total_countries INTEGER NOT NULL,
+    archived_at TEXT NOT NULL,
+    PRIMARY KEY (table_name, week, data_version)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS snapshot_current (
+    table_name TEXT NOT NULL,
+    week TEXT NOT NULL,
+    data_version TEXT NOT NULL,
+    PRIMARY KEY (table_name, week)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS snapshot_rows (
+    table_name TEXT NOT NULL,
+    week TEXT NOT NULL,
+    data_version TEXT NOT NULL,
+    country_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (table_name, week, data_version, country_key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS table_diffs (
+    table_name TEXT NOT NULL,
+    from_week TEXT NOT NULL,
+    from_version TEXT NOT NULL,
+    to_week TEXT NOT NULL,
+    to_version TEXT NOT NULL,
+    computed_at TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (table_name, from_week, from_version, to_week, to_version)
+) WITHOUT ROWID;
+"""
+
+STREAM_BATCH_ROWS = 64  # Lignes lues par connexion quand un tableau archivé est servi en flux
+WEEKLY_TABLE = "weekly"  # Nom du tableau hebdomadaire pour les instantanés et différences (stocké dans weekly_countries)
+
+_countries_adapter = TypeAdapter(List[WeeklyCountryRisk])
+_reports_adapter = TypeAdapter(List[WeeklyReport])
+
+
+def _json_list(payloads: Iterable[str]) -> bytes:
+    """Assemble des objets JSON déjà sérialisés en une liste, validée en un seul appel."""
+    return ("[" + ",".join(payloads) + "]").encode()
+
+
+class WeeklyArchive:
+    """Accès au fichier SQLite de l'archive (une connexion par opération, thread-safe)"""
+
+    def __init__(self, path: Path = ARCHIVE_FILE):
+        self.path = Path(path)
+        self._write_lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        # En WAL, synchronous=NORMAL évite un fsync par ajout ; un ajout perdu sur coupure est refait au prochain appel
+        conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # --- Tableaux hebdomadaires ---
+
+    def current_version(self, week: IsoWeek) -> Optional[str]:
+        """Version des données de l'instantané courant de la semaine (None si elle n'est pas archivée)."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT data_version FROM weekly_current WHERE week = ?", (week.key,)).fetchone()
+        return row[0] if row else None
+
+    def append_table(self, week: IsoWeek, table: WeeklyRiskTable, data_version: str, country_keys: Sequence[str]) -> bool:
+        """
+        Archive le tableau de la semaine pour cette version des données et en fait la version courante.
+        `country_keys` donne la clé de recherche (code ISO3 en général) de chaque ligne du tableau.
+
+        Returns:
+            bool: False si cet instantané était déjà archivé (il n'est pas réécrit)
+        """
+        with self._write_lock, self._connect() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM weekly_tables WHERE week = ? AND data_version = ?", (week.key, data_version)
+            ).fetchone()
+            if not exists:
+                conn.execute(
+                    "INSERT INTO weekly_tables (week, data_version, week_label, week_start, week_end, total_countries, archived_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (week.key, data_version, table.week_label, table.week_start.isoformat(),
+                     table.week_end.isoformat(), table.total_countries, datetime.now().isoformat()),
+                )
+                conn.executemany(
+                    "INSERT INTO weekly_countries (week, data_version, position, country_key, payload) VALUES (?, ?, ?, ?, ?)",
+                    [(week.key, data_version, position, key, country.model_dump_json())
+                     for position, (key, country) in enumerate(zip(country_keys, table.countries))],
+                )
+            conn.execute(
+                "INSERT INTO weekly_current (week, data_version) VALUES (?, ?) "
+                "ON CONFLICT (week) DO UPDATE SET data_version = excluded.data_version",
+                (week.key, data_version),
+            )
+        return not exists
+
+    def load_table(self, week: IsoWeek) -> Optional[WeeklyRiskTable]:
+        """Instantané courant de la semaine (None si elle n'est pas archivée)."""
+        with self._connect() as conn:
+            meta = conn.execute(
+                "SELECT t.data_version, t.week_label, t.week_start, t.week_end FROM weekly_current w "
+                "JOIN weekly_tables t ON t.week = w.week AND t.data_version = w.data_version WHERE w.week = ?",
+                (week.key,),
+            ).fetchone()
+            if meta is None:
+                return None
+            payloads = [row[0] for row in conn.execute(
+                "SELECT payload FROM weekly_countries WHERE week = ? AND data_version = ? ORDER BY position",
+                (week.key, meta[0]),
+            )]
+        countries = _countries_adapter.validate_json(_json_list(payloads))
+        return WeeklyRiskTable(
+            countries=countries,
+            total_countries=len(countries),
+            week_label=meta[1],
+            week_number=week.key,
+            week_start=datetime.fromisoformat(meta[2]),
+            week_end=datetime.fromisoformat(meta[3]),
+        )
+
+    def load_countries(self, week: IsoWeek, country_keys: Iterable[str]) -> Optional[Dict[str, List[WeeklyCountryRisk]]]:
+        """
+        Lignes archivées des pays demandés pour la semaine (plusieurs lignes par clé si le tableau
+        contient un pays sous deux noms, ex: « Birmanie » et « Myanmar »), dans l'ordre du tableau.
+
+        Returns:
+            Optional[Dict[str, List[WeeklyCountryRisk]]]: clé -> lignes, None si la semaine n'est pas archivée
+        """
+        keys = list(dict.fromkeys(country_keys))
+        with self._connect() as conn:
+            row = conn.execute("SELECT data_version FROM weekly_current WHERE week = ?", (week.key,)).fetchone()
+            if row is None:
+                return None
+            rows = conn.execute(
+                "SELECT country_key, payload FROM weekly_countries "
+                f"WHERE week = ? AND data_version = ? AND country_key IN ({', '.join('?' * len(keys))}) "
+                "ORDER BY position",
+                (week.key, row[0], *keys),
+            ).fetchall() if keys else []
+        countries = _countries_adapter.validate_json(_json_list(payload for _, payload in rows))
+        found: Dict[str, List[WeeklyCountryRisk]] = {}
+        for (key, _), country in zip(rows, countries):
+            found.setdefault(key, []).append(country)
+        return found
+
+    def stream_table(self, week: IsoWeek, batch_rows: int = STREAM_BATCH_ROWS) -> Optional[Tuple[WeeklyArchiveWeek, Iterator[str]]]:
+        """
+        Instantané courant de la semaine en flux : ses métadonnées, puis le JSON de chaque ligne, lu par lots
+        de `batch_rows` (une connexion par lot, reprise après la dernière position lue). Les lignes ne sont
+        jamais toutes en mémoire et aucune transaction ne reste ouverte pendant l'envoi au client.
+
+        Returns:
+            Optional[Tuple[WeeklyArchiveWeek, Iterator[str]]]: None si la semaine n'est pas archivée
+        """
+        archived = self.weeks(week, week)
+        if not archived:
+            return None
+        return archived[0], self._iter_payloads(week, archived[0].data_version, batch_rows)
+
+    def _iter_payloads(self, week: IsoWeek, data_version: str, batch_rows: int) -> Iterator[str]:
+        position = -1
+        while True:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT position, payload FROM weekly_countries WHERE week = ? AND data_version = ? AND position > ? "
+                    "ORDER BY position LIMIT ?",
+                    (week.key, data_version, position, batch_rows),
+                ).fetchall()
+            for _, payload in rows:
+                yield payload
+            if len(rows) < batch_rows:
+                return
+            position = rows[-1][0]
+
+    def country_history(self, country_key: str, first: IsoWeek, last: IsoWeek) -> List[WeeklyCountryRisk]:
+        """Lignes d'un pays dans l'instantané courant de chaque semaine archivée de `first` à `last`."""
+        with self._connect() as conn:
+            payloads = [row[1] for row in conn.execute(
+                "SELECT c.week, c.payload, MIN(c.position) FROM weekly_countries c "
+                "JOIN weekly_current w ON w.week = c.week AND w.data_version = c.data_version "
+                "WHERE c.country_key = ? AND c.week BETWEEN ? AND ? GROUP BY c.week ORDER BY c.week",
+                (country_key, first.key, last.key),
+            )]
+        return _countries_adapter.validate_json(_json_list(payloads))
+
+    def weeks(self, first: Optional[IsoWeek] = None, last: Optional[IsoWeek] = None) -> List[WeeklyArchiveWeek]:
+        """Semaines archivées (instantané courant), dans l'ordre chronologique."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT t.week, t.week_label, t.week_start, t.week_end, t.total_countries, t.data_version, t.archived_at "
+                "FROM weekly_current w JOIN weekly_tables t ON t.week = w.week AND t.data_version = w.data_version "
+                "WHERE w.week BETWEEN ? AND ? ORDER BY w.week",
+                (first.key if first else "", last.key if last else "~"),
+            ).fetchall()
+        return [
+            WeeklyArchiveWeek(week_number=week, week_label=label, week_start=start, week_end=end,
+                              total_countries=total, data_version=version, archived_at=archived_at)
+            for week, label, start, end, total, version, archived_at in rows
+        ]
+
+    # --- Instantanés des tableaux (simplifié, World Bank ; hebdomadaire en lecture) ---
+
+    def append_snapshot(self, table_name: str, week: IsoWeek, data_version: str, rows: Sequence[Tuple[str, str]]) -> bool:
+        """
+        Archive l'instantané d'un tableau pour la semaine, lignes (clé du pays, JSON) ; la première
+        ligne d'une clé est conservée. L'instantané devient la version courante de la semaine.
+
+        Returns:
+            bool: False si cet instantané était déjà la version courante de la semaine
+        """
+        with self._write_lock, self._connect() as conn:
+            current = conn.execute(
+                "SELECT data_version FROM snapshot_current WHERE table_name = ? AND week = ?", (table_name, week.key)
+            ).fetchone()
+            if current and current[0] == data_version:
+                return False
+            exists = conn.execute(
+                "SELECT 1 FROM table_snapshots WHERE table_name = ? AND week = ? AND data_version = ?",
+                (table_name, week.key, data_version),
+            ).fetchone()
+            if not exists:
+                conn.execute(
+                    "INSERT INTO table_snapshots (table_name, week, data_version, total_countries, archived_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (table_name, week.key, data_version, len(rows), datetime.now().isoformat()),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO snapshot_rows (table_name, week, data_version, country_key, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(table_name, week.key, data_version, key, payload) for key, payload in rows],
+                )
+            conn.execute(
+                "INSERT INTO snapshot_current (table_name, week, data_version) VALUES (?, ?, ?) "
+                "ON CONFLICT (table_name, week) DO UPDATE SET data_version = excluded.data_version",
+                (table_name, week.key, data_version),
+            )
+        return True
+
+    def snapshot_version(self, table_name: str, week: IsoWeek) -> Optional[str]:
+        """Version courante de l'instantané d'un tableau pour la semaine (None si elle n'est pas archivée)."""
+        if table_name == WEEKLY_TABLE:
+            return self.current_version(week)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data_version FROM snapshot_current WHERE table_name = ? AND week = ?", (table_name, week.key)
+            ).fetchone()
+        return row[0] if row else None
+
+    def snapshot_weeks(self, table_name: str) -> Dict[str, str]:
+        """Semaines archivées d'un tableau et version courante de chacune, en une seule requête."""
+        with self._connect() as conn:
+            if table_name == WEEKLY_TABLE:
+                rows = conn.execute("SELECT week, data_version FROM weekly_current")
+            else:
+                rows = conn.execute("SELECT week, data_version FROM snapshot_current WHERE table_name = ?", (table_name,))
+            return dict(rows.fetchall())
+
+    def snapshot_rows(self, table_name: str, week: IsoWeek) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        Lignes JSON de l'instantané courant d'un tableau pour la semaine, par clé de pays (première ligne par clé).
+
+        Returns:
+            Optional[Tuple[str, Dict[str, str]]]: (version, clé -> JSON), None si la semaine n'est pas archivée
+        """
+        version = self.snapshot_version(table_name, week)
+        if version is None:
+            return None
+        with self._connect() as conn:
+            if table_name == WEEKLY_TABLE:
+                rows = conn.execute(
+                    "SELECT country_key, payload FROM weekly_countries WHERE week = ? AND data_version = ? ORDER BY position",
+                    (week.key, version),
+                )
+            else:
+                rows = conn.execute(
+                    "SELECT country_key, payload FROM snapshot_rows WHERE table_name = ? AND week = ? AND data_version = ?",
+                    (table_name, week.key, version),
+                )
+            payloads: Dict[str, str] = {}
+            for key, payload in rows:
+                payloads.setdefault(key, payload)
+        return version, payloads
+
+    def neighbour_weeks(self, table_name: str, week: IsoWeek) -> Tuple[Optional[IsoWeek], Optional[IsoWeek]]:
+        """Semaines archivées du tableau juste avant et juste après `week` (None s'il n'y en a pas)."""
+        if table_name == WEEKLY_TABLE:
+            query, params = "SELECT {} FROM weekly_current WHERE week {} ?", (week.key,)
+        else:
+            query, params = "SELECT {} FROM snapshot_current WHERE table_name = ? AND week {} ?", (table_name, week.key)
+        with self._connect() as conn:
+            before = conn.execute(query.format("MAX(week)", "<"), params).fetchone()[0]
+            after = conn.execute(query.format("MIN(week)", ">"), params).fetchone()[0]
+        return (IsoWeek.from_key(before) if before else None), (IsoWeek.from_key(after) if after else None)
+
+    # --- Différences entre instantanés ---
+
+    def load_diff(self, table_name: str, from_week: IsoWeek, from_version: str, to_week: IsoWeek, to_version: str) -> Optional[str]:
+        """JSON de la différence déjà calculée entre ces deux instantanés (None sinon)."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM table_diffs WHERE table_name = ? AND from_week = ? AND from_version = ? "
+                "AND to_week = ? AND to_version = ?",
+                (table_name, from_week.key, from_version, to_week.key, to_version),
+            ).fetchone()
+        return row[0] if row else None
+
+    def store_diff(self, table_name: str, from_week: IsoWeek, from_version: str, to_week: IsoWeek, to_version: str, payload: str):
+        with self._write_lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO table_diffs (table_name, from_week, from_version, to_week, to_version, computed_at, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (table_name, from_week.key, from_version, to_week.key, to_version, datetime.now().isoformat(), payload),
+            )
+
+    # --- Rapports géopolitiques ---
+
+    def save_report(self, report: WeeklyReport) -> bool:
+        """
+        Archive le rapport de la semaine en cours, une ligne par pays et par semaine : chaque nouvelle
+        analyse (nouveaux articles, sortie Gemini différente) remplace la précédente, l'historique grandit
+        avec les semaines et non avec les requêtes. Une semaine terminée n'est plus réécrite.
+
+        Returns:
+            bool: False si rien n'a été écrit (rapport identique au rapport archivé, dates de génération
+            exclues, ou semaine terminée déjà archivée)
+        """
+        content_hash = hashlib.sha1(
+            report.model_dump_json(exclude={"generated_at": True, "analysis": {"analysis_date"}}).encode()
+        ).hexdigest()
+        with self._write_lock, self._connect() as conn:
+            latest = conn.execute(
+                "SELECT content_hash FROM weekly_reports WHERE country_code = ? AND week = ? "
+                "ORDER BY generated_at DESC LIMIT 1",
+                (report.country_code, report.week_number),
+            ).fetchone()
+            if latest and (latest[0] == content_hash or report.week_number != IsoWeek.current().key):
+                return False
+            conn.execute(
+                "DELETE FROM weekly_reports WHERE country_code = ? AND week = ?",
+                (report.country_code, report.week_number),
+            )
+            conn.execute(
+                "INSERT INTO weekly_reports (country_code, week, generated_at, content_hash, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (report.country_code, report.week_number, report.generated_at.isoformat(), content_hash,
+                 report.model_dump_json()),
+            )
+        return True
+
+    def reports(self, country_code: str, first: IsoWeek, last: IsoWeek) -> List[WeeklyReport]:
+        """Dernier rapport de chaque semaine archivée de `first` à `last`."""
+        with self._connect() as conn:
+            payloads = [row[1] for row in conn.execute(
+                "SELECT week, payload, MAX(generated_at) FROM weekly_reports "
+                "WHERE country_code = ? AND week BETWEEN ? AND ? GROUP BY week ORDER BY week",
+                (country_code, first.key, last.key),
+            )]
+        return _reports_adapter.validate_json(_json_list(payloads))
+
+
+_archive: Optional[WeeklyArchive] = None
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> WeeklyArchive:
+    """Retourne l'archive partagée (créée au premier appel)."""
+    global _archive
+    if _archive is None:
+        with _archive_lock:
+            if _archive is None:
+                _archive = WeeklyArchive(ARCHIVE_FILE)
+    return _archive
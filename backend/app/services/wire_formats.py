@@ -0,0 +1,161 @@
+"""
+Formats compacts des tableaux de pays, en plus du JSON par défaut (un objet par pays) :
+- columnar : JSON avec une liste par champ au lieu d'un objet par pays,
+- msgpack : la même structure en colonnes, en MessagePack (paquet msgpack),
+- arrow : flux Arrow IPC d'une table par pays, les champs globaux en métadonnées (paquet pyarrow),
+- ndjson : flux d'une ligne JSON par pays, produit au fil de l'eau (tableaux qui le permettent seulement).
+"""
+import json
+import zlib
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, Optional, Tuple
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+try:
+    import msgpack
+except ImportError:  # Format msgpack indisponible si le paquet n'est pas installé
+    msgpack = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # Format arrow indisponible si le paquet n'est pas installé
+    pa = None
+
+DEFAULT_FORMAT = "json"
+MEDIA_TYPES = {
+    "json": "application/json",
+    "columnar": "application/vnd.riskindex.columnar+json",
+    "msgpack": "application/msgpack",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "ndjson": "application/x-ndjson",
+}
+_ACCEPT_ALIASES = {
+    "application/x-msgpack": "msgpack",
+    "application/vnd.msgpack": "msgpack",
+    "application/vnd.apache.arrow.file": "arrow",
+    "application/jsonl": "ndjson",
+}
+ROWS_FIELD = "countries"
+NDJSON_FORMAT = "ndjson"
+# Les lignes sont regroupées en morceaux de cette taille : un envoi par pays coûterait plus cher que le pays lui-même
+NDJSON_CHUNK_SIZE = 64 * 1024
+# Flux compressé pendant l'envoi, à chaque requête : le niveau 9 des réponses en cache coûterait plus que la sérialisation
+NDJSON_GZIP_LEVEL = 1
+
+
+class UnsupportedFormatError(ValueError):
+    """Format inconnu, non disponible sur ce serveur ou non applicable à la réponse"""
+
+
+def _available(fmt: str) -> bool:
+    return (fmt != "msgpack" or msgpack is not None) and (fmt != "arrow" or pa is not None)
+
+
+def negotiate_format(format_param: Optional[str], accept: Optional[str], formats: Optional[Collection[str]] = None) -> str:
+    """
+    Choisit le format de la réponse parmi `formats` (par défaut les formats sérialisés en une fois,
+    sans ndjson) : `?format=` en priorité, sinon le premier type reconnu de l'en-tête Accept, sinon JSON.
+    """
+    formats = SERIALIZERS if formats is None else formats
+    if format_param:
+        fmt = format_param.lower()
+        if fmt not in MEDIA_TYPES:
+            raise UnsupportedFormatError(f"Format inconnu: {format_param} (formats: {', '.join(formats)})")
+        if fmt not in formats:
+            raise UnsupportedFormatError(f"Format {fmt} non disponible pour cette réponse (formats: {', '.join(formats)})")
+        if not _available(fmt):
+            raise UnsupportedFormatError(f"Format {fmt} indisponible sur ce serveur")
+        return fmt
+    for item in (accept or "").split(","):
+        media_type = item.split(";")[0].strip().lower()
+        fmt = _ACCEPT_ALIASES.get(media_type) or next((f for f, m in MEDIA_TYPES.items() if m == media_type), None)
+        if fmt and fmt in formats and _available(fmt):
+            return fmt
+    return DEFAULT_FORMAT
+
+
+def to_columnar(content: Any) -> Any:
+    """
+    Remplace la liste de pays d'un tableau (modèle avec un champ `countries`) par un objet
+    {champ: [valeurs...]} ; les dicts (ex: /api/table) sont convertis récursivement.
+    """
+    if isinstance(content, dict):
+        return {key: to_columnar(value) for key, value in content.items()}
+    if not isinstance(content, BaseModel):
+        return content
+    data = content.model_dump(mode="json")
+    rows = data.get(ROWS_FIELD)
+    if rows is None:
+        return data
+    item_model = type(content).model_fields[ROWS_FIELD].annotation.__args__[0]
+    data[ROWS_FIELD] = {field: [row[field] for row in rows] for field in item_model.model_fields}
+    return data
+
+
+def _to_columnar_json(content: Any) -> bytes:
+    return to_json(to_columnar(content))
+
+
+def _to_msgpack(content: Any) -> bytes:
+    return msgpack.packb(to_columnar(content), use_bin_type=True)
+
+
+def _to_arrow(content: Any) -> bytes:
+    if not isinstance(content, BaseModel) or ROWS_FIELD not in type(content).model_fields:
+        raise UnsupportedFormatError("Le format arrow n'est disponible que pour un tableau de pays unique")
+    data = content.model_dump(mode="python")
+    item_model = type(content).model_fields[ROWS_FIELD].annotation.__args__[0]
+    rows = data.pop(ROWS_FIELD)
+    table = pa.Table.from_pydict({field: [row[field] for row in rows] for field in item_model.model_fields})
+    metadata = {key: json.dumps(value, default=str) for key, value in data.items()}
+    table = table.replace_schema_metadata(metadata)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+SERIALIZERS: Dict[str, Callable[[Any], bytes]] = {
+    "json": to_json,
+    "columnar": _to_columnar_json,
+    "msgpack": _to_msgpack,
+    "arrow": _to_arrow,
+}
+
+
+def ndjson_section(name: str, table: BaseModel) -> Tuple[Dict[str, Any], Iterable[Any]]:
+    """En-tête (champs globaux et nom du tableau) et lignes d'un tableau déjà en mémoire, pour ndjson_lines."""
+    return {"table": name, **table.model_dump(exclude={ROWS_FIELD})}, getattr(table, ROWS_FIELD)
+
+
+def ndjson_lines(sections: Iterable[Tuple[Dict[str, Any], Iterable[Any]]],
+                 include: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+    """
+    NDJSON d'un ou plusieurs tableaux : pour chacun, une ligne d'en-tête (champs globaux, avec la clé
+    `table`), puis une ligne par pays, sérialisée au moment où elle est lue. Les lignes sont modèles,
+    dicts ou JSON déjà sérialisé (str, relu tel quel sauf projection `include`). L'en-tête part seul :
+    le premier octet n'attend pas les pays, et la mémoire utilisée ne dépend pas de leur nombre.
+    """
+    for header, rows in sections:
+        yield to_json(header) + b"\n"
+        chunk = bytearray()
+        for row in rows:
+            if isinstance(row, str):
+                chunk += row.encode() if include is None else to_json(json.loads(row), include=include)
+            else:
+                chunk += to_json(row, include=include)
+            chunk += b"\n"
+            if len(chunk) >= NDJSON_CHUNK_SIZE:
+                yield bytes(chunk)
+                chunk = bytearray()
+        if chunk:
+            yield bytes(chunk)
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = NDJSON_GZIP_LEVEL) -> Iterator[bytes]:
+    """Compresse un flux en gzip morceau par morceau ; chaque morceau est vidé (Z_SYNC_FLUSH) pour partir sans attendre le suivant."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
@@ -1,11 +1,20 @@
 import wbgapi as wb
+import numpy as np
 import pandas as pd
-from typing import Dict, Optional
+from typing import Dict, NamedTuple, Optional
 from datetime import datetime, timedelta
 import json
 import os
+import logging
+import threading
 from pathlib import Path
 from app.models.risk import EconomicIndicator, IndicatorValue, RiskScore, CountryRisk, CountryRiskSummary, AllCountriesRisk
+from app.services.fetch_engine import run_concurrent
+from app.services.scoring_rules import get_rule_table
+from app.services.observation_store import ObservationStore, get_store
+from app.services.single_flight import SingleFlight
+from app.services.table_diff import record_worldbank_snapshot
+from app.services.ttl_cache import TTLCache
 
 # #region agent log
 LOG_PATH = '/Users/sou/Desktop/CURSOR/RiskIndex/.cursor/debug.log'
@@ -26,6 +35,8 @@ def _log_debug(session_id, run_id, hypothesis_id, location, message, data):
         pass
 # #endregion
 
+logger = logging.getLogger(__name__)
+
 # Configuration du cache
 CACHE_DIR = Path(__file__).parent.parent.parent / "cache"
 CACHE_FILE = CACHE_DIR / "countries_risk_cache.json"
@@ -91,6 +102,48 @@ INDICATORS = {
 COUNTRY_CODE = 'FRA'
 COUNTRY_NAME = 'France'
 
+# Régions agrégées World Bank à exclure de la liste des pays
+EXCLUDED_REGIONS = {
+    'WLD', 'OED', 'EAS', 'ECS', 'LCN', 'MEA', 'NAC', 'SAS', 'SSF',
+    'AFE', 'AFW', 'ARB', 'CEB', 'EAP', 'ECA', 'EMU', 'EUU', 'FCS',
+    'HIC', 'HPC', 'IBD', 'IBT', 'IDA', 'IDB', 'IDX', 'LAC', 'LDC',
+    'LIC', 'LMC', 'LMY', 'MIC', 'MNA', 'OEC', 'OSS', 'PRE', 'PSS',
+    'PST', 'SST', 'TEA', 'TEC', 'TLA', 'TMN', 'TSA', 'TSS', 'UMC',
+    'WLD', 'XKX'
+}
+
+# Requête groupée : nombre d'économies par appel wb.data.DataFrame et profondeur de l'historique
+MRV = 3  # Most Recent Values: 3 dernières années (même fenêtre que la requête par pays)
+BULK_CHUNK_SIZE = int(os.getenv("WB_BULK_CHUNK_SIZE", "80"))
+BULK_LOOKBACK_YEARS = int(os.getenv("WB_BULK_LOOKBACK_YEARS", "10"))
+
+# Mode de rafraîchissement : "bulk" (requêtes groupées) ou "per_country" (moteur concurrent, un appel par pays)
+REFRESH_MODE = os.getenv("WB_REFRESH_MODE", "bulk")
+
+# Synchronisation incrémentale : années récentes re-téléchargées (révisions World Bank)
+SYNC_REVISION_YEARS = int(os.getenv("WB_SYNC_REVISION_YEARS", "2"))
+WDI_SOURCE_ID = 2  # World Development Indicators
+
+# URL de l'API World Bank (ex: simulateur local benchmarks/wb_standin.py pour les tests hors ligne)
+WB_API_URL = os.getenv("WB_API_URL")
+if WB_API_URL:
+    wb.endpoint = WB_API_URL.rstrip('/')
+
+
+def score_values(indicator_codes: list[str], values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calcule les scores (0-25) et niveaux d'une matrice pays × indicateurs en une seule passe,
+    à partir de la table de règles (app/data/scoring_rules.json).
+    
+    Args:
+        indicator_codes: Codes des indicateurs, dans l'ordre des colonnes de `values`
+        values: Matrice de valeurs (NaN = donnée manquante)
+    
+    Returns:
+        tuple: (scores entiers, niveaux "low"/"medium"/"high"/"info"/"unknown"), même forme que `values`
+    """
+    return get_rule_table().score(indicator_codes, values)
+
 
 def calculate_risk_score(indicator_code: str, value: Optional[float]) -> tuple[int, str]:
     """
@@ -100,165 +153,206 @@ def calculate_risk_score(indicator_code: str, value: Optional[float]) -> tuple[i
     Returns:
         tuple: (score, level) où score est 0-25 et level est "low", "medium", "high"
     """
-    if value is None:
-        return 0, "unknown"
-    
-    # Indicateurs de risque (affectent le score)
-    if indicator_code == 'NY.GDP.MKTP.KD.ZG':  # Croissance PIB
-        if value < 0:
-            return 25, "high"
-        elif value < 2:
-            return 15, "medium"
-        else:
-            return 5, "low"
-    
-    elif indicator_code == 'FP.CPI.TOTL.ZG':  # Inflation
-        if value > 5:
-            return 25, "high"
-        elif value > 3:
-            return 15, "medium"
-        else:
-            return 5, "low"
-    
-    elif indicator_code == 'SL.UEM.TOTL.ZS':  # Chômage
-        if value > 10:
-            return 25, "high"
-        elif value > 7:
-            return 15, "medium"
-        else:
-            return 5, "low"
-    
-    elif indicator_code == 'BN.CAB.XOKA.GD.ZS':  # Compte courant
-        if value < -5:
-            return 25, "high"
-        elif value < -2:
-            return 15, "medium"
-        else:
-            return 5, "low"
-    
-    # Indicateurs informatifs (n'affectent pas le score de risque)
-    # PIB, PIB/habitant, Commerce, Export/Import, Réserves, Population, Taux d'intérêt, Déflateur
-    return 0, "info"
+    scores, levels = score_values([indicator_code], [[np.nan if value is None else value]])
+    return int(scores[0, 0]), levels[0, 0]
 
 
 def get_risk_level(overall_score: int) -> str:
     """Détermine le niveau de risque global basé sur le score total"""
-    if overall_score >= 75:
-        return "critical"
-    elif overall_score >= 50:
-        return "high"
-    elif overall_score >= 25:
-        return "medium"
-    else:
-        return "low"
+    return str(get_rule_table().overall_level(overall_score))
+
+
+def _normalize_frame(data: pd.DataFrame, economy: Optional[str] = None) -> pd.DataFrame:
+    """
+    Ramène un DataFrame wbgapi à la forme (economy, series) × années,
+    quelle que soit l'orientation retournée pour une requête sur un seul pays.
+    """
+    if not isinstance(data.index, pd.MultiIndex):
+        if data.columns.isin(list(INDICATORS.keys())).any():
+            # Indicateurs en colonnes, années en index
+            data = data.T
+        data = data.copy()
+        data.index = pd.MultiIndex.from_product([[economy], data.index])
+    data.index = data.index.set_names(['economy', 'series'])
+    return data
+
+
+def latest_values(data: pd.DataFrame, mrv: Optional[int] = MRV) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Trouve la valeur non nulle la plus récente de chaque couple (pays, indicateur).
+    
+    Le calcul est fait sur la matrice numpy complète, sans boucle Python. Avec `mrv`,
+    seules les `mrv` années les plus récentes ayant au moins une valeur pour le pays
+    sont prises en compte (même fenêtre que la requête wbgapi mrv=3 par pays).
+    
+    Args:
+        data: DataFrame (economy, series) × années (voir _normalize_frame)
+        mrv: Taille de la fenêtre d'années par pays, None pour tout l'historique
+    
+    Returns:
+        tuple: (valeurs, années) sous forme de deux DataFrames pays × indicateur (NaN si absent)
+    """
+    if data.empty:
+        empty = pd.DataFrame(index=pd.Index([], name='economy'), columns=pd.Index([], name='series'), dtype=float)
+        return empty, empty.copy()
+    
+    years = np.array([int(str(column).replace('YR', '')) for column in data.columns])
+    order = np.argsort(years)
+    years = years[order]
+    values = data.to_numpy(dtype=float)[:, order]
+    present = ~np.isnan(values)
+    
+    if mrv:
+        economy_codes, economies = pd.factorize(data.index.get_level_values('economy'))
+        # Années disponibles par pays, puis rang de chaque année disponible en partant de la plus récente
+        available = np.zeros((len(economies), len(years)), dtype=bool)
+        np.logical_or.at(available, economy_codes, present)
+        rank_from_latest = np.cumsum(available[:, ::-1], axis=1)[:, ::-1]
+        present &= (available & (rank_from_latest <= mrv))[economy_codes]
+    
+    has_value = present.any(axis=1)
+    latest_column = len(years) - 1 - present[:, ::-1].argmax(axis=1)
+    latest = np.where(has_value, values[np.arange(len(values)), latest_column], np.nan)
+    latest_year = np.where(has_value, years[latest_column], np.nan)
+    
+    return (
+        pd.Series(latest, index=data.index).unstack('series'),
+        pd.Series(latest_year, index=data.index).unstack('series'),
+    )
 
 
-def fetch_world_bank_data() -> CountryRisk:
+def _summaries_from_frame(data: pd.DataFrame, names: Dict[str, str]) -> list[CountryRiskSummary]:
     """
-    Récupère les données de la World Bank pour la France et calcule le risque économique.
+    Calcule les résumés de risque de tous les pays présents dans un DataFrame normalisé.
+    Les pays sans aucune valeur pour les indicateurs de risque sont ignorés.
+    """
+    rules = get_rule_table()
+    risk_indicators = rules.risk_indicators
+    values, years = latest_values(data)
+    values = values.reindex(columns=risk_indicators)
+    years = years.reindex(index=values.index, columns=risk_indicators)
+    
+    scores, _ = rules.score(risk_indicators, values.to_numpy())
+    totals = scores.sum(axis=1)
+    risk_levels = rules.overall_level(totals)
+    data_years = years.max(axis=1)
+    keep = data_years.notna().to_numpy()
+    
+    now = datetime.now()
+    return [
+        CountryRiskSummary(
+            country_code=economy,
+            country_name=names.get(economy, economy),
+            overall_score=int(total),
+            risk_level=risk_level,
+            data_year=int(data_year),
+            last_updated=now
+        )
+        for economy, total, risk_level, data_year in zip(values.index[keep], totals[keep], risk_levels[keep], data_years[keep])
+    ]
+
+
+class CountryNotFoundError(LookupError):
+    """Pays inconnu ou sans aucune donnée World Bank"""
+
+
+def _country_name(country_code: str) -> str:
+    """
+    Nom du pays depuis le stockage local, sinon depuis l'API World Bank (le code à défaut si l'API
+    est injoignable).
+    
+    Raises:
+        CountryNotFoundError: code inconnu de la World Bank ou région agrégée
+    """
+    if country_code == COUNTRY_CODE:
+        return COUNTRY_NAME
+    name = get_store().economies().get(country_code)
+    if name:
+        return name
+    try:
+        economy = wb.economy.get(country_code)
+    except wb.APIError:
+        raise CountryNotFoundError(f"Pays inconnu de la World Bank: {country_code}")
+    except Exception:
+        return country_code
+    if economy.get('aggregate'):
+        raise CountryNotFoundError(f"{country_code} est une région agrégée, pas un pays")
+    return economy.get('value') or country_code
+
+
+def fetch_world_bank_data(country_code: str = COUNTRY_CODE, country_name: Optional[str] = None) -> CountryRisk:
+    """
+    Récupère les données de la World Bank pour un pays (la France par défaut) et calcule le risque économique.
+    
+    Args:
+        country_code: Code ISO3 du pays (ex: 'FRA', 'USA')
+        country_name: Nom du pays (stockage local ou API World Bank par défaut)
     
     Returns:
         CountryRisk: Objet contenant tous les indicateurs et le score de risque
+    
+    Raises:
+        CountryNotFoundError: si aucune donnée n'est disponible pour ce pays
     """
+    country_code = country_code.upper()
+    if country_code in EXCLUDED_REGIONS:
+        raise CountryNotFoundError(f"{country_code} est une région agrégée, pas un pays")
     try:
-        # Récupérer les données pour les 5 dernières années disponibles
-        # wbgapi retourne un DataFrame avec les indicateurs en colonnes et les années en index
-        data = wb.data.DataFrame(
-            list(INDICATORS.keys()),
-            COUNTRY_CODE,
-            mrv=3,  # Most Recent Values: 3 dernières années
-            numericTimeKeys=True
-        )
+        country_name = country_name or _country_name(country_code)
+        # Observations du stockage local (synchronisées si absentes ou trop anciennes),
+        # limitées aux 3 dernières années disponibles comme la requête wbgapi mrv=3
+        data = _load_country_observations(country_code, country_name)
+        if data.empty or not data.notna().any(axis=None):
+            raise CountryNotFoundError(f"Aucune donnée World Bank pour le pays {country_code}")
+        available_years = sorted(data.columns[data.notna().any(axis=0)])
+        data = data[available_years[-MRV:]]
+        indicator_codes = list(INDICATORS.keys())
+        values, years = latest_values(data, mrv=None)
+        values = values.reindex(index=[country_code], columns=indicator_codes)
+        years = years.reindex(index=[country_code], columns=indicator_codes)
+        scores, levels = score_values(indicator_codes, values.to_numpy())
+        total_risk_score = int(scores.sum())
+        
+        # Historique : toutes les valeurs non nulles, triées par année (plus récent en premier)
+        observations = data.xs(country_code, level='economy').stack().sort_index(level=1, ascending=False) if not data.empty else pd.Series(dtype=float)
+        history_by_indicator = {code: [] for code in indicator_codes}
+        for (indicator_code, year), value in observations.items():
+            if indicator_code in history_by_indicator:
+                history_by_indicator[indicator_code].append(IndicatorValue(
+                    year=int(str(year).replace('YR', '')),
+                    value=float(value),
+                    indicator_code=indicator_code,
+                    indicator_name=INDICATORS[indicator_code]['name']
+                ))
         
-        # Convertir le DataFrame en format plus facile à manipuler
         indicators_data = []
         risk_scores_list = []
-        total_risk_score = 0
-        
-        for indicator_code, indicator_info in INDICATORS.items():
-            # Extraire les valeurs pour cet indicateur
-            history = []
-            current_value = None
-            current_year = None
+        for column, (indicator_code, indicator_info) in enumerate(INDICATORS.items()):
+            current_value = values.iat[0, column]
+            current_value = None if pd.isna(current_value) else float(current_value)
+            current_year = years.iat[0, column]
+            current_year = None if pd.isna(current_year) else int(current_year)
             
-            # Le DataFrame peut avoir différentes structures selon wbgapi
-            # Essayer d'abord avec indicateurs en colonnes
-            if indicator_code in data.columns:
-                # Parcourir les années disponibles (index du DataFrame)
-                for year in data.index:
-                    try:
-                        value = data.loc[year, indicator_code]
-                        
-                        if pd.notna(value) and not pd.isna(value):
-                            year_int = int(year)
-                            value_float = float(value)
-                            
-                            history.append(IndicatorValue(
-                                year=year_int,
-                                value=value_float,
-                                indicator_code=indicator_code,
-                                indicator_name=indicator_info['name']
-                            ))
-                            
-                            # Garder la valeur la plus récente
-                            if current_year is None or year_int > current_year:
-                                current_value = value_float
-                                current_year = year_int
-                    except (ValueError, KeyError, TypeError):
-                        continue
-            # Si l'indicateur n'est pas dans les colonnes, essayer avec les lignes
-            elif indicator_code in data.index:
-                for year in data.columns:
-                    try:
-                        value = data.loc[indicator_code, year]
-                        
-                        if pd.notna(value) and not pd.isna(value):
-                            year_int = int(year)
-                            value_float = float(value)
-                            
-                            history.append(IndicatorValue(
-                                year=year_int,
-                                value=value_float,
-                                indicator_code=indicator_code,
-                                indicator_name=indicator_info['name']
-                            ))
-                            
-                            if current_year is None or year_int > current_year:
-                                current_value = value_float
-                                current_year = year_int
-                    except (ValueError, KeyError, TypeError):
-                        continue
-            
-            # Trier l'historique par année (plus récent en premier)
-            history.sort(key=lambda x: x.year, reverse=True)
-            
-            # Créer l'objet EconomicIndicator
-            indicator = EconomicIndicator(
+            indicators_data.append(EconomicIndicator(
                 code=indicator_code,
                 name=indicator_info['name'],
                 unit=indicator_info['unit'],
                 current_value=current_value,
                 current_year=current_year,
-                history=history
-            )
-            indicators_data.append(indicator)
-            
-            # Calculer le score de risque pour cet indicateur
-            score, level = calculate_risk_score(indicator_code, current_value)
-            total_risk_score += score
-            
+                history=history_by_indicator[indicator_code]
+            ))
             risk_scores_list.append(RiskScore(
                 indicator_code=indicator_code,
                 indicator_name=indicator_info['name'],
-                score=score,
-                level=level,
+                score=int(scores[0, column]),
+                level=levels[0, column],
                 value=current_value
             ))
         
         # Créer l'objet CountryRisk
         country_risk = CountryRisk(
-            country_code=COUNTRY_CODE,
-            country_name=COUNTRY_NAME,
+            country_code=country_code,
+            country_name=country_name,
             overall_score=total_risk_score,
             risk_level=get_risk_level(total_risk_score),
             indicators=indicators_data,
@@ -268,117 +362,328 @@ def fetch_world_bank_data() -> CountryRisk:
         
         return country_risk
         
+    except CountryNotFoundError:
+        raise
     except Exception as e:
         # En cas d'erreur, retourner une structure vide avec erreur
         raise Exception(f"Erreur lors de la récupération des données World Bank: {str(e)}")
 
 
-def fetch_world_bank_data_for_country(country_code: str, country_name: str, target_year: Optional[int] = None) -> Optional[CountryRiskSummary]:
+# Cache par pays (lecture traversante) : les routes /risk/{country_code} et /history
+# partagent le même CountryRisk, recalculé seulement après expiration ou changement des règles
+COUNTRY_CACHE_SIZE = int(os.getenv("COUNTRY_CACHE_SIZE", "256"))
+COUNTRY_CACHE_TTL_SECONDS = float(os.getenv("COUNTRY_CACHE_TTL_SECONDS", "3600"))
+_country_cache = TTLCache(COUNTRY_CACHE_SIZE, COUNTRY_CACHE_TTL_SECONDS)
+
+
+def _country_cache_key(country_code: str) -> tuple:
+    return (country_code.upper(), get_rule_table().version)
+
+
+def is_country_cached(country_code: str) -> bool:
+    """True si le risque de ce pays est en cache (servi sans appel réseau)."""
+    return _country_cache_key(country_code) in _country_cache
+
+
+def get_country_risk(country_code: str) -> CountryRisk:
+    """Retourne le risque d'un pays depuis le cache par pays, calculé au premier appel ou après expiration."""
+    country_code = country_code.upper()
+    return _country_cache.get_or_load(
+        _country_cache_key(country_code),
+        lambda: fetch_world_bank_data(country_code)
+    )
+
+
+def _fetch_country_frame(country_code: str) -> pd.DataFrame:
+    """Récupère les indicateurs d'un pays (mrv=3). Lève une exception en cas d'erreur réseau."""
+    # Récupérer les données les plus récentes disponibles (mrv=3 pour avoir plusieurs années)
+    # Ne pas forcer l'année 2025 car les données ne sont pas encore disponibles
+    # #region agent log
+    _log_debug('debug-session', 'run1', 'B', 'worldbank.py:264', 'Before wb.data.DataFrame call', {'country_code': country_code, 'mrv': MRV})
+    # #endregion
+    data = wb.data.DataFrame(
+        list(INDICATORS.keys()),
+        country_code,
+        mrv=MRV,
+        numericTimeKeys=True
+    )
+    # #region agent log
+    _log_debug('debug-session', 'run1', 'B', 'worldbank.py:270', 'After wb.data.DataFrame call', {'country_code': country_code, 'data_shape': str(data.shape) if hasattr(data, 'shape') else 'no_shape'})
+    # #endregion
+    return data
+
+
+def _list_countries() -> list[dict]:
+    """Retourne la liste des pays World Bank (code ISO3 et nom), sans les régions agrégées."""
+    countries_list = []
+    # wb.economy.list() retourne tous les pays avec leurs codes
+    for country in wb.economy.list():
+        country_id = country.get('id', '')
+        if country_id and len(country_id) == 3 and country_id not in EXCLUDED_REGIONS:
+            countries_list.append({
+                'code': country_id,
+                'name': country.get('value', '')
+            })
+    return countries_list
+
+
+def _fetch_bulk_frame(economies: list[str], indicator_codes: Optional[list[str]] = None, start_year: Optional[int] = None) -> pd.DataFrame:
     """
-    Récupère les données de la World Bank pour un pays spécifique et calcule le score de risque.
+    Récupère des indicateurs pour un groupe d'économies en une seule requête wbgapi.
     
     Args:
-        country_code: Code ISO du pays (ex: 'FRA', 'USA')
-        country_name: Nom du pays
-        target_year: Année cible (2025 par défaut, sinon utilise les données les plus récentes)
+        economies: Codes ISO3 des pays
+        indicator_codes: Indicateurs à récupérer (tous les INDICATORS par défaut)
+        start_year: Première année demandée (BULK_LOOKBACK_YEARS ans d'historique par défaut)
     
     Returns:
-        CountryRiskSummary: Résumé du risque économique du pays, ou None si erreur
+        DataFrame indexé par (economy, series) avec les années en colonnes
     """
-    # #region agent log
-    _log_debug('debug-session', 'run1', 'B', 'worldbank.py:261', 'fetch_world_bank_data_for_country entry', {'country_code': country_code, 'country_name': country_name, 'target_year': target_year})
-    # #endregion
+    current_year = datetime.now().year
+    if start_year is None:
+        start_year = current_year - BULK_LOOKBACK_YEARS
+    data = wb.data.DataFrame(
+        indicator_codes or list(INDICATORS.keys()),
+        economies,
+        time=range(start_year, current_year + 1),
+        index=['economy', 'series'],
+        columns='time',
+        numericTimeKeys=True
+    )
+    # Axes imposés : sinon wbgapi retire ceux qui n'ont qu'une valeur (une seule économie
+    # ou un seul indicateur) et l'index ne dit plus à quel pays ou indicateur appartient chaque ligne
+    return _normalize_frame(data)
+
+
+def _source_last_updated() -> Optional[str]:
+    """Date de dernière mise à jour de la source WDI côté World Bank (None si indisponible)."""
     try:
-        # Récupérer les données les plus récentes disponibles (mrv=3 pour avoir plusieurs années)
-        # Ne pas forcer l'année 2025 car les données ne sont pas encore disponibles
-        mrv = 3
-        # #region agent log
-        _log_debug('debug-session', 'run1', 'B', 'worldbank.py:264', 'Before wb.data.DataFrame call', {'country_code': country_code, 'mrv': mrv})
-        # #endregion
-        data = wb.data.DataFrame(
-            list(INDICATORS.keys()),
-            country_code,
-            mrv=mrv,
-            numericTimeKeys=True
-        )
-        # #region agent log
-        _log_debug('debug-session', 'run1', 'B', 'worldbank.py:270', 'After wb.data.DataFrame call', {'country_code': country_code, 'data_shape': str(data.shape) if hasattr(data, 'shape') else 'no_shape'})
-        # #endregion
-        
-        total_risk_score = 0
-        data_year = None
-        
-        # Indicateurs de risque clés à utiliser pour le calcul
-        risk_indicators = ['NY.GDP.MKTP.KD.ZG', 'FP.CPI.TOTL.ZG', 'SL.UEM.TOTL.ZS', 'BN.CAB.XOKA.GD.ZS']
-        
-        for indicator_code in risk_indicators:
-            current_value = None
-            current_year = None
-            
-            # Extraire la valeur la plus récente pour cet indicateur (ignorer target_year car données pas disponibles)
-            if indicator_code in data.columns:
-                for year in data.index:
-                    try:
-                        value = data.loc[year, indicator_code]
-                        if pd.notna(value) and not pd.isna(value):
-                            year_int = int(year)
-                            value_float = float(value)
-                            
-                            # Utiliser la valeur la plus récente disponible
-                            if current_year is None or year_int > current_year:
-                                current_value = value_float
-                                current_year = year_int
-                    except (ValueError, KeyError, TypeError):
-                        continue
-            elif indicator_code in data.index:
-                for year in data.columns:
-                    try:
-                        value = data.loc[indicator_code, year]
-                        if pd.notna(value) and not pd.isna(value):
-                            year_int = int(year)
-                            value_float = float(value)
-                            
-                            # Utiliser la valeur la plus récente disponible
-                            if current_year is None or year_int > current_year:
-                                current_value = value_float
-                                current_year = year_int
-                    except (ValueError, KeyError, TypeError):
-                        continue
-            
-            # Calculer le score de risque pour cet indicateur
-            score, _ = calculate_risk_score(indicator_code, current_value)
-            total_risk_score += score
-            
-            # Garder l'année la plus récente trouvée
-            if current_year and (data_year is None or current_year > data_year):
-                data_year = current_year
+        return str(wb.source.get(WDI_SOURCE_ID).get('lastupdated'))
+    except Exception:
+        return None
+
+
+def _sync_individually(store: ObservationStore, economies: list[str]) -> tuple[int, list[str]]:
+    """
+    Synchronise des pays un par un via le moteur concurrent (repli quand la requête groupée échoue).
+    Seuls les pays récupérés sont marqués synchronisés : les autres seront retentés à la prochaine synchronisation.
+    
+    Returns:
+        tuple: (lignes modifiées, codes des pays en échec)
+    """
+    report = run_concurrent({
+        code: (lambda code=code: store.upsert_frame(_normalize_frame(_fetch_country_frame(code), code)))
+        for code in economies
+    })
+    store.mark_synced([code for code in economies if code in report.results])
+    failed = sorted(report.errors)
+    if failed:
+        logger.warning(f"⚠️  [WORLD BANK] Repli pays par pays: {len(failed)} pays en échec ({report.summary()}): "
+                       + ", ".join(f"{code} ({report.errors[code]})" for code in failed))
+    return sum(report.results.values()), failed
+
+
+def sync_observations(full: bool = False) -> Dict[str, object]:
+    """
+    Synchronise le stockage local des observations avec l'API World Bank.
+    
+    Seul ce qui a pu changer depuis la dernière synchronisation est téléchargé :
+    - rien si la source WDI n'a pas été mise à jour depuis (date `lastupdated`),
+    - l'historique complet des nouveaux pays et des nouveaux indicateurs,
+    - sinon les SYNC_REVISION_YEARS dernières années, où se concentrent les révisions.
+    
+    Args:
+        full: Si True, re-télécharge tout l'historique de tous les pays
+    
+    Returns:
+        dict: Statistiques de la synchronisation (requêtes, lignes modifiées, durée)
+    """
+    store = get_store()
+    started = datetime.now()
+    indicator_codes = list(INDICATORS.keys())
+    current_year = datetime.now().year
+    full_start = current_year - BULK_LOOKBACK_YEARS
+    
+    source_updated = _source_last_updated()
+    source_unchanged = (not full and source_updated is not None
+                        and source_updated == store.get_state('source_last_updated'))
+    
+    economies = store.economies()
+    if not economies or not source_unchanged:
+        store.set_economies({country['code']: country['name'] for country in _list_countries()})
+        economies = store.economies()
+    
+    # Plan de synchronisation : (pays, indicateurs, première année)
+    new_economies = set(store.unsynced_economies())
+    max_year = store.max_year()
+    plan = []
+    if full or max_year is None:
+        plan.append((list(economies), indicator_codes, full_start))
+    else:
+        known = [code for code in economies if code not in new_economies]
+        stored_indicators = set(store.indicators())
+        missing_indicators = [code for code in indicator_codes if code not in stored_indicators]
+        if new_economies:
+            plan.append((sorted(new_economies), indicator_codes, full_start))
+        if known and missing_indicators:
+            plan.append((known, missing_indicators, full_start))
+        if known and not source_unchanged:
+            revision_indicators = [code for code in indicator_codes if code in stored_indicators]
+            plan.append((known, revision_indicators, max(full_start, max_year - SYNC_REVISION_YEARS)))
+    
+    requests_count = 0
+    changed = 0
+    fallback = []
+    failed = []
+    for plan_economies, plan_indicators, start_year in plan:
+        if REFRESH_MODE == "per_country":
+            fallback.extend(plan_economies)
+            continue
+        for chunk_start in range(0, len(plan_economies), BULK_CHUNK_SIZE):
+            chunk = plan_economies[chunk_start:chunk_start + BULK_CHUNK_SIZE]
+            requests_count += 1
+            try:
+                changed += store.upsert_frame(_fetch_bulk_frame(chunk, plan_indicators, start_year))
+                store.mark_synced(chunk)
+            except Exception as chunk_error:
+                # Si la requête groupée échoue, ce groupe sera récupéré pays par pays
+                logger.warning(f"⚠️  [WORLD BANK] Requête groupée en échec ({len(chunk)} pays): {chunk_error} - repli pays par pays")
+                fallback.extend(chunk)
+    
+    if fallback:
+        fallback = sorted(set(fallback))
+        requests_count += len(fallback)
+        fallback_changed, failed = _sync_individually(store, fallback)
+        changed += fallback_changed
+    
+    if source_updated is not None and not store.unsynced_economies():
+        store.set_state('source_last_updated', source_updated)
+    store.set_state('last_sync', datetime.now().isoformat())
+    
+    stats = {
+        "requests": requests_count,
+        "changed_rows": changed,
+        "economies": len(economies),
+        "failed_economies": failed,
+        "source_unchanged": source_unchanged,
+        "elapsed_seconds": round((datetime.now() - started).total_seconds(), 3),
+    }
+    logger.info(f"🔄 [WORLD BANK] Synchronisation des observations: {stats}")
+    return stats
+
+
+def _store_is_fresh() -> bool:
+    """True si le stockage local a été synchronisé depuis moins de CACHE_VALIDITY_HOURS."""
+    last_sync = get_store().get_state('last_sync')
+    if not last_sync:
+        return False
+    return (datetime.now() - datetime.fromisoformat(last_sync)).total_seconds() < CACHE_VALIDITY_HOURS * 3600
+
+
+def _load_country_observations(country_code: str, country_name: str) -> pd.DataFrame:
+    """
+    Retourne les observations d'un pays depuis le stockage local. Si le pays n'a jamais été
+    synchronisé ou l'a été il y a plus de CACHE_VALIDITY_HOURS, il est d'abord récupéré (mrv=3),
+    sans entrer dans la liste des pays classés par all-countries (celle de _list_countries).
+    """
+    store = get_store()
+    synced_at = store.synced_at(country_code)
+    if synced_at is None or (datetime.now() - synced_at).total_seconds() > CACHE_VALIDITY_HOURS * 3600:
+        data = _normalize_frame(_fetch_country_frame(country_code), country_code)
+        store.upsert_frame(data)
+        store.mark_fetched(country_code)
+    return store.load_frame(economies=[country_code], indicators=INDICATORS.keys())
+
+
+def rescore_all_countries(target_year: int) -> AllCountriesRisk:
+    """
+    Recalcule les scores de tous les pays à partir du stockage local, sans appel réseau,
+    et met à jour le cache (utile après une modification des règles de score).
+    """
+    store = get_store()
+    # Les régions agrégées enregistrées par une version antérieure restent hors du classement
+    names = {code: name for code, name in store.economies().items() if code not in EXCLUDED_REGIONS}
+    data = store.load_frame(economies=names.keys(), indicators=INDICATORS.keys())
+    country_risks = _summaries_from_frame(data, names)
+    
+    # Trier par score de risque (du plus risqué au moins risqué), puis par code pays
+    country_risks.sort(key=lambda x: (-x.overall_score, x.country_code))
+    
+    result = AllCountriesRisk(
+        countries=country_risks,
+        total_countries=len(country_risks),
+        last_updated=datetime.now()
+    )
+    _save_cache(target_year, result)
+    try:
+        record_worldbank_snapshot(result)
+    except Exception as e:
+        logger.warning(f"⚠️ [ARCHIVE] Archivage de l'instantané World Bank impossible: {e}")
+    return result
+
+
+class CacheSnapshot(NamedTuple):
+    """Entrée du cache JSON déjà reconstruite en objets, pour une année cible"""
+    data: AllCountriesRisk
+    rules_version: Optional[str]
+    version: str  # Identifiant du snapshot (change à chaque nouvelle sauvegarde)
+
+
+# Snapshots en mémoire par année cible, associés à l'état du fichier (mtime, taille) lors de la lecture
+_snapshots: Dict[int, tuple[tuple, Optional[CacheSnapshot]]] = {}
+
+
+def _cache_file_key() -> Optional[tuple]:
+    try:
+        stat = CACHE_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _snapshot_version(target_year: int, last_updated: datetime, rules_version: Optional[str]) -> str:
+    return f"{target_year}-{int(last_updated.timestamp() * 1000)}-{rules_version or 'none'}"
+
+
+def _read_snapshot(target_year: int) -> Optional[CacheSnapshot]:
+    """
+    Retourne le snapshot de l'année cible. Le fichier JSON n'est relu et les objets
+    Pydantic reconstruits que si le fichier a changé depuis la dernière lecture.
+    """
+    file_key = _cache_file_key()
+    if file_key is None:
+        return None
+    cached = _snapshots.get(target_year)
+    if cached and cached[0] == file_key:
+        return cached[1]
+    
+    with open(CACHE_FILE, 'r') as f:
+        cache_data = json.load(f)
+    
+    snapshot = None
+    cached_entry = cache_data.get(str(target_year))
+    if cached_entry is not None:
+        cached_date = datetime.fromisoformat(cached_entry.get("last_updated", ""))
         
-        # Si aucune donnée trouvée, retourner None
-        if data_year is None:
-            # #region agent log
-            _log_debug('debug-session', 'run1', 'B', 'worldbank.py:328', 'No data found for country', {'country_code': country_code})
-            # #endregion
-            return None
+        # Reconstruire l'objet AllCountriesRisk depuis le cache
+        countries = []
+        for country_data in cached_entry.get("countries", []):
+            # Convertir la date ISO en datetime
+            country_data['last_updated'] = datetime.fromisoformat(country_data['last_updated'])
+            countries.append(CountryRiskSummary(**country_data))
         
-        result = CountryRiskSummary(
-            country_code=country_code,
-            country_name=country_name,
-            overall_score=total_risk_score,
-            risk_level=get_risk_level(total_risk_score),
-            data_year=data_year,
-            last_updated=datetime.now()
+        rules_version = cached_entry.get("rules_version")
+        snapshot = CacheSnapshot(
+            data=AllCountriesRisk(
+                countries=countries,
+                total_countries=len(countries),
+                last_updated=cached_date
+            ),
+            rules_version=rules_version,
+            version=_snapshot_version(target_year, cached_date, rules_version)
         )
-        # #region agent log
-        _log_debug('debug-session', 'run1', 'B', 'worldbank.py:337', 'fetch_world_bank_data_for_country success', {'country_code': country_code, 'score': total_risk_score})
-        # #endregion
-        return result
-        
-    except Exception as e:
-        # En cas d'erreur, retourner None (pays ignoré)
-        # #region agent log
-        _log_debug('debug-session', 'run1', 'B', 'worldbank.py:341', 'fetch_world_bank_data_for_country error', {'country_code': country_code, 'error': str(e)})
-        # #endregion
-        return None
+    _snapshots[target_year] = (file_key, snapshot)
+    return snapshot
 
 
 def _load_cache(target_year: int, check_validity: bool = True) -> Optional[AllCountriesRisk]:
@@ -392,42 +697,30 @@ def _load_cache(target_year: int, check_validity: bool = True) -> Optional[AllCo
     Returns:
         AllCountriesRisk si le cache existe (et est valide si check_validity=True), None sinon
     """
-    if not CACHE_FILE.exists():
-        return None
-    
     try:
-        with open(CACHE_FILE, 'r') as f:
-            cache_data = json.load(f)
-        
-        cache_key = str(target_year)
-        if cache_key not in cache_data:
+        snapshot = _read_snapshot(target_year)
+        if snapshot is None:
             return None
         
-        cached_entry = cache_data[cache_key]
-        cached_date = datetime.fromisoformat(cached_entry.get("last_updated", ""))
-        
         # Vérifier si le cache est encore valide (seulement si check_validity=True)
         if check_validity:
-            if (datetime.now() - cached_date).total_seconds() > (CACHE_VALIDITY_HOURS * 3600):
+            if (datetime.now() - snapshot.data.last_updated).total_seconds() > (CACHE_VALIDITY_HOURS * 3600):
+                return None
+            # Scores calculés avec d'autres règles : à recalculer
+            if snapshot.rules_version != get_rule_table().version:
                 return None
         
-        # Reconstruire l'objet AllCountriesRisk depuis le cache
-        countries = []
-        for country_data in cached_entry.get("countries", []):
-            # Convertir la date ISO en datetime
-            country_data['last_updated'] = datetime.fromisoformat(country_data['last_updated'])
-            countries.append(CountryRiskSummary(**country_data))
-        
-        return AllCountriesRisk(
-            countries=countries,
-            total_countries=len(countries),
-            last_updated=cached_date
-        )
+        return snapshot.data
     except Exception as e:
         # En cas d'erreur, ignorer le cache
         return None
 
 
+def is_cache_valid(target_year: int) -> bool:
+    """True si le tableau de tous les pays est en cache valide (servi sans appel réseau ni recalcul)."""
+    return _load_cache(target_year, check_validity=True) is not None
+
+
 def _save_cache(target_year: int, data: AllCountriesRisk):
     """Sauvegarde les données dans le cache."""
     try:
@@ -447,6 +740,7 @@ def _save_cache(target_year: int, data: AllCountriesRisk):
         cache_key = str(target_year)
         cache_data[cache_key] = {
             "last_updated": data.last_updated.isoformat(),
+            "rules_version": get_rule_table().version,
             "countries": [
                 {
                     "country_code": c.country_code,
@@ -460,18 +754,114 @@ def _save_cache(target_year: int, data: AllCountriesRisk):
             ]
         }
         
-        # Sauvegarder dans le fichier
-        with open(CACHE_FILE, 'w') as f:
+        # Sauvegarder dans un fichier temporaire puis le renommer : les lecteurs
+        # voient soit l'ancien snapshot, soit le nouveau, jamais un fichier partiel
+        tmp_file = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, 'w') as f:
             json.dump(cache_data, f, indent=2)
+        os.replace(tmp_file, CACHE_FILE)
+        
+        # Le snapshot en mémoire est directement celui qui vient d'être sauvegardé
+        rules_version = cache_data[cache_key]["rules_version"]
+        _snapshots[target_year] = (_cache_file_key(), CacheSnapshot(
+            data=data,
+            rules_version=rules_version,
+            version=_snapshot_version(target_year, data.last_updated, rules_version)
+        ))
     except Exception as e:
         # En cas d'erreur, continuer sans sauvegarder le cache
         pass
 
 
+# Rafraîchissements coalescés par (source de données, année cible) : les appels
+# concurrents (force_refresh répétés, /api/table, arrière-plan) partagent un seul calcul
+_refresh_flight = SingleFlight()
+
+
+def _refresh_key(target_year: int) -> tuple:
+    return ("worldbank", target_year)
+
+
+def is_refreshing(target_year: int) -> bool:
+    """True si un rafraîchissement est en cours pour cette année cible."""
+    return _refresh_flight.in_flight(_refresh_key(target_year))
+
+
+def _refresh_all_countries(target_year: int) -> AllCountriesRisk:
+    """Synchronise le stockage local (seulement ce qui a changé), puis recalcule tous les pays."""
+    try:
+        if sync_observations()["changed_rows"]:
+            _country_cache.invalidate()
+        result = rescore_all_countries(target_year)
+        # #region agent log
+        _log_debug('debug-session', 'run1', 'A', 'worldbank.py:393', 'fetch_all_countries_risk success', {'total_countries': result.total_countries})
+        # #endregion
+        logger.info(f"💾 [CACHE] Données sauvegardées dans le cache - {result.total_countries} pays (valide pendant {CACHE_VALIDITY_HOURS}h)")
+        return result
+    except Exception as e:
+        # #region agent log
+        _log_debug('debug-session', 'run1', 'B', 'worldbank.py:397', 'fetch_all_countries_risk error', {'error': str(e), 'error_type': type(e).__name__})
+        # #endregion
+        raise Exception(f"Erreur lors de la récupération des données pour tous les pays: {str(e)}")
+
+
+def refresh_all_countries(target_year: int) -> AllCountriesRisk:
+    """Rafraîchit les données de tous les pays, ou attend le rafraîchissement déjà en cours."""
+    key = _refresh_key(target_year)
+    if _refresh_flight.in_flight(key):
+        logger.info(f"⏳ [CACHE] Rafraîchissement déjà en cours (target_year={target_year}) - attente du résultat partagé")
+    return _refresh_flight.do(key, lambda: _refresh_all_countries(target_year))
+
+
+def _background_refresh(target_year: int) -> AllCountriesRisk:
+    try:
+        return _refresh_all_countries(target_year)
+    except Exception as e:
+        # L'erreur est aussi transmise aux appelants qui attendent ce rafraîchissement
+        logger.error(f"❌ [CACHE] Échec du rafraîchissement en arrière-plan: {e}")
+        raise
+
+
+def start_background_refresh(target_year: int) -> bool:
+    """
+    Lance un rafraîchissement en arrière-plan s'il n'y en a pas déjà un pour cette année cible.
+    Le nouveau snapshot remplace l'ancien d'un coup à la fin (voir _save_cache).
+    
+    Returns:
+        bool: True si un rafraîchissement a été lancé par cet appel
+    """
+    started = _refresh_flight.do_in_background(
+        _refresh_key(target_year),
+        lambda: _background_refresh(target_year),
+        name=f"wb-refresh-{target_year}"
+    )
+    if started:
+        logger.info(f"🔄 [CACHE] Rafraîchissement en arrière-plan lancé (target_year={target_year})")
+    return started
+
+
+def _with_freshness(data: AllCountriesRisk, target_year: int) -> AllCountriesRisk:
+    """
+    Ajoute l'état du rafraîchissement à la réponse. L'âge des données n'y figure pas : il change
+    à chaque seconde, les routes l'envoient dans l'en-tête X-Data-Age calculé à chaque requête.
+    """
+    return data.model_copy(update={"refreshing": is_refreshing(target_year)})
+
+
+def data_version(data: AllCountriesRisk, target_year: int) -> str:
+    """
+    Version des données all-countries servies : change avec le snapshot (date, règles de score)
+    et l'état du rafraîchissement, donc à chaque fois que le contenu de la réponse change.
+    """
+    version = _snapshot_version(target_year, data.last_updated, get_rule_table().version)
+    return f"{version}-refreshing" if data.refreshing else version
+
+
 def fetch_all_countries_risk(target_year: Optional[int] = 2025, force_refresh: bool = False) -> AllCountriesRisk:
     """
     Récupère les données de risque pour tous les pays du monde.
-    Utilise un cache pour éviter de recharger les données à chaque fois.
+    Utilise un cache pour éviter de recharger les données à chaque fois. Quand le cache a
+    expiré, il est servi immédiatement et un rafraîchissement est lancé en arrière-plan.
     
     Args:
         target_year: Année cible pour les données (2025 par défaut)
@@ -492,116 +882,26 @@ def fetch_all_countries_risk(target_year: Optional[int] = 2025, force_refresh: b
             # #region agent log
             _log_debug('debug-session', 'run1', 'A', 'worldbank.py:358', 'Cache hit', {'target_year': target_year, 'countries_count': len(cached_data.countries)})
             # #endregion
-            import logging
-            logger = logging.getLogger(__name__)
             logger.info(f"✅ [CACHE] Données récupérées depuis le cache - {len(cached_data.countries)} pays (cache valide jusqu'à {cached_data.last_updated + timedelta(hours=CACHE_VALIDITY_HOURS)})")
-            return cached_data
+            return _with_freshness(cached_data, target_year)
+        
+        # Si le stockage local est à jour (ex: règles de score modifiées, cache supprimé),
+        # recalculer depuis celui-ci sans appel réseau
+        if _store_is_fresh():
+            logger.info("♻️  [CACHE] Recalcul des scores depuis le stockage local des observations")
+            return _with_freshness(rescore_all_countries(target_year), target_year)
         
-        # Si le cache n'est pas valide mais existe, le charger quand même (même s'il est expiré)
+        # Stale-while-revalidate : servir immédiatement le cache expiré et lancer
+        # un seul rafraîchissement en arrière-plan
         cached_data = _load_cache(target_year, check_validity=False)
         if cached_data:
             # #region agent log
             _log_debug('debug-session', 'run1', 'A', 'worldbank.py:365', 'Cache hit (expired)', {'target_year': target_year, 'countries_count': len(cached_data.countries)})
             # #endregion
-            import logging
-            logger = logging.getLogger(__name__)
             age_hours = (datetime.now() - cached_data.last_updated).total_seconds() / 3600
-            logger.warning(f"⚠️  [CACHE] Données récupérées depuis le cache expiré - {len(cached_data.countries)} pays (cache vieux de {age_hours:.1f}h, mais utilisé quand même)")
-            return cached_data
+            logger.warning(f"⚠️  [CACHE] Données récupérées depuis le cache expiré - {len(cached_data.countries)} pays (cache vieux de {age_hours:.1f}h, rafraîchissement en arrière-plan)")
+            start_background_refresh(target_year)
+            return _with_freshness(cached_data, target_year)
     
-    try:
-        # Obtenir la liste de tous les pays depuis World Bank
-        # wb.economy.list() retourne tous les pays avec leurs codes
-        countries_list = []
-        
-        # #region agent log
-        _log_debug('debug-session', 'run1', 'E', 'worldbank.py:360', 'Before wb.economy.list() call', {})
-        # #endregion
-        # Récupérer tous les pays (exclure les régions agrégées)
-        excluded_regions = {
-            'WLD', 'OED', 'EAS', 'ECS', 'LCN', 'MEA', 'NAC', 'SAS', 'SSF',
-            'AFE', 'AFW', 'ARB', 'CEB', 'EAP', 'ECA', 'EMU', 'EUU', 'FCS',
-            'HIC', 'HPC', 'IBD', 'IBT', 'IDA', 'IDB', 'IDX', 'LAC', 'LDC',
-            'LIC', 'LMC', 'LMY', 'MIC', 'MNA', 'OEC', 'OSS', 'PRE', 'PSS',
-            'PST', 'SST', 'TEA', 'TEC', 'TLA', 'TMN', 'TSA', 'TSS', 'UMC',
-            'WLD', 'XKX'
-        }
-        for country in wb.economy.list():
-            # Filtrer les pays (exclure les régions agrégées)
-            country_id = country.get('id', '')
-            if country_id and len(country_id) == 3 and country_id not in excluded_regions:
-                countries_list.append({
-                    'code': country_id,
-                    'name': country.get('value', '')
-                })
-        # #region agent log
-        _log_debug('debug-session', 'run1', 'A', 'worldbank.py:367', 'After wb.economy.list(), countries collected', {'total_countries': len(countries_list)})
-        # #endregion
-        
-        # Récupérer les données pour chaque pays en batch de 5
-        country_risks = []
-        processed_count = 0
-        batch_size = 5
-        
-        # Traiter les pays par batch de 5 pour éviter de surcharger l'API
-        for batch_start in range(0, len(countries_list), batch_size):
-            batch = countries_list[batch_start:batch_start + batch_size]
-            
-            # #region agent log
-            _log_debug('debug-session', 'run1', 'A', 'worldbank.py:372', 'Processing batch', {
-                'batch_start': batch_start,
-                'batch_size': len(batch),
-                'total': len(countries_list),
-                'processed_so_far': processed_count
-            })
-            # #endregion
-            
-            # Traiter chaque pays du batch
-            for country_info in batch:
-                risk_summary = fetch_world_bank_data_for_country(
-                    country_info['code'],
-                    country_info['name'],
-                    target_year
-                )
-                processed_count += 1
-                if risk_summary:
-                    country_risks.append(risk_summary)
-            
-            # #region agent log
-            if batch_start % 50 == 0:  # Log every 50 countries
-                _log_debug('debug-session', 'run1', 'A', 'worldbank.py:380', 'Progress update', {
-                    'processed': processed_count,
-                    'successful': len(country_risks),
-                    'total': len(countries_list)
-                })
-            # #endregion
-        
-        # #region agent log
-        _log_debug('debug-session', 'run1', 'A', 'worldbank.py:384', 'All countries processed', {'total_processed': processed_count, 'successful': len(country_risks)})
-        # #endregion
-        # Trier par score de risque (du plus risqué au moins risqué)
-        country_risks.sort(key=lambda x: x.overall_score, reverse=True)
-        
-        result = AllCountriesRisk(
-            countries=country_risks,
-            total_countries=len(country_risks),
-            last_updated=datetime.now()
-        )
-        
-        # Sauvegarder dans le cache
-        _save_cache(target_year, result)
-        
-        # #region agent log
-        _log_debug('debug-session', 'run1', 'A', 'worldbank.py:393', 'fetch_all_countries_risk success', {'total_countries': len(country_risks)})
-        # #endregion
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"💾 [CACHE] Données sauvegardées dans le cache - {len(country_risks)} pays (valide pendant {CACHE_VALIDITY_HOURS}h)")
-        return result
-        
-    except Exception as e:
-        # #region agent log
-        _log_debug('debug-session', 'run1', 'B', 'worldbank.py:397', 'fetch_all_countries_risk error', {'error': str(e), 'error_type': type(e).__name__})
-        # #endregion
-        raise Exception(f"Erreur lors de la récupération des données pour tous les pays: {str(e)}")
+    return _with_freshness(refresh_all_countries(target_year), target_year)
 
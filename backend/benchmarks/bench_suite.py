@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Benchmarks des chemins critiques de l'API de risque.
+
+Mesure dans le processus, sans réseau (World Bank, NewsAPI, RSS et Gemini sont remplacés
+par des données synthétiques) :
+- la construction des tableaux statiques (chargement du fichier, matérialisation d'une semaine)
+  et leur lecture en cache (get_simple_risk_data, get_weekly_risk_data),
+- la lecture et l'écriture du cache all-countries (_load_cache, _save_cache),
+- le calcul vectorisé des scores (score_values, _summaries_from_frame),
+- la latence de chaque route de app/api/routes.py via le client de test FastAPI (httpx requis),
+  dont /api/table/weekly à froid (caches vidés avant chaque appel).
+
+    python benchmarks/bench_suite.py --output bench_results.json
+    python benchmarks/bench_suite.py --update-baseline      # enregistre la référence
+    python benchmarks/bench_suite.py --tolerance 0.3        # échoue au-delà de +30 %
+
+Les résultats sont comparés à benchmarks/baseline.json : le code de sortie est non nul si
+une mesure (--metric, par défaut le meilleur temps min_ms, le moins sensible aux
+interférences de la machine) dépasse la référence de plus de --tolerance et de plus de
+--min-delta-ms (2 ms par défaut : sur les routes de 1 à 3 ms, le bruit de la machine dépasse
++50 % d'un lancement à l'autre). Chaque mesure est précédée de WARMUP_ROUNDS exécutions, et
+les routes d'un tour de chauffe complet, pour ne pas chronométrer le démarrage du processus.
+"""
+import argparse
+import atexit
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from unittest import mock
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+# Fichiers de travail isolés : le stockage SQLite est ouvert au premier import de l'application
+WORK_DIR = Path(tempfile.mkdtemp(prefix="riskindex-bench-"))
+atexit.register(shutil.rmtree, WORK_DIR, ignore_errors=True)
+os.environ["WB_STORE_PATH"] = str(WORK_DIR / "observations.sqlite3")
+os.environ["WEEKLY_ARCHIVE_PATH"] = str(WORK_DIR / "weekly_archive.sqlite3")
+sys.path.insert(0, str(BENCH_DIR.parent))
+# Journaux de l'application sur stderr (app.main les envoie sur stdout) : stdout ne porte que le rapport JSON
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", stream=sys.stderr)
+
+import numpy as np
+import pandas as pd
+
+from app.models.news import GeopoliticalAnalysis, NewsArticle, RiskScore, RiskScores
+from app.services import geopolitical_analyzer, table_diff, weekly_risk_data, worldbank
+from app.services.response_cache import response_cache
+from app.services.scoring_rules import get_rule_table
+from app.services.simple_risk_data import SIMPLE_RISK_DATASET, get_simple_risk_data
+from app.services.table_index import ALL_COUNTRIES_SPEC, TableIndex, TableQuery
+from app.services.week_calendar import DEFAULT_WEEK_LABEL, IsoWeek, parse_week
+from app.services.weekly_risk_data import get_weekly_risk_data
+
+SYNTHETIC_COUNTRIES = 217  # Nombre d'économies retournées par wb.economy.list() hors régions
+SYNTHETIC_YEARS = 11
+
+# Plages de valeurs plausibles par indicateur pour les données synthétiques
+_VALUE_RANGES = {
+    'NY.GDP.MKTP.KD.ZG': (-8, 10),
+    'FP.CPI.TOTL.ZG': (-1, 30),
+    'SL.UEM.TOTL.ZS': (1, 30),
+    'BN.CAB.XOKA.GD.ZS': (-15, 15),
+}
+
+
+# --- Amont synthétique ---
+
+def synthetic_countries(count: int = SYNTHETIC_COUNTRIES) -> List[dict]:
+    countries = [{'code': worldbank.COUNTRY_CODE, 'name': worldbank.COUNTRY_NAME}]
+    for i in range(count - 1):
+        code = f"{chr(65 + i // 26 % 26)}{chr(65 + i % 26)}Z"
+        countries.append({'code': code, 'name': f"Pays {code}"})
+    return countries
+
+
+def synthetic_frame(economies: List[str], indicator_codes: Optional[List[str]] = None,
+                    start_year: Optional[int] = None, seed: int = 0) -> pd.DataFrame:
+    """DataFrame (economy, series) × années comme celui d'une requête wbgapi groupée, avec ~15 % de trous."""
+    indicator_codes = indicator_codes or list(worldbank.INDICATORS.keys())
+    current_year = datetime.now().year
+    years = list(range(start_year or current_year - SYNTHETIC_YEARS + 1, current_year + 1))
+    rng = np.random.default_rng(seed)
+    index = pd.MultiIndex.from_product([economies, indicator_codes], names=['economy', 'series'])
+    low = np.array([_VALUE_RANGES.get(code, (0, 1000))[0] for code in indicator_codes] * len(economies))
+    high = np.array([_VALUE_RANGES.get(code, (0, 1000))[1] for code in indicator_codes] * len(economies))
+    values = rng.uniform(low[:, None], high[:, None], size=(len(index), len(years)))
+    values[rng.random(values.shape) < 0.15] = np.nan
+    values[:, -1] = np.nan  # Année en cours pas encore publiée
+    return pd.DataFrame(values, index=index, columns=years)
+
+
+def _synthetic_articles() -> List[NewsArticle]:
+    week_start = IsoWeek.current().start
+    return [
+        NewsArticle(
+            title=f"Article {i}",
+            source="Bench",
+            published_at=week_start + timedelta(hours=i),
+            description="Description de l'article " * 5,
+            url=f"https://example.org/{i}",
+        )
+        for i in range(40)
+    ]
+
+
+def _synthetic_analysis(articles: List[NewsArticle]) -> GeopoliticalAnalysis:
+    score = RiskScore(score=5, justification="Synthèse de référence")
+    return GeopoliticalAnalysis(
+        executive_summary="Synthèse de référence",
+        key_events=["Événement"] * 5,
+        risk_scores=RiskScores(politique=score, economique=score, securitaire=score, sociale=score),
+        recommendations=["Recommandation"] * 3,
+        scenarios=[],
+        analysis_date=datetime.now(),
+        week_number=IsoWeek.current().key,
+    )
+
+
+def stub_upstreams(stack: ExitStack):
+    """Remplace les appels World Bank, NewsAPI, RSS et Gemini par des données synthétiques."""
+    countries = synthetic_countries()
+    names = {country['code']: country['name'] for country in countries}
+    articles = _synthetic_articles()
+    patches = [
+        mock.patch.object(worldbank, 'CACHE_DIR', WORK_DIR),
+        mock.patch.object(worldbank, 'CACHE_FILE', WORK_DIR / "countries_risk_cache.json"),
+        mock.patch.object(worldbank, '_list_countries', lambda: countries),
+        mock.patch.object(worldbank, '_country_name', lambda code: names.get(code, code)),
+        mock.patch.object(worldbank, '_source_last_updated', lambda: "2025-01-01"),
+        mock.patch.object(worldbank, '_fetch_bulk_frame', synthetic_frame),
+        mock.patch.object(
+            worldbank, '_fetch_country_frame',
+            lambda code: synthetic_frame([code]).loc[code].iloc[:, -worldbank.MRV - 1:-1]
+        ),
+        mock.patch.object(geopolitical_analyzer, 'CACHE_FILE', WORK_DIR / "geopolitical_cache.json"),
+        mock.patch.object(geopolitical_analyzer, 'fetch_newsapi_articles', lambda **kwargs: list(articles)),
+        mock.patch.object(geopolitical_analyzer, 'fetch_all_rss_articles', lambda **kwargs: []),
+        mock.patch.object(geopolitical_analyzer, 'synthesize_articles', _synthetic_analysis),
+    ]
+    for patch in patches:
+        stack.enter_context(patch)
+
+
+# --- Mesure ---
+
+WARMUP_ROUNDS = 5  # Exécutions non chronométrées avant chaque mesure
+
+
+def measure(fn: Callable[[], object], repeat: int, warmup: int = WARMUP_ROUNDS, setup: Optional[Callable[[], None]] = None) -> dict:
+    """Exécute `fn` `repeat` fois (après `warmup` exécutions) et retourne les statistiques en ms."""
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(0.95 * len(samples)))], 4),
+        "min_ms": round(samples[0], 4),
+        "runs": repeat,
+    }
+
+
+def _route_benchmarks(repeat: int) -> Dict[str, dict]:
+    try:
+        from fastapi.testclient import TestClient
+    except (ImportError, RuntimeError) as e:
+        print(f"⚠️  Benchmarks des routes ignorés (client de test indisponible: {e})", file=sys.stderr)
+        return {}
+    from app.main import app
+
+    routes = {
+        "route.risk_france": "/api/risk/france",
+        "route.risk_france_history": "/api/risk/france/history",
+        "route.risk_country": "/api/risk/AAZ",
+        "route.geopolitical_weekly": "/api/geopolitical/south-africa/weekly",
+        "route.geopolitical_articles": "/api/geopolitical/south-africa/articles",
+        "route.all_countries_cached": "/api/risk/all-countries",
+        "route.all_countries_refresh": "/api/risk/all-countries?force_refresh=true",
+        "route.simple_all_countries": "/api/risk/simple/all-countries",
+        "route.table": "/api/table",
+        "route.table_weekly": "/api/table/weekly",
+        "route.table_joined": "/api/table/joined",
+        "route.table_weekly_country": "/api/table/weekly/FRA",
+        "route.table_weekly_batch": "/api/table/weekly/batch?countries=France,USA,Yémen,Japon,Brésil",
+        "route.all_countries_top_high": "/api/risk/all-countries?risk_level=high,critical&sort=-overall_score&limit=10",
+        "route.table_weekly_page": "/api/table/weekly?sort=country_name&offset=20&limit=20",
+        # Semaine en cours archivée ci-dessous : 12 semaines lues dans l'archive
+        "route.table_weekly_history": f"/api/table/weekly/BRA/history?weeks=12&until={IsoWeek.current().key}",
+        # Différence avec la semaine précédente, archivée ci-dessous
+        "route.table_diff_simple": "/api/table/diff/simple",
+        "route.table_weekly_ndjson": "/api/table/weekly?format=ndjson",
+    }
+    results = {}
+    with TestClient(app) as client:
+        table_diff.record_simple_snapshot(IsoWeek.current().shift(-1))
+        weekly_risk_data.get_weekly_risk_data(IsoWeek.current().key)
+        # Tour de chauffe de toutes les routes : les premières mesures ne paient pas les premiers appels du processus
+        for _ in range(WARMUP_ROUNDS):
+            for path in routes.values():
+                client.get(path)
+        for name, path in routes.items():
+            def call(path=path):
+                response = client.get(path)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{path} -> {response.status_code}: {response.text[:200]}")
+            results[name] = measure(call, repeat)
+
+        # /api/table/weekly à froid : ni octets encodés ni tableau matérialisé pour la semaine
+        def clear_weekly():
+            response_cache.invalidate()
+            weekly_risk_data.invalidate_weekly_cache()
+
+        def call_weekly():
+            if client.get("/api/table/weekly").status_code != 200:
+                raise RuntimeError("/api/table/weekly en échec")
+        results["route.table_weekly_cold"] = measure(call_weekly, repeat, setup=clear_weekly)
+
+        # Semaine en cours (archivée) en NDJSON à froid : lignes lues par lots dans l'archive, sans matérialiser le tableau
+        def call_weekly_ndjson():
+            if client.get(f"/api/table/weekly?format=ndjson&week_label={IsoWeek.current().key}").status_code != 200:
+                raise RuntimeError("/api/table/weekly?format=ndjson en échec")
+        results["route.table_weekly_ndjson_cold"] = measure(call_weekly_ndjson, repeat, setup=clear_weekly)
+    return results
+
+
+def run_benchmarks(repeat: int) -> Dict[str, dict]:
+    results = {}
+    with ExitStack() as stack:
+        stub_upstreams(stack)
+
+        results["simple_risk_data"] = measure(get_simple_risk_data, repeat)
+        results["simple_risk_data.build"] = measure(SIMPLE_RISK_DATASET.load, repeat)
+        results["weekly_risk_data"] = measure(get_weekly_risk_data, repeat)
+        results["weekly_risk_data.build"] = measure(lambda: weekly_risk_data._build_weekly_risk_table(parse_week(DEFAULT_WEEK_LABEL)), repeat)
+
+        # Scores : matrice pays × indicateurs de risque, puis pipeline complet depuis un DataFrame
+        rules = get_rule_table()
+        economies = [country['code'] for country in synthetic_countries()]
+        frame = synthetic_frame(economies)
+        names = {code: code for code in economies}
+        values = frame.xs(frame.columns[-2], axis=1).unstack('series')[rules.risk_indicators].to_numpy()
+        results["scoring.score_values"] = measure(lambda: worldbank.score_values(rules.risk_indicators, values), repeat)
+        results["scoring.summaries_from_frame"] = measure(lambda: worldbank._summaries_from_frame(frame, names), repeat)
+
+        # Cache all-countries : écriture, lecture depuis le snapshot mémoire, relecture du fichier
+        target_year = 2025
+        data = worldbank.AllCountriesRisk(
+            countries=sorted(worldbank._summaries_from_frame(frame, names), key=lambda c: (-c.overall_score, c.country_code)),
+            total_countries=len(economies),
+            last_updated=datetime.now(),
+        )
+        results["cache.save"] = measure(lambda: worldbank._save_cache(target_year, data), repeat)
+        results["cache.load_warm"] = measure(lambda: worldbank._load_cache(target_year), repeat)
+        results["cache.load_cold"] = measure(
+            lambda: worldbank._load_cache(target_year), repeat,
+            setup=lambda: worldbank._snapshots.clear()
+        )
+
+        # Index triés d'un instantané : construction, puis top-N filtré sans tri
+        results["table_index.build"] = measure(lambda: TableIndex(data, ALL_COUNTRIES_SPEC), repeat)
+        index = TableIndex(data, ALL_COUNTRIES_SPEC)
+        top_high = TableQuery.parse("-overall_score", "high,critical", limit=10).validate(ALL_COUNTRIES_SPEC)
+        results["table_index.top_high"] = measure(lambda: index.page(top_high), repeat)
+
+        results.update(_route_benchmarks(repeat))
+    return results
+
+
+# --- Comparaison avec la référence ---
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float, min_delta_ms: float,
+            metric: str = "min_ms") -> List[dict]:
+    """Retourne les mesures dont la statistique `metric` dépasse la référence au-delà des seuils."""
+    regressions = []
+    for name, stats in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        current, previous = stats[metric], reference[metric]
+        if current > previous * (1 + tolerance) and current - previous > min_delta_ms:
+            regressions.append({
+                "metric": name,
+                "baseline_ms": previous,
+                "current_ms": current,
+                "ratio": round(current / previous, 2) if previous else None,
+            })
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Nombre de mesures par benchmark")
+    parser.add_argument("--output", help="Fichier JSON où écrire les résultats")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Fichier de référence")
+    parser.add_argument("--update-baseline", action="store_true", help="Remplace la référence par ces résultats")
+    parser.add_argument("--metric", default="min_ms", choices=["min_ms", "median_ms", "p95_ms"], help="Statistique comparée à la référence")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Hausse relative tolérée (0.5 = +50 %%)")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="Hausse absolue minimale pour signaler une régression")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.repeat)
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text())["metrics"] if baseline_path.exists() else {}
+    regressions = compare(results, baseline, args.tolerance, args.min_delta_ms, args.metric)
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "metrics": results,
+        "regressions": regressions,
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output)
+
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps({k: v for k, v in report.items() if k != "regressions"}, indent=2) + "\n")
+        print(f"📌 Référence mise à jour: {baseline_path}", file=sys.stderr)
+        return 0
+    if regressions:
+        for regression in regressions:
+            print(f"❌ {regression['metric']}: {regression['baseline_ms']} ms -> {regression['current_ms']} ms", file=sys.stderr)
+        return 1
+    print(f"✅ Aucune régression au-delà de +{args.tolerance:.0%} ({len(results)} mesures)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test de charge : vérifie que /health et les endpoints servis depuis le cache gardent une
+latence faible pendant qu'un rafraîchissement World Bank est en cours.
+
+Lancer le serveur (idéalement branché sur le simulateur local de l'API World Bank avec
+de la latence injectée), puis :
+
+    python benchmarks/load_test.py --base-url http://localhost:8000 --duration 20
+
+Le script démarre un rafraîchissement forcé de /api/risk/all-countries et mesure en
+parallèle la latence des autres endpoints. Il affiche un résumé JSON et retourne un code
+de sortie non nul si le p95 dépasse --max-p95-ms.
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+PROBED_ENDPOINTS = [
+    "/health",
+    "/api/risk/simple/all-countries",
+    "/api/risk/all-countries",
+]
+
+
+def _percentile(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+
+def _probe(base_url: str, path: str, stop: threading.Event, results: dict):
+    session = requests.Session()
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            status = session.get(base_url + path, timeout=30).status_code
+        except requests.RequestException:
+            status = None
+        results[path].append(((time.perf_counter() - start) * 1000, status))
+
+
+def run(base_url: str, duration: float, concurrency: int, target_year: int) -> dict:
+    results = {path: [] for path in PROBED_ENDPOINTS}
+    stop = threading.Event()
+    refresh = {}
+
+    # Préchauffage : s'assurer qu'un snapshot est en cache avant de forcer le rafraîchissement
+    for path in PROBED_ENDPOINTS:
+        requests.get(base_url + path, params={"target_year": target_year} if "all-countries" in path else None, timeout=600)
+
+    def force_refresh():
+        start = time.perf_counter()
+        try:
+            status = requests.get(
+                f"{base_url}/api/risk/all-countries",
+                params={"target_year": target_year, "force_refresh": "true"},
+                timeout=max(duration * 10, 600),
+            ).status_code
+        except requests.RequestException as e:
+            status = str(e)
+        refresh["status"] = status
+        refresh["seconds"] = round(time.perf_counter() - start, 3)
+
+    refresh_thread = threading.Thread(target=force_refresh, daemon=True)
+    refresh_thread.start()
+    time.sleep(0.2)  # Laisser le rafraîchissement démarrer avant de mesurer
+
+    with ThreadPoolExecutor(max_workers=concurrency * len(PROBED_ENDPOINTS)) as pool:
+        for path in PROBED_ENDPOINTS:
+            for _ in range(concurrency):
+                pool.submit(_probe, base_url, path, stop, results)
+        time.sleep(duration)
+        stop.set()
+
+    refresh["completed_during_test"] = not refresh_thread.is_alive()
+    summary = {"refresh": refresh, "endpoints": {}}
+    for path, samples in results.items():
+        latencies = [ms for ms, status in samples if status == 200]
+        summary["endpoints"][path] = {
+            "requests": len(samples),
+            "errors": sum(1 for _, status in samples if status != 200),
+            "p50_ms": round(_percentile(latencies, 0.50) or 0, 2),
+            "p95_ms": round(_percentile(latencies, 0.95) or 0, 2),
+            "max_ms": round(max(latencies) if latencies else 0, 2),
+        }
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--duration", type=float, default=15.0, help="Durée de la mesure (secondes)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Clients simultanés par endpoint")
+    parser.add_argument("--target-year", type=int, default=2025)
+    parser.add_argument("--max-p95-ms", type=float, default=250.0, help="Seuil de p95 pour /health et les endpoints en cache")
+    parser.add_argument("--output", help="Fichier JSON où écrire le résumé")
+    args = parser.parse_args()
+
+    summary = run(args.base_url.rstrip("/"), args.duration, args.concurrency, args.target_year)
+    output = json.dumps(summary, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+
+    failures = [
+        path for path, stats in summary["endpoints"].items()
+        if stats["requests"] == 0 or stats["p95_ms"] > args.max_p95_ms
+    ]
+    if failures:
+        print(f"❌ p95 au-delà de {args.max_p95_ms} ms pendant le rafraîchissement: {', '.join(failures)}", file=sys.stderr)
+        return 1
+    print(f"✅ p95 sous {args.max_p95_ms} ms pour tous les endpoints pendant le rafraîchissement", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Simulateur local de l'API World Bank, avec enregistrement et rejeu des réponses.
+
+Mode record : relaie chaque requête vers l'API réelle et enregistre la réponse sur disque.
+    python benchmarks/wb_standin.py record --port 8770
+
+Mode replay : sert les réponses enregistrées, sans réseau, avec latence et erreurs injectées.
+    python benchmarks/wb_standin.py replay --port 8770 --latency-ms 300 --jitter-ms 100 --error-rate 0.05
+
+Pour brancher le backend sur le simulateur :
+    WB_API_URL=http://127.0.0.1:8770/v2 uvicorn app.main:app --port 8000
+
+GET /__stats retourne les compteurs du simulateur (requêtes, erreurs injectées, absences
+d'enregistrement, concurrence maximale observée) et POST /__stats/reset les remet à zéro.
+"""
+import argparse
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+DEFAULT_RECORDINGS_DIR = Path(__file__).parent / "recordings"
+DEFAULT_UPSTREAM = "https://api.worldbank.org"
+
+
+def recording_key(path: str, query: str) -> str:
+    """Clé d'enregistrement indépendante de l'ordre des paramètres de requête."""
+    normalized = path + "?" + urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+class StandInState:
+    """Configuration et compteurs partagés entre les threads du serveur"""
+
+    def __init__(self, args):
+        self.mode = args.mode
+        self.recordings_dir = Path(args.recordings_dir)
+        self.upstream = args.upstream.rstrip("/")
+        self.latency = args.latency_ms / 1000
+        self.jitter = args.jitter_ms / 1000
+        self.error_rate = args.error_rate
+        self.error_status = args.error_status
+        self.max_concurrency = args.max_concurrency
+        self.random = random.Random(args.seed)
+        self.lock = threading.Lock()
+        self.session = requests.Session()
+        self.recordings_dir.mkdir(parents=True, exist_ok=True)
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.in_flight = 0
+            self.stats = {
+                "requests": 0,
+                "served": 0,
+                "injected_errors": 0,
+                "throttled": 0,
+                "missing_recordings": 0,
+                "recorded": 0,
+                "max_in_flight": 0,
+            }
+
+    def count(self, key: str, amount: int = 1):
+        with self.lock:
+            self.stats[key] += amount
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server_version = "WorldBankStandIn/1.0"
+    state: StandInState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json;charset=utf-8"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path == "/__stats/reset":
+            self.state.reset()
+            self._send(200, b'{"reset": true}')
+        else:
+            self._send(404, b'{"error": "not found"}')
+
+    def do_GET(self):
+        state = self.state
+        if self.path == "/__stats":
+            with state.lock:
+                self._send(200, json.dumps(state.stats).encode("utf-8"))
+            return
+
+        state.count("requests")
+        with state.lock:
+            throttled = state.max_concurrency and state.in_flight >= state.max_concurrency
+            if not throttled:
+                state.in_flight += 1
+                state.stats["max_in_flight"] = max(state.stats["max_in_flight"], state.in_flight)
+        if throttled:
+            state.count("throttled")
+            self._send(429, b'{"error": "too many concurrent requests"}')
+            return
+
+        try:
+            with state.lock:
+                delay = max(0.0, state.latency + state.random.uniform(-state.jitter, state.jitter))
+                fail = state.random.random() < state.error_rate
+            time.sleep(delay)
+            if fail:
+                state.count("injected_errors")
+                self._send(state.error_status, b'{"error": "injected failure"}')
+                return
+
+            url = urlsplit(self.path)
+            recording_file = state.recordings_dir / f"{recording_key(url.path, url.query)}.json"
+            if state.mode == "record":
+                upstream = state.session.get(f"{state.upstream}{self.path}", timeout=120)
+                recording = {"url": self.path, "status": upstream.status_code, "body": upstream.text}
+                if upstream.status_code == 200:
+                    recording_file.write_text(json.dumps(recording), encoding="utf-8")
+                    state.count("recorded")
+            elif recording_file.exists():
+                recording = json.loads(recording_file.read_text(encoding="utf-8"))
+            else:
+                state.count("missing_recordings")
+                self._send(404, json.dumps({"error": "no recording", "url": self.path}).encode("utf-8"))
+                return
+
+            state.count("served")
+            self._send(recording["status"], recording["body"].encode("utf-8"))
+        except requests.RequestException as e:
+            self._send(502, json.dumps({"error": str(e)}).encode("utf-8"))
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8770)
+    parser.add_argument("--recordings-dir", default=str(DEFAULT_RECORDINGS_DIR))
+    parser.add_argument("--upstream", default=DEFAULT_UPSTREAM, help="API réelle (mode record)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latence ajoutée à chaque réponse")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Variation aléatoire de la latence (±)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Proportion de réponses en erreur (0-1)")
+    parser.add_argument("--error-status", type=int, default=503, help="Code HTTP des erreurs injectées")
+    parser.add_argument("--max-concurrency", type=int, default=0, help="Au-delà, répond 429 (0 = illimité)")
+    parser.add_argument("--seed", type=int, default=None, help="Graine pour des erreurs/latences reproductibles")
+    args = parser.parse_args()
+
+    StandInHandler.state = StandInState(args)
+    server = ThreadingHTTPServer((args.host, args.port), StandInHandler)
+    server.daemon_threads = True
+    print(f"🌍 Simulateur World Bank ({args.mode}) sur http://{args.host}:{args.port}/v2 - enregistrements: {args.recordings_dir}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
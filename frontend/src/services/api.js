@@ -30,6 +30,26 @@ export const fetchFranceHistory = async () => {
   }
 };
 
+export const fetchCountryRisk = async (countryCode) => {
+  try {
+    const response = await apiClient.get(`/api/risk/${countryCode}`);
+    return response.data;
+  } catch (error) {
+    console.error(`Error fetching ${countryCode} risk data:`, error);
+    throw error;
+  }
+};
+
+export const fetchCountryHistory = async (countryCode) => {
+  try {
+    const response = await apiClient.get(`/api/risk/${countryCode}/history`);
+    return response.data;
+  } catch (error) {
+    console.error(`Error fetching ${countryCode} history:`, error);
+    throw error;
+  }
+};
+
 export const fetchSouthAfricaWeekly = async (forceRefresh = false) => {
   try {
     const response = await apiClient.get('/api/geopolitical/south-africa/weekly', {
@@ -66,6 +86,18 @@ export const fetchTableData = async (targetYear = 2025, forceRefresh = false) =>
   }
 };
 
+export const fetchJoinedTableData = async (targetYear = 2025, weekLabel = 'Semaine du 5 Janvier') => {
+  try {
+    const response = await apiClient.get('/api/table/joined', {
+      params: { target_year: targetYear, week_label: weekLabel }
+    });
+    return response.data;
+  } catch (error) {
+    console.error('Error fetching joined table data:', error);
+    throw error;
+  }
+};
+
 export const fetchSimpleRiskData = async () => {
   try {
     const response = await apiClient.get('/api/risk/simple/all-countries');
@@ -87,3 +119,52 @@ export const fetchWeeklyTableData = async (weekLabel = 'Semaine du 5 Janvier') =
     throw error;
   }
 };
+
+export const fetchWeeklyCountryData = async (country, weekLabel = 'Semaine du 5 Janvier') => {
+  try {
+    const response = await apiClient.get(`/api/table/weekly/${encodeURIComponent(country)}`, {
+      params: { week_label: weekLabel }
+    });
+    return response.data;
+  } catch (error) {
+    console.error(`Error fetching weekly data for ${country}:`, error);
+    throw error;
+  }
+};
+
+export const fetchWeeklyBatchData = async (countries, weekLabel = 'Semaine du 5 Janvier') => {
+  try {
+    const response = await apiClient.get('/api/table/weekly/batch', {
+      params: { countries: countries.join(','), week_label: weekLabel }
+    });
+    return response.data;
+  } catch (error) {
+    console.error('Error fetching weekly batch data:', error);
+    throw error;
+  }
+};
+
+export const fetchWeeklyCountryHistory = async (country, weeks = 12, until = null) => {
+  try {
+    const params = { weeks };
+    if (until) params.until = until;
+    const response = await apiClient.get(`/api/table/weekly/${encodeURIComponent(country)}/history`, { params });
+    return response.data;
+  } catch (error) {
+    console.error('Error fetching weekly country history:', error);
+    throw error;
+  }
+};
+
+export const fetchTableDiff = async (table, fromWeek = null, toWeek = null) => {
+  try {
+    const params = {};
+    if (fromWeek) params.from_week = fromWeek;
+    if (toWeek) params.to_week = toWeek;
+    const response = await apiClient.get(`/api/table/diff/${table}`, { params });
+    return response.data;
+  } catch (error) {
+    console.error('Error fetching table diff:', error);
+    throw error;
+  }
+};